@@ -0,0 +1,162 @@
+"""Connect latency and reconnect storms: shared vs. EcoStream session.
+
+Starts a fleet of simulated units (``tests/simulator.py``) on localhost
+and connects to every unit through Home Assistant's shared client
+session and through the integration's own session, built by the hub
+with its mDNS-aware resolver as in production. Reports the time
+from connect to the first frame, one unit at a time, and how long a
+reconnect storm takes, with every unit reconnecting at once after all
+of them dropped their link.
+
+Run from the repository root with the dev requirements installed:
+
+    python -m benchmarks.bench_connect --devices 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+
+from aiohttp import ClientSession
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.components.network import network
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+)
+
+from custom_components.ecostream.hub import async_get_hub
+from tests.simulator import EcostreamSimulator
+
+
+async def _first_frame(session: ClientSession, url: str) -> float:
+    """Seconds from connect until the unit's snapshot arrives."""
+    start = time.perf_counter()
+    async with session.ws_connect(url, heartbeat=None) as ws:
+        await ws.receive()
+        return time.perf_counter() - start
+
+
+async def _connect_latency(
+    session: ClientSession, simulators: list[EcostreamSimulator]
+) -> list[float]:
+    return [
+        await _first_frame(session, simulator.url)
+        for simulator in simulators
+    ]
+
+
+async def _reconnect_storm(
+    session: ClientSession, simulators: list[EcostreamSimulator]
+) -> tuple[float, list[float]]:
+    """Connect every unit, drop all links, reconnect all at once."""
+    links = await asyncio.gather(
+        *(
+            session.ws_connect(simulator.url, heartbeat=None)
+            for simulator in simulators
+        )
+    )
+    for simulator in simulators:
+        await simulator.disconnect_all()
+    for ws in links:
+        await ws.close()
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(
+        *(
+            _first_frame(session, simulator.url)
+            for simulator in simulators
+        )
+    )
+    return time.perf_counter() - start, list(latencies)
+
+
+def _ms(values: list[float], quantile: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * quantile))
+    return ordered[index] * 1000
+
+
+async def _bench(
+    name: str,
+    session: ClientSession,
+    simulators: list[EcostreamSimulator],
+    rounds: int,
+) -> None:
+    latencies: list[float] = []
+    storms: list[float] = []
+    storm_latencies: list[float] = []
+    for _ in range(rounds):
+        latencies += await _connect_latency(session, simulators)
+        total, per_unit = await _reconnect_storm(session, simulators)
+        storms.append(total)
+        storm_latencies += per_unit
+
+    print(
+        f"{name:<10}"
+        f" {_ms(latencies, 0.5):>8.2f} {_ms(latencies, 0.95):>8.2f}"
+        f" {statistics.median(storms) * 1000:>9.1f}"
+        f" {_ms(storm_latencies, 0.95):>9.1f}"
+    )
+
+
+async def _main(count: int, rounds: int) -> None:
+    simulators = [
+        EcostreamSimulator(
+            status_interval=3600, slow_interval=3600, index=i
+        )
+        for i in range(count)
+    ]
+    for simulator in simulators:
+        await simulator.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # Both sessions resolve through zeroconf, which reads the
+        # network integration's adapters
+        await network.async_get_network(hass)
+        hub = async_get_hub(hass)
+        try:
+            print(f"devices: {count}, rounds: {rounds}")
+            print(
+                f"{'session':<10} {'p50 ms':>8} {'p95 ms':>8}"
+                f" {'storm ms':>9} {'p95 ms':>9}"
+            )
+            # Home Assistant closes its own session when it stops
+            await _bench(
+                "shared",
+                async_create_clientsession(hass),
+                simulators,
+                rounds,
+            )
+            await _bench("ecostream", hub.session, simulators, rounds)
+        finally:
+            for simulator in simulators:
+                with contextlib.suppress(Exception):
+                    await simulator.stop()
+            # No unit is registered, so this also closes the resolver
+            await hub.async_close_session()
+            await hass.async_stop(force=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--devices", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_main(args.devices, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Per-device timer and task overhead: legacy model vs. the shared hub.
+
+Simulates a fleet of idle EcoStream units and reports how many asyncio
+tasks and scheduled timer handles the event loop carries for each model,
+plus the cost of one link-check sweep over the whole fleet.
+
+Run from the repository root with the dev requirements installed:
+
+    python -m benchmarks.bench_fleet --devices 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import Any
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ecostream.const import WS_HEARTBEAT_INTERVAL
+from custom_components.ecostream.hub import (
+    RECONNECT_INTERVAL,
+    EcostreamHub,
+)
+
+
+class _SimulatedSocket:
+    """Idle device link: the reader blocks forever, heartbeats are no-ops."""
+
+    def __init__(self) -> None:
+        self._frame: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.heartbeats = 0
+
+    async def receive(self) -> None:
+        await asyncio.shield(self._frame)
+
+    def heartbeat_due(self, now: float) -> bool:
+        return True
+
+    async def async_send_heartbeat(self) -> None:
+        self.heartbeats += 1
+
+    def check_stale(self) -> None:
+        return None
+
+
+class _SimulatedDevice:
+    def __init__(self, index: int) -> None:
+        self.host = f"10.0.{index // 250}.{index % 250 + 1}"
+        self.ws = _SimulatedSocket()
+
+    async def async_reconnect(self) -> None:
+        return None
+
+
+async def _legacy_reader(sock: _SimulatedSocket) -> None:
+    """Old read loop: a receive task plus a heartbeat timeout per wait."""
+    while True:
+        receive_task = asyncio.ensure_future(sock.receive())
+        done, _ = await asyncio.wait(
+            {receive_task}, timeout=WS_HEARTBEAT_INTERVAL
+        )
+        if not done:
+            receive_task.cancel()
+            await sock.async_send_heartbeat()
+
+
+async def _legacy_reconnect_loop() -> None:
+    """Old per-coordinator hourly reconnect task."""
+    while True:
+        await asyncio.sleep(RECONNECT_INTERVAL)
+
+
+async def _hub_reader(sock: _SimulatedSocket) -> None:
+    """New read loop: just waits for frames."""
+    while True:
+        await sock.receive()
+
+
+def _loop_load() -> tuple[int, int]:
+    loop = asyncio.get_running_loop()
+    tasks = len(asyncio.all_tasks()) - 1
+    timers = sum(
+        1
+        for handle in loop._scheduled  # type: ignore[attr-defined]
+        if not handle.cancelled()
+    )
+    return tasks, timers
+
+
+async def _cancel(tasks: list[asyncio.Task[Any]]) -> None:
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+async def _bench_legacy(
+    devices: list[_SimulatedDevice],
+) -> tuple[int, int]:
+    tasks: list[asyncio.Task[Any]] = []
+    for device in devices:
+        tasks.append(asyncio.create_task(_legacy_reader(device.ws)))
+        tasks.append(asyncio.create_task(_legacy_reconnect_loop()))
+    await asyncio.sleep(0)
+    load = _loop_load()
+    await _cancel(tasks)
+    return load
+
+
+async def _bench_hub(
+    hass: HomeAssistant, devices: list[_SimulatedDevice], ticks: int
+) -> tuple[int, int, float]:
+    hub = EcostreamHub(hass)
+    tasks = [
+        asyncio.create_task(_hub_reader(device.ws))
+        for device in devices
+    ]
+    for device in devices:
+        hub.async_register(device)  # type: ignore[arg-type]
+    await asyncio.sleep(0)
+    load = _loop_load()
+
+    registered = list(hub._devices.values())  # pyright: ignore[reportPrivateUsage]
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for device in registered:
+            hub._async_link_check(device)  # pyright: ignore[reportPrivateUsage]
+    tick_us = (time.perf_counter() - start) / ticks * 1e6
+    await hass.async_block_till_done()
+
+    for device in devices:
+        hub.async_unregister(device)  # type: ignore[arg-type]
+    await _cancel(tasks)
+    return (*load, tick_us)
+
+
+async def _main(count: int, ticks: int) -> None:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        devices = [_SimulatedDevice(i) for i in range(count)]
+
+        legacy_tasks, legacy_timers = await _bench_legacy(devices)
+        hub_tasks, hub_timers, tick_us = await _bench_hub(
+            hass, devices, ticks
+        )
+
+        print(f"devices: {count}")
+        print(f"{'model':<8} {'tasks':>7} {'timers':>7}")
+        print(f"{'legacy':<8} {legacy_tasks:>7} {legacy_timers:>7}")
+        print(f"{'hub':<8} {hub_tasks:>7} {hub_timers:>7}")
+        print(f"link-check sweep: {tick_us:.1f} µs for {count} devices")
+
+        await hass.async_stop(force=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--devices", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(_main(args.devices, args.ticks))
+
+
+if __name__ == "__main__":
+    main()
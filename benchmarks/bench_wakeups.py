@@ -0,0 +1,132 @@
+"""Event-loop wake-ups: per-device sleep loops vs. the shared timer wheel.
+
+Every simulated device needs a periodic link check. The legacy model
+runs one ``asyncio.sleep`` loop per device with its own phase, so the
+loop wakes for each device separately. The wheel coalesces all
+deadlines that fall in the same tick into one wake-up.
+
+Time is scaled down (wheel resolution and period in milliseconds) so a
+short run covers many periods. Needs only the standard library:
+
+    python -m benchmarks.bench_wakeups --devices 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+from pathlib import Path
+import random
+import sys
+from typing import Any
+
+# Imported by path so Home Assistant is not needed for this benchmark
+_WHEEL_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "custom_components"
+    / "ecostream"
+    / "timer_wheel.py"
+)
+
+
+def _load_wheel() -> Any:
+    spec = importlib.util.spec_from_file_location(
+        "ecostream_timer_wheel", _WHEEL_PATH
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module.EcostreamTimerWheel
+
+
+class _CountingLoop(asyncio.SelectorEventLoop):
+    """Selector loop that counts iterations which had a timer due."""
+
+    wakeups = 0
+
+    def _run_once(self) -> None:
+        scheduled = self._scheduled  # type: ignore[attr-defined]
+        if scheduled and scheduled[0].when() <= self.time():
+            self.wakeups += 1
+        elif not self._ready:  # type: ignore[attr-defined]
+            # Will block in select() until the next timer is due
+            self.wakeups += 1
+        super()._run_once()  # type: ignore[misc]
+
+
+async def _legacy_device(period: float) -> None:
+    await asyncio.sleep(random.uniform(0, period))
+    while True:
+        await asyncio.sleep(period)
+
+
+async def _run_legacy(
+    count: int, period: float, duration: float
+) -> None:
+    tasks = [
+        asyncio.create_task(_legacy_device(period))
+        for _ in range(count)
+    ]
+    await asyncio.sleep(duration)
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+async def _run_wheel(
+    count: int, period: float, duration: float, resolution: float
+) -> None:
+    wheel = _load_wheel()(
+        asyncio.get_running_loop(), resolution=resolution
+    )
+
+    def link_check() -> None:
+        wheel.call_later(period, link_check)
+
+    for _ in range(count):
+        wheel.call_later(random.uniform(0, period), link_check)
+    await asyncio.sleep(duration)
+    wheel.stop()
+
+
+def _measure(factory: Any) -> int:
+    loop = _CountingLoop()
+    try:
+        loop.run_until_complete(factory())
+        return loop.wakeups
+    finally:
+        loop.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--devices", type=int, default=100)
+    parser.add_argument("--period", type=float, default=0.1)
+    parser.add_argument("--resolution", type=float, default=0.01)
+    parser.add_argument("--duration", type=float, default=2.0)
+    args = parser.parse_args()
+
+    legacy = _measure(
+        lambda: _run_legacy(args.devices, args.period, args.duration)
+    )
+    wheel = _measure(
+        lambda: _run_wheel(
+            args.devices, args.period, args.duration, args.resolution
+        )
+    )
+
+    print(f"devices: {args.devices}, period: {args.period}s")
+    print(f"{'model':<8} {'wakeups/s':>10}")
+    print(f"{'legacy':<8} {legacy / args.duration:>10.0f}")
+    print(f"{'wheel':<8} {wheel / args.duration:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
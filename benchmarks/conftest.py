@@ -0,0 +1,70 @@
+"""Fixtures for the pytest-benchmark suite.
+
+Payloads come from a frame recording in the ``record_frames`` format.
+The bundled ``fixtures/frames.ndjson.gz`` was captured from
+``tests/simulator.py``; point ``ECOSTREAM_BENCH_FRAMES`` at a recording
+from a real unit to benchmark production traffic instead.
+"""
+
+from collections.abc import Generator
+import json
+import os
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.frame_log import read_frames
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+FRAMES_PATH = Path(
+    os.environ.get(
+        "ECOSTREAM_BENCH_FRAMES",
+        Path(__file__).parent / "fixtures" / "frames.ndjson.gz",
+    )
+)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    enable_custom_integrations: None,
+) -> Generator[None]:
+    """Enable custom integrations for all benchmarks."""
+    yield
+
+
+@pytest.fixture(scope="session")
+def raw_frames() -> list[str]:
+    """Raw text frames in recorded order."""
+    return [raw for _, raw in read_frames(FRAMES_PATH)]
+
+
+@pytest.fixture(scope="session")
+def payloads(raw_frames: list[str]) -> list[dict[str, Any]]:
+    """Decoded dict frames in recorded order."""
+    decoded = []
+    for raw in raw_frames:
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            continue
+        if isinstance(payload, dict):
+            decoded.append(payload)
+    return decoded
+
+
+@pytest.fixture(scope="session")
+def merged_state(payloads: list[dict[str, Any]]) -> dict[str, Any]:
+    """Coordinator data after every recorded frame was merged."""
+    state: dict[str, Any] = {}
+    for payload in payloads:
+        for section, values in payload.items():
+            if isinstance(values, dict):
+                state[section] = {**state.get(section, {}), **values}
+            else:
+                state[section] = values
+    return state
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from collections.abc import Coroutine
+from typing import Any
+
+
+def run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Drive a coroutine that completes without suspending.
+
+    pytest-benchmark only times plain callables. The ingest hot paths are
+    coroutines that never actually wait in the benchmarked cases, so they
+    can be stepped once without an event loop round trip.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("Benchmarked coroutine suspended")
@@ -0,0 +1,73 @@
+"""Ingest hot paths: frame decode, payload merge and push decisions."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from homeassistant.core import HomeAssistant
+from itertools import cycle
+from pathlib import Path
+import sys
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.coordinator import (
+    EcostreamDataUpdateCoordinator,
+)
+from custom_components.ecostream.websocket_api import EcostreamWebsocket
+
+from .helpers import run_sync
+
+
+def _make_coordinator() -> EcostreamDataUpdateCoordinator:
+    hass = MagicMock(spec=HomeAssistant)
+    hass.bus = MagicMock()
+    hass.data = {}
+    hass.loop = MagicMock()
+    hass.loop.time.return_value = 0.0
+    return EcostreamDataUpdateCoordinator(
+        hass=hass, host="192.0.2.1", options={}
+    )
+
+
+def test_handle_text_decode(benchmark: Any, raw_frames: list[str]):
+    with patch(
+        "custom_components.ecostream.websocket_api.async_get_clientsession"
+    ):
+        ws = EcostreamWebsocket(
+            hass=MagicMock(),
+            host="192.0.2.1",
+            message_callback=AsyncMock(),
+            clock=lambda: 0.0,
+        )
+    frames = cycle(raw_frames)
+
+    benchmark(lambda: run_sync(ws._handle_text(next(frames))))
+
+
+def test_merge_payload(benchmark: Any, payloads: list[dict[str, Any]]):
+    coordinator = _make_coordinator()
+    frames = cycle(payloads)
+
+    benchmark(lambda: coordinator._merge_payload(next(frames)))
+
+
+def test_handle_ws_message_push_decision(
+    benchmark: Any, payloads: list[dict[str, Any]]
+):
+    coordinator = _make_coordinator()
+    frames: Iterator[dict[str, Any]] = cycle(payloads)
+
+    # The filter state only touches the issue registry when it changes
+    with (
+        patch("custom_components.ecostream.filter_state.ir"),
+        patch.object(coordinator, "async_set_updated_data") as push,
+    ):
+        benchmark(
+            lambda: run_sync(
+                coordinator.handle_ws_message(next(frames))
+            )
+        )
+
+    push.assert_called()
@@ -0,0 +1,66 @@
+"""Frame-to-state-write latency through a fully set up integration."""
+
+from __future__ import annotations
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from itertools import cycle
+from pathlib import Path
+import sys
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.const import DOMAIN
+from custom_components.ecostream.coordinator import (
+    EcostreamDataUpdateCoordinator,
+)
+
+from .helpers import run_sync
+
+
+async def test_frame_to_state_write(
+    hass: HomeAssistant,
+    mock_async_zeroconf: MagicMock,
+    benchmark: Any,
+    raw_frames: list[str],
+):
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_HOST: "192.0.2.1"}, unique_id="bench"
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch("custom_components.ecostream._probe_host", AsyncMock()),
+        patch(
+            "custom_components.ecostream.websocket_api."
+            "EcostreamWebsocket.async_start",
+            AsyncMock(),
+        ),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator: EcostreamDataUpdateCoordinator = entry.runtime_data
+    assert coordinator.ws is not None
+    ws = coordinator.ws
+    frames = cycle(raw_frames)
+
+    def _ingest() -> None:
+        # Bypass the push throttle so every frame reaches the entities
+        coordinator.push_policy.reset()
+        run_sync(ws._handle_text(next(frames)))
+
+    benchmark(_ingest)
+
+    states = hass.states.async_all("sensor")
+    assert any(
+        state.state not in ("unknown", "unavailable")
+        for state in states
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
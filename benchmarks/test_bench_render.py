@@ -0,0 +1,62 @@
+"""Render hot paths: sensor values computed on every state write."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.ecostream.sensor import (
+    SENSOR_DESCRIPTIONS,
+    EcostreamBaseSensor,
+    EcostreamSensorDescription,
+    _calc_efficiency,  # pyright: ignore[reportPrivateUsage]
+)
+
+
+def _make_sensor(
+    description: EcostreamSensorDescription, data: dict[str, Any]
+) -> EcostreamBaseSensor:
+    coordinator = MagicMock()
+    coordinator.data = data
+    coordinator.host = "192.0.2.1"
+    coordinator.statistics = None
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "bench_entry"
+
+    def _mock_coordinator_entity_init(
+        self: CoordinatorEntity[Any], c: Any
+    ) -> None:
+        self.coordinator = c
+
+    with patch.object(
+        CoordinatorEntity, "__init__", _mock_coordinator_entity_init
+    ):
+        return EcostreamBaseSensor(coordinator, entry, description)
+
+
+@pytest.mark.parametrize(
+    "description", SENSOR_DESCRIPTIONS, ids=lambda d: d.key
+)
+def test_sensor_native_value(
+    benchmark: Any,
+    description: EcostreamSensorDescription,
+    merged_state: dict[str, Any],
+):
+    sensor = _make_sensor(description, merged_state)
+
+    benchmark(lambda: sensor.native_value)
+
+
+def test_calc_efficiency(benchmark: Any, merged_state: dict[str, Any]):
+    result = benchmark(_calc_efficiency, merged_state)
+
+    assert result is not None
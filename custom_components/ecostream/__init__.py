@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import (
     async_get as async_get_device_registry,
 )
+from homeassistant.helpers.typing import ConfigType
 import logging
 import time
-from typing import Any
+from typing import Any, cast
 
 from aiohttp import ClientError, WSMsgType
 
@@ -19,7 +22,10 @@ from .const import (
     CONF_ALLOW_OVERRIDE_FILTER_DATE,
     CONF_BOOST_DURATION,
     CONF_FILTER_REPLACEMENT_DAYS,
+    CONF_FULL_CAPTURE,
     CONF_PRESET_OVERRIDE_MINUTES,
+    CONF_RECORD_FRAMES,
+    CONF_RECORDER_LIGHT,
     DEFAULT_BOOST_DURATION_MINUTES,
     DEFAULT_FILTER_REPLACEMENT_DAYS,
     DEFAULT_PRESET_OVERRIDE_MINUTES,
@@ -27,9 +33,23 @@ from .const import (
     PLATFORMS,
 )
 from .coordinator import EcostreamDataUpdateCoordinator
+from .profiler import async_setup_services
+from .websocket_api import WritePriority
 
 _LOGGER = logging.getLogger(__name__)
 
+# HA types the validator with bare dicts
+CONFIG_SCHEMA = cast(
+    Callable[[dict[str, Any]], dict[str, Any]],
+    cv.config_entry_only_config_schema(DOMAIN),  # pyright: ignore[reportUnknownMemberType]
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register integration-wide actions."""
+    async_setup_services(hass)
+    return True
+
 
 async def _probe_host(hass: HomeAssistant, host: str) -> None:
     """Try a single WebSocket receive to verify the device is reachable."""
@@ -153,6 +173,29 @@ async def _async_options_updated(
     )
     coordinator.boost_duration_minutes = boost_duration
 
+    # Push intervals apply from the next frame on
+    coordinator.push_policy.configure(entry.options)
+    coordinator.rate_limiter.configure(entry.options)
+    coordinator.configure_data_age(entry.options)
+    coordinator.set_full_capture(
+        bool(entry.options.get(CONF_FULL_CAPTURE, False))
+    )
+
+    # Recorder-light changes entity state classes and the frame
+    # recorder is attached to the WebSocket client; both need a reload
+    recorder_light = bool(entry.options.get(CONF_RECORDER_LIGHT, False))
+    record_frames = bool(entry.options.get(CONF_RECORD_FRAMES, False))
+    if (
+        recorder_light != coordinator.recorder_light
+        or record_frames != (coordinator.frame_recorder is not None)
+    ):
+        _LOGGER.debug(
+            "EcoStream recorder options changed (recorder_light=%s, record_frames=%s), reloading entry",
+            recorder_light,
+            record_frames,
+        )
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
     # Only update filter date if override is allowed
     allow_override = entry.options.get(
         CONF_ALLOW_OVERRIDE_FILTER_DATE, False
@@ -175,7 +218,8 @@ async def _async_options_updated(
         filter_datetime = int(time.time() + filter_days * 86400)
 
         await coordinator.ws.send_json(
-            {"config": {"filter_datetime": filter_datetime}}
+            {"config": {"filter_datetime": filter_datetime}},
+            priority=WritePriority.HOUSEKEEPING,
         )
         _LOGGER.debug(
             "EcoStream filter_datetime updated: %s days → timestamp %s, boost_duration=%sm",
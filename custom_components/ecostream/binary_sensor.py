@@ -11,12 +11,11 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-import time
 from typing import Any, cast
 
 from .const import DEVICE_MODEL, DEVICE_NAME, DOMAIN
 from .coordinator import EcostreamDataUpdateCoordinator
+from .entity import EcostreamDataEntity
 
 PARALLEL_UPDATES = 0
 
@@ -44,6 +43,8 @@ def _bool_value(
 @dataclass(frozen=True)
 class EcostreamBinarySensorDescription(BinarySensorEntityDescription):
     value_fn: Callable[[Mapping[str, Any]], bool] = lambda _: False
+    # Top-level section value_fn reads, for data age
+    data_section: str = "status"
 
 
 BINARY_SENSOR_DESCRIPTIONS: tuple[
@@ -58,11 +59,13 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[
         key="schedule_enabled",
         name="Schedule Enabled",
         value_fn=_bool_value(["config", "schedule_enabled"], False),
+        data_section="config",
     ),
     EcostreamBinarySensorDescription(
         key="summer_comfort_enabled",
         name="Summer Comfort Enabled",
         value_fn=_bool_value(["config", "sum_com_enabled"], False),
+        data_section="config",
     ),
 )
 
@@ -86,8 +89,8 @@ async def async_setup_entry(
     async_add_entities(entities, update_before_add=True)
 
 
-class EcostreamBaseBinarySensor(
-    CoordinatorEntity[EcostreamDataUpdateCoordinator],
+class EcostreamBaseBinarySensor(  # pyright: ignore[reportIncompatibleVariableOverride]
+    EcostreamDataEntity,
     BinarySensorEntity,
 ):
     """Standard mapped binary sensor values from coordinator data."""
@@ -103,6 +106,7 @@ class EcostreamBaseBinarySensor(
         super().__init__(coordinator)
         self._entry = entry
         self.entity_description = description
+        self._data_section = description.data_section
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_entity_category = description.entity_category
         self._attr_device_info = DeviceInfo(
@@ -123,20 +127,14 @@ class EcostreamBaseBinarySensor(
         except Exception:
             self._attr_is_on = False
 
-    @property
-    def available(self) -> bool:  # type: ignore[override]
-        data = cast(dict[str, Any], self.coordinator.data or {})
-        status = cast(dict[str, Any], data.get("status") or {})
-        return bool(status.get("connect_status", 1) == 1)
-
     @callback
     def _handle_coordinator_update(self) -> None:
         self._refresh_state()
         self.async_write_ha_state()
 
 
-class EcostreamFilterReplacementWarningBinarySensor(
-    CoordinatorEntity[EcostreamDataUpdateCoordinator],
+class EcostreamFilterReplacementWarningBinarySensor(  # pyright: ignore[reportIncompatibleVariableOverride]
+    EcostreamDataEntity,
     BinarySensorEntity,
 ):
     """Filter replacement due warning exposed as binary sensor."""
@@ -144,6 +142,7 @@ class EcostreamFilterReplacementWarningBinarySensor(
     _attr_has_entity_name = True
     _attr_name = "Filter Replacement Warning"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _data_section = "config"
 
     def __init__(
         self,
@@ -164,20 +163,7 @@ class EcostreamFilterReplacementWarningBinarySensor(
         self._refresh_state()
 
     def _refresh_state(self) -> None:
-        data = cast(dict[str, object], self.coordinator.data or {})
-        config = cast(dict[str, object], data.get("config") or {})
-        ts = config.get("filter_datetime")
-
-        if not isinstance(ts, (int, float)) or ts <= 0:
-            self._attr_is_on = False
-        else:
-            self._attr_is_on = time.time() >= float(ts)
-
-    @property
-    def available(self) -> bool:  # type: ignore[override]
-        data = cast(dict[str, object], self.coordinator.data or {})
-        status = cast(dict[str, object], data.get("status") or {})
-        return bool(status.get("connect_status", 1) == 1)
+        self._attr_is_on = self.coordinator.filter_state.overdue
 
     @callback
     def _handle_coordinator_update(self) -> None:
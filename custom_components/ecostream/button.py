@@ -61,6 +61,10 @@ class EcostreamResetFilterButton(  # type: ignore[misc]
             model=DEVICE_MODEL,
         )
 
+    @property
+    def available(self) -> bool:  # type: ignore[override]
+        return self.coordinator.available
+
     async def async_press(self) -> None:
         """Reset the filter replacement date."""
         if not self.coordinator.ws:
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from homeassistant.components.calendar import (
+    CalendarEntity,
+    CalendarEvent,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DEVICE_MODEL, DEVICE_NAME, DOMAIN
+from .coordinator import EcostreamDataUpdateCoordinator
+from .entity import EcostreamDataEntity
+from .schedule import ScheduleTransition
+
+PARALLEL_UPDATES = 0
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the read-only EcoStream schedule calendar."""
+    coordinator: EcostreamDataUpdateCoordinator = entry.runtime_data
+    async_add_entities([EcostreamScheduleCalendar(coordinator, entry)])
+
+
+def _event(
+    start: datetime, end: datetime, transition: ScheduleTransition
+) -> CalendarEvent:
+    return CalendarEvent(
+        start=start,
+        end=end,
+        summary=f"Ventilation {transition.value}",
+        description=f"Schedule entry {transition.index} ({transition.label})",
+    )
+
+
+class EcostreamScheduleCalendar(  # pyright: ignore[reportIncompatibleVariableOverride]
+    EcostreamDataEntity,
+    CalendarEntity,
+):
+    """Device schedule exposed as a read-only calendar."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "schedule"
+    _attr_icon = "mdi:calendar-clock"
+    _data_section = "config"
+
+    def __init__(
+        self,
+        coordinator: EcostreamDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_schedule_calendar"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.host)},
+            manufacturer="BUVA",
+            name=DEVICE_NAME,
+            model=DEVICE_MODEL,
+        )
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Schedule entry currently in effect."""
+        now = dt_util.now()
+        periods = self.coordinator.schedule.iter_periods(
+            now, now + timedelta(seconds=1)
+        )
+        for start, end, transition in periods:
+            if start <= now < end:
+                return _event(start, end, transition)
+        return None
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        schedule = self.coordinator.schedule
+        return [
+            _event(start, end, transition)
+            for start, end, transition in schedule.iter_periods(
+                dt_util.as_local(start_date), dt_util.as_local(end_date)
+            )
+        ]
@@ -9,6 +9,7 @@ from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
 from homeassistant.helpers.service_info.zeroconf import (
     ZeroconfServiceInfo,
 )
+from homeassistant.util.network import is_ip_address
 import json
 import logging
 from typing import Any, cast
@@ -116,6 +117,8 @@ class EcostreamConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovered_name = system_name
 
         await self.async_set_unique_id(system_name)
+        if self._async_pin_discovered_address(host):
+            return self.async_abort(reason="already_configured")
         self._abort_if_unique_id_configured(updates={CONF_HOST: host})
 
         return await self.async_step_confirm()
@@ -146,6 +149,8 @@ class EcostreamConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovered_name = system_name
 
         await self.async_set_unique_id(system_name)
+        if self._async_pin_discovered_address(host):
+            return self.async_abort(reason="already_configured")
         self._abort_if_unique_id_configured(updates={CONF_HOST: host})
 
         return await self.async_step_confirm()
@@ -239,6 +244,33 @@ class EcostreamConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    # ======================================================================
+    # HELPER: Discovered address of a hostname entry
+    # ======================================================================
+    @callback
+    def _async_pin_discovered_address(self, address: str) -> bool:
+        """Feed discovery to an entry configured by hostname.
+
+        Such entries keep their hostname instead of being rewritten to
+        the discovered IP and reloaded; the running coordinator pins
+        the address so its next reconnect skips the lookup.
+        """
+        if self.unique_id is None:
+            return False
+        entry = (
+            self.hass.config_entries.async_entry_for_domain_unique_id(
+                DOMAIN, self.unique_id
+            )
+        )
+        if entry is None:
+            return False
+        host = str(entry.data.get(CONF_HOST) or "")
+        if not host or is_ip_address(host):
+            return False
+        if entry.state is config_entries.ConfigEntryState.LOADED:
+            entry.runtime_data.resolver.update(address)
+        return True
+
     # ======================================================================
     # HELPER: Probe device
     # ======================================================================
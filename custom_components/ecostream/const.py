@@ -9,6 +9,7 @@ DOMAIN = "ecostream"
 PLATFORMS: list[str] = [
     "button",
     "binary_sensor",
+    "calendar",
     "sensor",
     "fan",
     "select",
@@ -35,10 +36,40 @@ CONF_PRESET_OVERRIDE_MINUTES = "preset_override_minutes"
 CONF_BOOST_DURATION = "boost_duration"
 CONF_ALLOW_OVERRIDE_FILTER_DATE = "allow_override_filter_date"
 CONF_SUMMER_COMFORT_TEMP = "summer_comfort_temp"
-
-# Default push intervals (seconds)
-FAST_MODE_SECONDS = 5
-SLOW_PUSH_INTERVAL = 10
+CONF_RECORDER_LIGHT = "recorder_light"
+CONF_RECORD_FRAMES = "record_frames"
+CONF_FULL_CAPTURE = "full_capture"
+
+# Push policy options; per-group keys are the prefix plus the group
+CONF_PUSH_INTERVAL_PREFIX = "push_interval_"
+CONF_FAST_PUSH_INTERVAL_PREFIX = "fast_push_interval_"
+CONF_FAST_WINDOW_SECONDS = "fast_window_seconds"
+CONF_IGNORE_PREFIX = "ignore_"
+CONF_PUSH_POLICY_SECTION = "push_policy"
+
+# Command rate limit options (token bucket per device)
+CONF_COMMAND_BURST = "command_burst"
+CONF_COMMAND_RATE = "command_rate_per_minute"
+CONF_COMMAND_LIMIT_SECTION = "command_limit"
+
+# Recorder-light mode: high-frequency sensors write their state at most
+# once per interval; full-resolution samples go to hourly statistics.
+RECORDER_LIGHT_WRITE_INTERVAL = 300
+
+# Frame recorder: raw frames are batched and appended by the executor
+FRAME_LOG_FLUSH_SECONDS = 5
+FRAME_LOG_MAX_BUFFER = 500
+# Once the recording reaches this size it is rotated to ``<path>.1``
+FRAME_LOG_MAX_BYTES = 20 * 1024 * 1024
+
+# Pipeline latency histograms cover the last one to two windows
+METRICS_WINDOW_SECONDS = 300
+METRICS_LAG_SAMPLE_SECONDS = 1
+
+# ecostream.profile action: capture window and text summary length
+PROFILE_DEFAULT_SECONDS = 60
+PROFILE_MAX_SECONDS = 3600
+PROFILE_SUMMARY_LINES = 60
 
 # Fan presets
 PRESET_LOW = "low"
@@ -51,6 +82,36 @@ WS_HEARTBEAT_INTERVAL = 10
 WS_STALE_TIMEOUT = 30
 WS_RECONNECT_INITIAL_DELAY = 10
 WS_RECONNECT_MAX_DELAY = 60
+# Longest a caller waits for its command to be written; a command held
+# back by the rate limit stays queued and is sent later
+WS_SEND_TIMEOUT = 5
+
+# Connector shared by every unit's WebSocket. One link per unit, plus
+# room for the next one while an hourly reconnect closes the old
+WS_CONNECT_TIMEOUT = 10
+WS_CONNECTOR_LIMIT_PER_HOST = 2
+# TCP keepalive finds a dead link the unit never closed; probes start
+# after the stale timeout so the WebSocket heartbeat normally wins
+WS_KEEPALIVE_IDLE = WS_STALE_TIMEOUT
+WS_KEEPALIVE_INTERVAL = WS_HEARTBEAT_INTERVAL
+WS_KEEPALIVE_COUNT = 3
+
+# A resolved host name is reused this long; a failed connect re-resolves
+# it sooner, and discovery updates replace it at any time
+RESOLVER_TTL_SECONDS = 24 * 60 * 60
+
+# Per-device heartbeat / stale check period on the shared timer wheel
+HUB_LINK_CHECK_SECONDS = WS_HEARTBEAT_INTERVAL / 2
+
+# Entities stay available this long after the last frame
+AVAILABILITY_GRACE_SECONDS = 90
+
+# Override countdown: reported remainders within this many seconds of
+# the local extrapolation do not move the end time
+OVERRIDE_DRIFT_TOLERANCE_SECONDS = 5
+# Reports are ignored this long after an override is sent, until the
+# device has applied it
+OVERRIDE_CONFIRM_SECONDS = 5
 
 # Device info
 DEVICE_NAME = "EcoStream"
@@ -60,16 +121,64 @@ DEVICE_MODEL = "EcoStream"
 # Push key groups
 # ---------------------------------------------------------
 
-FAST_KEYS = {
+# Top-level keys of a device frame, each throttled on its own
+PUSH_GROUPS = (
     "status",
     "ext_module",
-}
-
-SLOW_KEYS = {
     "config",
     "system",
     "comm_wifi",
     "comm_bt",
     "error",
     "debug",
+)
+
+# Groups no entity needs; they can be left out of pushes entirely
+PUSH_IGNORABLE_GROUPS = ("comm_bt", "debug")
+
+# Top-level sections read by entities, presets, the schedule and the
+# filter tracker. Everything else is dropped at ingest unless full
+# capture is enabled for diagnostics.
+INGEST_SECTIONS = frozenset({"status", "config", "system", "comm_wifi"})
+
+# Minimum seconds between entity pushes triggered by a group
+DEFAULT_PUSH_INTERVALS: dict[str, float] = dict.fromkeys(
+    PUSH_GROUPS, 10
+)
+
+# Shorter intervals right after a control action, so the UI follows
+# the device's response quickly
+DEFAULT_FAST_PUSH_INTERVALS: dict[str, float] = {
+    **DEFAULT_PUSH_INTERVALS,
+    "status": 5,
+    "ext_module": 5,
+}
+DEFAULT_FAST_WINDOW_SECONDS = 5
+
+# Commands sent while the WebSocket is down are queued and replayed on
+# reconnect, unless they are older than this
+OUTBOUND_COMMAND_TTL_SECONDS = 120
+# Oldest queued commands are dropped beyond this depth
+OUTBOUND_QUEUE_MAX_COMMANDS = 20
+
+# Commands written to one unit: up to this many back to back, then
+# refilled at the sustained rate so the controller is not flooded
+DEFAULT_COMMAND_BURST = 5
+DEFAULT_COMMAND_RATE_PER_MINUTE = 12
+
+# Data age options; per-section keys are the prefix plus the section
+CONF_MAX_AGE_PREFIX = "max_age_"
+CONF_STALE_AS_ATTRIBUTE = "stale_as_attribute"
+CONF_DATA_AGE_SECTION = "data_age"
+
+# Entities reading a section older than its max age turn unavailable,
+# or keep their state and are flagged stale. 0 disables the check:
+# a silent status stream already trips the coordinator's availability
+# grace timer, the other sections are only sent on connect and when a
+# value changes.
+DEFAULT_MAX_AGES: dict[str, float] = {
+    "status": 0,
+    "config": 0,
+    "system": 0,
+    "comm_wifi": 0,
 }
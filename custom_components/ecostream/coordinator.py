@@ -1,37 +1,42 @@
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Mapping
-from homeassistant.const import (
-    EVENT_HOMEASSISTANT_STARTED,
-    EVENT_HOMEASSISTANT_STOP,
-)
-from homeassistant.core import Event, HomeAssistant
-from homeassistant.helpers import issue_registry as ir
-from homeassistant.helpers.issue_registry import IssueSeverity
+from functools import partial
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 import logging
-import random
-import time
 from typing import Any, cast
 
 from .const import (
-    DOMAIN,
-    FAST_KEYS,
-    FAST_MODE_SECONDS,
-    SLOW_KEYS,
-    SLOW_PUSH_INTERVAL,
+    AVAILABILITY_GRACE_SECONDS,
+    CONF_FULL_CAPTURE,
+    CONF_RECORD_FRAMES,
+    CONF_RECORDER_LIGHT,
+    INGEST_SECTIONS,
 )
-from .websocket_api import EcostreamWebsocket
+from .data_age import EcostreamDataAge
+from .filter_state import EcostreamFilterState
+from .frame_log import EcostreamFrameRecorder, frame_log_path
+from .hub import async_get_hub
+from .metrics import EcostreamMetrics
+from .outbound import EcostreamOutboundQueue
+from .override_state import EcostreamOverrideState
+from .presets import EcostreamPresetResolver
+from .profiler import EcostreamProfiler
+from .push_policy import EcostreamPushPolicy
+from .rate_limit import EcostreamTokenBucket
+from .resolver import EcostreamHostResolver
+from .schedule import EcostreamSchedule, schedule_fields
+from .statistics import EcostreamStatistics
+from .telemetry import EcostreamConnectionTelemetry
+from .timer_wheel import WheelTimer
+from .websocket_api import EcostreamWebsocket, WritePriority
 
 _LOGGER = logging.getLogger(__name__)
 
-RECONNECT_INTERVAL = 3600
-RECONNECT_JITTER = 300
-RECONNECT_MIN_SLEEP = 60
-
 
 class EcostreamDataUpdateCoordinator(
     DataUpdateCoordinator[Mapping[str, Any]]
@@ -61,25 +66,90 @@ class EcostreamDataUpdateCoordinator(
         self.host = host
         self.options = dict(options or {})
 
-        self._push_interval: float = float(SLOW_PUSH_INTERVAL)
-        self._fast_push_interval: int = int(FAST_MODE_SECONDS)
+        # Per key group push throttling, reconfigured on option changes
+        self.push_policy = EcostreamPushPolicy(self.options)
 
-        self._last_push: float = 0.0
-        self._last_slow_push: float = 0.0
-        self._fast_mode_until: float = 0.0
-
-        self._last_slow_snapshot: dict[str, Any] = {}
         self.data: Mapping[str, Any] = {}
 
+        # Keep every section the device sends (diagnostics only)
+        self.full_capture: bool = bool(
+            self.options.get(CONF_FULL_CAPTURE, False)
+        )
+
         self.ws: EcostreamWebsocket | None = None
 
-        self._reconnect_task: asyncio.Task[None] | None = None
+        # Shared availability for all platforms, recomputed per frame
+        self.available: bool = False
+        self._last_frame_ts: float | None = None
+        self._availability_timer: WheelTimer | None = None
+
+        self.filter_state = EcostreamFilterState(
+            hass, self.async_update_listeners
+        )
+
+        self._schedule = EcostreamSchedule()
+        self._schedule_fields: tuple[tuple[str, Any], ...] = ()
+        self._presets = EcostreamPresetResolver()
+
+        self.recorder_light: bool = bool(
+            self.options.get(CONF_RECORDER_LIGHT, False)
+        )
+        self.statistics: EcostreamStatistics | None = (
+            EcostreamStatistics(hass, host)
+            if self.recorder_light
+            else None
+        )
+
+        # Always-on hot-path latency histograms (diagnostics / sensors)
+        self.metrics = EcostreamMetrics()
+
+        # Set by the ecostream.profile action while a capture runs
+        self.profiler: EcostreamProfiler | None = None
+
+        # Heartbeats, stale checks and hourly reconnects run on the
+        # shared hub timer instead of per-device tasks
+        self.hub = async_get_hub(hass)
         self._started: bool = False
         self._stopping: bool = False
 
+        # Opt-in raw frame capture for incident replay
+        self.frame_recorder: EcostreamFrameRecorder | None = (
+            EcostreamFrameRecorder(
+                hass, frame_log_path(hass, host), self.hub.clock
+            )
+            if self.options.get(CONF_RECORD_FRAMES, False)
+            else None
+        )
+
+        # Commands sent while the WebSocket is down, replayed on
+        # reconnect; kept here so they survive a restart of the client
+        self.outbound = EcostreamOutboundQueue(self.hub.clock)
+
+        # Connection counters, kept across WebSocket client restarts
+        self.telemetry = EcostreamConnectionTelemetry(self.hub.clock)
+
+        # Last good address of the unit, so reconnects skip mDNS
+        self.resolver = EcostreamHostResolver(
+            hass, self.host, self.hub.clock
+        )
+
+        # Protects the unit's controller from bursts of commands
+        self.rate_limiter = EcostreamTokenBucket(
+            self.hub.clock, self.options
+        )
+
+        # Age of each data section; one wheel timer re-checks it at
+        # the next deadline instead of entities polling
+        self.data_age = EcostreamDataAge(self.hub.clock, self.options)
+        self._data_age_timer: WheelTimer | None = None
+        self._data_age_deadline: float = 0.0
+
+        # Local countdown of the running boost / preset override
+        self.override = EcostreamOverrideState(self.hub.clock)
+        self._override_timer: WheelTimer | None = None
+
         self.boost_duration_minutes: int = 0
         self.boost_remaining_seconds: int = 0
-        self._last_override_active: bool = False
         self._restore_schedule_after_override: bool = False
 
     # ==========================================================
@@ -95,12 +165,10 @@ class EcostreamDataUpdateCoordinator(
         self._stopping = False
 
         await self._ensure_ws_started()
+        self.hub.async_register(self)
 
-        # Ensure background tasks only start once HA is fully running
-        self.hass.bus.async_listen_once(
-            EVENT_HOMEASSISTANT_STARTED,
-            self._async_start_background_tasks,
-        )
+        if self.statistics is not None:
+            await self.statistics.async_start()
 
         # Ensure clean shutdown
         self.hass.bus.async_listen_once(
@@ -111,67 +179,39 @@ class EcostreamDataUpdateCoordinator(
     async def async_stop(self) -> None:
         """Stop everything cleanly."""
         self._stopping = True
+        self.hub.async_unregister(self)
 
-        if self._reconnect_task:
-            self._reconnect_task.cancel()
-            try:
-                await self._reconnect_task
-            except asyncio.CancelledError:
-                pass
-            self._reconnect_task = None
-
-        if self.ws:
-            await self.ws.async_disconnect()
-            self.ws = None
-
-    async def _async_handle_hass_stop(self, event: Event) -> None:
-        """Handle HA shutdown."""
-        await self.async_stop()
+        self.filter_state.async_stop()
 
-    # ==========================================================
-    # Background Tasks (SAFE)
-    # ==========================================================
-
-    async def _async_start_background_tasks(self, event: Event) -> None:
-        """Start reconnect loop safely inside HA event loop."""
-        if self._reconnect_task:
-            return
+        if self._availability_timer is not None:
+            self._availability_timer.cancel()
+            self._availability_timer = None
+        self.available = False
 
-        _LOGGER.debug("Starting EcoStream reconnect loop")
+        if self._data_age_timer is not None:
+            self._data_age_timer.cancel()
+            self._data_age_timer = None
 
-        self._reconnect_task = asyncio.create_task(
-            self._async_reconnect_loop(),
-            name="ecostream_ws_hourly_reconnect",
-        )
-
-    async def _async_reconnect_loop(self) -> None:
-        """Reconnect hourly with jitter."""
-        try:
-            while not self._stopping:
-                jitter = random.uniform(
-                    -RECONNECT_JITTER, RECONNECT_JITTER
-                )
-                sleep_s = max(
-                    RECONNECT_MIN_SLEEP, RECONNECT_INTERVAL + jitter
-                )
+        if self._override_timer is not None:
+            self._override_timer.cancel()
+            self._override_timer = None
 
-                await asyncio.sleep(sleep_s)
+        if self.statistics is not None:
+            await self.statistics.async_stop()
 
-                if self._stopping:
-                    return
+        if self.ws:
+            await self.ws.async_disconnect()
+            self.ws = None
 
-                _LOGGER.debug(
-                    "Scheduled EcoStream reconnect (sleep=%.0fs)",
-                    sleep_s,
-                )
+        if self.frame_recorder is not None:
+            await self.frame_recorder.async_stop()
 
-                await self._force_ws_reconnect()
+        # The last unit to stop closes the shared connector
+        await self.hub.async_close_session()
 
-        except asyncio.CancelledError:
-            _LOGGER.debug("Reconnect loop cancelled")
-            raise
-        except Exception:
-            _LOGGER.exception("Reconnect loop crashed")
+    async def _async_handle_hass_stop(self, event: Event) -> None:
+        """Handle HA shutdown."""
+        await self.async_stop()
 
     # ==========================================================
     # WebSocket Handling
@@ -184,13 +224,25 @@ class EcostreamDataUpdateCoordinator(
                 hass=self.hass,
                 host=self.host,
                 message_callback=self.handle_ws_message,
+                frame_recorder=(
+                    self.frame_recorder.record
+                    if self.frame_recorder is not None
+                    else None
+                ),
+                metrics=self.metrics,
+                clock=self.hub.clock,
+                outbound=self.outbound,
+                limiter=self.rate_limiter,
+                telemetry=self.telemetry,
+                resolver=self.resolver,
+                session=self.hub.session,
             )
 
         await self.ws.async_start()
         _LOGGER.info("EcoStream WebSocket started for %s", self.host)
 
-    async def _force_ws_reconnect(self) -> None:
-        """Force clean reconnect."""
+    async def async_reconnect(self) -> None:
+        """Force clean reconnect (scheduled hourly by the hub)."""
         if self.ws is None:
             await self._ensure_ws_started()
             return
@@ -200,17 +252,33 @@ class EcostreamDataUpdateCoordinator(
         await self.ws.async_disconnect()
         await self.ws.async_start()
 
-        self._last_push = 0.0
+        self.push_policy.reset()
+
+    @property
+    def ws_state(self) -> str:
+        return self.telemetry.state
+
+    @property
+    def ws_reconnects(self) -> int:
+        return self.telemetry.reconnects
+
+    @property
+    def last_payload(self) -> str | None:
+        """Start of the last raw frame, for diagnostics."""
+        return self.telemetry.last_frame_preview()
 
     # ==========================================================
     # Fast Mode
     # ==========================================================
 
     def mark_control_action(self) -> None:
-        self._fast_mode_until = time.time() + FAST_MODE_SECONDS
+        self.push_policy.start_fast_window(self.hub.clock())
 
     async def async_send_config(
-        self, cfg: dict[str, Any], action: str
+        self,
+        cfg: dict[str, Any],
+        action: str,
+        priority: WritePriority = WritePriority.USER,
     ) -> bool:
         if not self.ws:
             _LOGGER.error(
@@ -219,23 +287,39 @@ class EcostreamDataUpdateCoordinator(
             )
             return False
 
-        self.mark_control_action()
-        await self.ws.send_json({"config": cfg})
+        sent = await self.ws.send_json(
+            {"config": cfg},
+            priority=priority,
+            on_sent=partial(self._config_sent, cfg, action),
+        )
+        if not sent:
+            _LOGGER.debug(
+                "EcoStream %s command for %s queued; tracked once sent",
+                action,
+                self.host,
+            )
+        return True
+
+    @callback
+    def _config_sent(self, cfg: dict[str, Any], action: str) -> None:
+        """Track a command once it reached the unit.
 
+        A command queued while offline or throttled may expire or be
+        superseded, so the fast window and the override countdown
+        start only when it is written.
+        """
+        self.mark_control_action()
         override_seconds = self._parse_override_seconds(
             cfg.get("man_override_set_time")
         )
         if override_seconds is not None:
-            if override_seconds > 0:
-                self._last_override_active = True
-                self._restore_schedule_after_override = (
-                    action.startswith("preset")
-                )
-            else:
-                self._last_override_active = False
-                self._restore_schedule_after_override = False
-
-        return True
+            # A preset override re-enables the schedule when it ends
+            self._restore_schedule_after_override = (
+                override_seconds > 0 and action.startswith("preset")
+            )
+            if self.override.start(override_seconds):
+                self._arm_override_timer()
+                self.async_update_listeners()
 
     @staticmethod
     def _parse_override_seconds(value: Any) -> int | None:
@@ -260,13 +344,24 @@ class EcostreamDataUpdateCoordinator(
         if not self._restore_schedule_after_override:
             return
 
+        if self.override.active:
+            # Extended on the device meanwhile; wait for the new end
+            return
+
+        if self._parse_override_seconds(
+            self._status_payload().get("override_set_time_left")
+        ):
+            # The local deadline passed but the device has not reported
+            # the override as ended yet; retried on its next frame
+            return
+
         config = self._config_payload()
         if bool(config.get("schedule_enabled", False)):
             self._restore_schedule_after_override = False
             return
 
         # Check if a schedule actually exists before enabling it
-        if not self._has_valid_schedule(config):
+        if not self.schedule.is_valid:
             _LOGGER.warning(
                 "Preset override expired, but no schedule configured. "
                 "EcoStream will remain in last state. Configure a schedule "
@@ -278,6 +373,7 @@ class EcostreamDataUpdateCoordinator(
         ok = await self.async_send_config(
             {"schedule_enabled": True},
             "schedule restore after preset",
+            WritePriority.AUTOMATION,
         )
         if ok:
             _LOGGER.debug(
@@ -285,111 +381,208 @@ class EcostreamDataUpdateCoordinator(
             )
             self._restore_schedule_after_override = False
 
-    def _has_valid_schedule(self, config: dict[str, Any]) -> bool:
-        """Check if EcoStream has a valid schedule configuration.
+    @property
+    def schedule(self) -> EcostreamSchedule:
+        """Parsed schedule, rebuilt only when a schedule entry changes.
 
-        The EcoStream stores schedule in various fields like schedule_0_time,
-        schedule_0_value, etc. If none exist, there's no schedule to enable.
+        Every config frame replaces the config dict, so the cache is
+        keyed on the raw ``schedule_*`` values rather than the dict.
         """
-        # Check for any schedule_X_time or schedule_X_value fields
-        schedule_keys = [
-            k
-            for k in config.keys()
-            if k.startswith("schedule_")
-            and ("_time" in k or "_value" in k)
-        ]
-
-        if not schedule_keys:
-            return False
-
-        # Verify at least one schedule entry has both time and value
-        for i in range(10):  # Most likely max 7-10 schedule items
-            time_key = f"schedule_{i}_time"
-            value_key = f"schedule_{i}_value"
-            if time_key in config and value_key in config:
-                # At least one valid schedule entry exists
-                return True
-
-        return False
+        config = self._config_payload()
+        fields = schedule_fields(config)
+        if fields != self._schedule_fields:
+            self._schedule_fields = fields
+            self._schedule = EcostreamSchedule.from_config(config)
+        return self._schedule
+
+    @property
+    def presets(self) -> EcostreamPresetResolver:
+        """Preset resolver, refreshed from the current payload."""
+        self._presets.update(
+            self._config_payload(), self._status_payload()
+        )
+        return self._presets
 
     # ==========================================================
     # Message Handling
     # ==========================================================
 
     async def handle_ws_message(self, message: Any) -> None:
+        profiler = self.profiler
+        if profiler is None:
+            await self._async_handle_ws_message(message)
+        else:
+            await profiler.wrap(self._async_handle_ws_message(message))
+
+    async def _async_handle_ws_message(self, message: Any) -> None:
         if not isinstance(message, dict):
             return
-        self._merge_payload(cast(dict[str, Any], message))
+        message = self._filter_payload(cast(dict[str, Any], message))
+        self._merge_payload(message)
 
-        status = self._status_payload()
-        override_seconds = self._parse_override_seconds(
-            status.get("override_set_time_left")
-        )
-        override_active = (
-            override_seconds is not None and override_seconds > 0
-        )
-        if self._last_override_active and not override_active:
-            await self._maybe_restore_schedule_after_override()
-        self._last_override_active = override_active
+        now = self.hub.clock()
+        self._last_frame_ts = now
+        availability_changed = self._refresh_availability(now)
 
-        now = time.time()
+        self.data_age.touch(message, now)
+        data_age_changed = self.data_age.refresh(now)
+        self._arm_data_age_timer()
 
-        has_fast = any(k in message for k in FAST_KEYS)
-        has_slow = any(k in message for k in SLOW_KEYS)
+        incoming_config = message.get("config")
+        if (
+            isinstance(incoming_config, dict)
+            and "filter_datetime" in incoming_config
+        ):
+            self._update_filter_issue()
+
+        override_changed = False
+        incoming_status = message.get("status")
+        if (
+            isinstance(incoming_status, dict)
+            and "override_set_time_left" in incoming_status
+        ):
+            override_changed = self.override.sync(
+                self._parse_override_seconds(
+                    incoming_status["override_set_time_left"]
+                )
+            )
+            if override_changed:
+                self._arm_override_timer()
+            if (
+                self._restore_schedule_after_override
+                and not self.override.active
+            ):
+                # Cleared on the device, or confirmed after the local
+                # deadline already passed
+                self._start_schedule_restore()
+
+        push_due = self.push_policy.due(message, now)
+        if not (
+            push_due
+            or availability_changed
+            or data_age_changed
+            or override_changed
+        ):
+            return
+
+        self.push_policy.mark_pushed(now)
+        self.async_set_updated_data(dict(self.data))
+
+    def _refresh_availability(self, now: float) -> bool:
+        """Recompute ``available``; returns True when it changed.
 
-        in_fast = now < self._fast_mode_until
-        interval = (
-            self._fast_push_interval if in_fast else self._push_interval
+        A dropped socket is covered by the grace period so the hourly
+        reconnect does not flap every entity; a stopped connection or a
+        device reporting ``connect_status != 1`` is unavailable at once.
+        """
+        deadline = (
+            self._last_frame_ts + AVAILABILITY_GRACE_SECONDS
+            if self._last_frame_ts is not None
+            else 0.0
+        )
+        available = (
+            not self._stopping
+            and now < deadline
+            and self._status_payload().get("connect_status", 1) == 1
         )
 
-        should_push = False
+        if available and self._availability_timer is None:
+            self._availability_timer = self.hub.wheel.call_later(
+                deadline - now, self._async_availability_timer
+            )
 
-        if self._last_push == 0:
-            should_push = True
-        elif has_fast and (now - self._last_push >= interval):
-            should_push = True
-        elif has_slow and (
-            now - self._last_slow_push >= self._push_interval
-        ):
-            should_push = True
+        changed = available != self.available
+        self.available = available
+        return changed
 
-        if not should_push:
+    @callback
+    def async_update_listeners(self) -> None:
+        """Dispatch to entities, inside the profiler when one runs."""
+        profiler = self.profiler
+        if profiler is None:
+            super().async_update_listeners()
             return
+        with profiler.capture():
+            super().async_update_listeners()
+
+    @callback
+    def _async_availability_timer(self) -> None:
+        """Re-check staleness once the last frame's grace period ends."""
+        self._availability_timer = None
+        if self._refresh_availability(self.hub.clock()):
+            self.async_update_listeners()
+
+    def configure_data_age(self, options: Mapping[str, Any]) -> None:
+        """Apply changed max ages and stale handling to entities."""
+        if self.data_age.configure(options):
+            self.async_update_listeners()
+        self._arm_data_age_timer()
+
+    def _arm_data_age_timer(self) -> None:
+        """Wake up when the next fresh section goes stale.
+
+        Kept armed for the earliest deadline only; it is moved when a
+        section with a shorter max age becomes fresh again.
+        """
+        deadline = self.data_age.next_deadline()
+        timer = self._data_age_timer
+        if timer is not None:
+            if (
+                deadline is not None
+                and deadline >= self._data_age_deadline
+            ):
+                return
+            timer.cancel()
+            self._data_age_timer = None
+        if deadline is None or self._stopping:
+            return
+        self._data_age_deadline = deadline
+        self._data_age_timer = self.hub.wheel.call_at(
+            deadline, self._async_data_age_timer
+        )
 
-        self._last_push = now
-
-        if has_slow:
-            self._last_slow_push = now
-            self._last_slow_snapshot = {
-                k: self.data.get(k) for k in SLOW_KEYS if k in self.data
-            }
+    @callback
+    def _async_data_age_timer(self) -> None:
+        """Re-check data age once the earliest deadline has passed."""
+        self._data_age_timer = None
+        if self.data_age.refresh(self.hub.clock()):
+            self.async_update_listeners()
+        self._arm_data_age_timer()
+
+    def _arm_override_timer(self) -> None:
+        """Re-arm the wake-up for the end of the current override."""
+        if self._override_timer is not None:
+            self._override_timer.cancel()
+            self._override_timer = None
+        ends_at = self.override.ends_at
+        if ends_at is not None:
+            self._override_timer = self.hub.wheel.call_at(
+                ends_at, self._async_override_timer
+            )
 
-        self.async_set_updated_data(dict(self.data))
-        self._update_filter_issue()
+    @callback
+    def _async_override_timer(self) -> None:
+        """End the override locally, without waiting for a frame."""
+        self._override_timer = None
+        if not self.override.expire():
+            return
+        self.async_update_listeners()
+        if self._restore_schedule_after_override:
+            self._start_schedule_restore()
+
+    @callback
+    def _start_schedule_restore(self) -> None:
+        """Restore the schedule in a task, off the frame handling path."""
+        self.hass.async_create_task(
+            self._maybe_restore_schedule_after_override(),
+            f"ecostream_schedule_restore_{self.host}",
+        )
 
     def _update_filter_issue(self) -> None:
-        import time
-
-        config = self.data.get("config", {})
-        filter_ts = config.get("filter_datetime")
-        filter_warning = (
-            isinstance(filter_ts, (int, float))
-            and filter_ts > 0
-            and time.time() >= float(filter_ts)
+        """Feed the reported filter date into the cached filter state."""
+        self.filter_state.async_update(
+            self._config_payload().get("filter_datetime")
         )
-        if filter_warning:
-            ir.async_create_issue(
-                self.hass,
-                DOMAIN,
-                "filter_replacement_overdue",
-                is_fixable=False,
-                severity=IssueSeverity.WARNING,
-                translation_key="filter_replacement_overdue",
-            )
-        else:
-            ir.async_delete_issue(
-                self.hass, DOMAIN, "filter_replacement_overdue"
-            )
 
     # ==========================================================
     # Fallback
@@ -402,6 +595,24 @@ class EcostreamDataUpdateCoordinator(
     # Merge helper
     # ==========================================================
 
+    def set_full_capture(self, enabled: bool) -> None:
+        """Toggle full capture; turning it off drops unused sections."""
+        self.full_capture = enabled
+        if not enabled:
+            self.data = self._filter_payload(dict(self.data))
+
+    def _filter_payload(
+        self, incoming: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Drop top-level sections nothing reads, before the merge."""
+        if self.full_capture or incoming.keys() <= INGEST_SECTIONS:
+            return incoming
+        return {
+            key: value
+            for key, value in incoming.items()
+            if key in INGEST_SECTIONS
+        }
+
     def _merge_payload(self, incoming: dict[str, Any]) -> None:
         base = dict(self.data)
         for key, value in incoming.items():
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from homeassistant.util import dt as dt_util
+from typing import Any
+
+from .const import (
+    CONF_MAX_AGE_PREFIX,
+    CONF_STALE_AS_ATTRIBUTE,
+    DEFAULT_MAX_AGES,
+)
+from .timer_wheel import Clock
+
+
+def max_age_key(section: str) -> str:
+    return f"{CONF_MAX_AGE_PREFIX}{section}"
+
+
+class EcostreamDataAge:
+    """Age of each top-level section of the device data.
+
+    Every frame stamps the sections it carries with the monotonic clock.
+    ``refresh`` compares those stamps against the per-section max ages
+    and keeps the set of stale sections; the coordinator calls it per
+    frame and from one wheel timer armed for ``next_deadline``, so
+    entities never poll. Depending on the options a stale section makes
+    its entities unavailable or only flags them with attributes.
+    """
+
+    def __init__(
+        self,
+        clock: Clock,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
+        self._clock = clock
+        self.max_ages: dict[str, float] = dict(DEFAULT_MAX_AGES)
+        self.stale_as_attribute = False
+
+        # Clock time each section was last received
+        self.updated: dict[str, float] = {}
+        self.stale: frozenset[str] = frozenset()
+        # Sections whose entities are unavailable, or flagged stale;
+        # at most one of the two is non-empty
+        self.unavailable: frozenset[str] = frozenset()
+        self.flagged: frozenset[str] = frozenset()
+
+        # Wall-clock time of the last update of each stale section
+        self._stale_since: dict[str, datetime] = {}
+        self.configure(options or {})
+
+    def configure(self, options: Mapping[str, Any]) -> bool:
+        """Apply data age options; True when entity states changed."""
+        self.max_ages = {
+            section: max(
+                0.0, float(options.get(max_age_key(section), default))
+            )
+            for section, default in DEFAULT_MAX_AGES.items()
+        }
+        self.stale_as_attribute = bool(
+            options.get(CONF_STALE_AS_ATTRIBUTE, False)
+        )
+        return self.refresh(self._clock(), force=True)
+
+    def touch(self, message: Mapping[str, Any], now: float) -> None:
+        """Stamp the tracked sections present in a frame."""
+        updated = self.updated
+        for section in self.max_ages:
+            if section in message:
+                updated[section] = now
+
+    def refresh(self, now: float, force: bool = False) -> bool:
+        """Recompute stale sections; True when entity states changed."""
+        stale = frozenset(
+            section
+            for section, max_age in self.max_ages.items()
+            if max_age
+            and section in self.updated
+            and now - self.updated[section] >= max_age
+        )
+        if stale == self.stale and not force:
+            return False
+
+        for section in stale - self.stale:
+            self._stale_since[section] = (
+                dt_util.utcnow()
+                - timedelta(seconds=now - self.updated[section])
+            ).replace(microsecond=0)
+        for section in self.stale - stale:
+            self._stale_since.pop(section, None)
+        self.stale = stale
+
+        none: frozenset[str] = frozenset()
+        unavailable = none if self.stale_as_attribute else stale
+        flagged = stale if self.stale_as_attribute else none
+        changed = (
+            unavailable != self.unavailable or flagged != self.flagged
+        )
+        self.unavailable = unavailable
+        self.flagged = flagged
+        return changed
+
+    def next_deadline(self) -> float | None:
+        """Clock time the next fresh section goes stale, if any."""
+        deadlines = [
+            self.updated[section] + max_age
+            for section, max_age in self.max_ages.items()
+            if max_age
+            and section in self.updated
+            and section not in self.stale
+        ]
+        return min(deadlines) if deadlines else None
+
+    def age(self, section: str) -> float | None:
+        """Seconds since ``section`` was last received."""
+        updated = self.updated.get(section)
+        if updated is None:
+            return None
+        return self._clock() - updated
+
+    def attributes(self, section: str) -> dict[str, Any] | None:
+        """State attributes of entities reading a flagged section."""
+        if section not in self.flagged:
+            return None
+        return {
+            "stale": True,
+            "last_data_update": self._stale_since.get(section),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        ages = {
+            section: round(age, 1)
+            for section in self.max_ages
+            if (age := self.age(section)) is not None
+        }
+        return {
+            "max_ages": dict(self.max_ages),
+            "stale_as_attribute": self.stale_as_attribute,
+            "ages": ages,
+            "stale": sorted(self.stale),
+        }
@@ -11,7 +11,15 @@ from .const import (
     CONF_BOOST_DURATION,
     CONF_FILTER_REPLACEMENT_DAYS,
     CONF_PRESET_OVERRIDE_MINUTES,
+    INGEST_SECTIONS,
 )
+from .data_age import EcostreamDataAge
+from .metrics import EcostreamMetrics
+from .outbound import EcostreamOutboundQueue
+from .push_policy import EcostreamPushPolicy
+from .rate_limit import EcostreamTokenBucket
+from .resolver import EcostreamHostResolver
+from .telemetry import EcostreamConnectionTelemetry
 
 
 def _validate_icons() -> dict[str, Any]:
@@ -61,6 +69,13 @@ async def async_get_config_entry_diagnostics(
     ws_state = getattr(coordinator, "ws_state", None)
     last_payload = getattr(coordinator, "last_payload", None)
     reconnects = getattr(coordinator, "ws_reconnects", None)
+    metrics = getattr(coordinator, "metrics", None)
+    push_policy = getattr(coordinator, "push_policy", None)
+    outbound = getattr(coordinator, "outbound", None)
+    rate_limiter = getattr(coordinator, "rate_limiter", None)
+    telemetry = getattr(coordinator, "telemetry", None)
+    resolver = getattr(coordinator, "resolver", None)
+    data_age = getattr(coordinator, "data_age", None)
     last_update = getattr(coordinator, "last_update_success_time", None)
 
     watchdog_count: Any = None
@@ -97,6 +112,18 @@ async def async_get_config_entry_diagnostics(
                 CONF_PRESET_OVERRIDE_MINUTES
             ),
             "boost_duration_minutes": opts.get(CONF_BOOST_DURATION),
+            "push_policy": (
+                push_policy.as_dict()
+                if isinstance(push_policy, EcostreamPushPolicy)
+                else None
+            ),
+            "full_capture": getattr(coordinator, "full_capture", None),
+            "ingest_sections": sorted(INGEST_SECTIONS),
+            "data_age": (
+                data_age.as_dict()
+                if isinstance(data_age, EcostreamDataAge)
+                else None
+            ),
             "data_keys": list(data.keys()),
         },
         # -------------------------
@@ -106,6 +133,26 @@ async def async_get_config_entry_diagnostics(
             "state": ws_state,
             "reconnect_count": reconnects,
             "last_payload_preview": last_payload,
+            "telemetry": (
+                telemetry.as_dict()
+                if isinstance(telemetry, EcostreamConnectionTelemetry)
+                else None
+            ),
+            "outbound_queue": (
+                outbound.as_dict()
+                if isinstance(outbound, EcostreamOutboundQueue)
+                else None
+            ),
+            "command_rate_limit": (
+                rate_limiter.as_dict()
+                if isinstance(rate_limiter, EcostreamTokenBucket)
+                else None
+            ),
+            "resolver": (
+                resolver.as_dict()
+                if isinstance(resolver, EcostreamHostResolver)
+                else None
+            ),
         },
         # -------------------------
         # System internals
@@ -114,7 +161,16 @@ async def async_get_config_entry_diagnostics(
             "watchdog_count": watchdog_count,
         },
         # -------------------------
-        # Raw coordinator data dump
+        # Pipeline latency (p50/p95/p99 per stage)
+        # -------------------------
+        "latency": (
+            metrics.as_dict()
+            if isinstance(metrics, EcostreamMetrics)
+            else None
+        ),
+        # -------------------------
+        # Raw coordinator data dump (only ingested sections unless
+        # full capture is enabled)
         # -------------------------
         "raw_data": data,
         # -------------------------
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from typing import Any
+
+from .coordinator import EcostreamDataUpdateCoordinator
+
+
+class EcostreamDataEntity(
+    CoordinatorEntity[EcostreamDataUpdateCoordinator]
+):
+    """Entity built from one top-level section of the device data.
+
+    Available while the coordinator is and ``_data_section`` is within
+    its max age. With stale-as-attribute enabled a stale entity keeps
+    its state and carries ``stale`` attributes instead.
+    """
+
+    _data_section = "status"
+
+    @property
+    def available(self) -> bool:  # type: ignore[override]
+        return (
+            self.coordinator.available
+            and self._data_section
+            not in self.coordinator.data_age.unavailable
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:  # type: ignore[override]
+        return self.coordinator.data_age.attributes(self._data_section)
+
+    @property
+    def _data_state(self) -> tuple[bool, bool]:
+        """Availability and staleness, for entities skipping writes."""
+        return (
+            self.available,
+            self._data_section in self.coordinator.data_age.flagged,
+        )
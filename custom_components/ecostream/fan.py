@@ -8,7 +8,6 @@ from homeassistant.helpers.entity_platform import (
     AddEntitiesCallback,
     current_platform,
 )
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 import inspect
 import logging
 from typing import Any
@@ -21,12 +20,13 @@ from .const import (
     DEVICE_MODEL,
     DEVICE_NAME,
     DOMAIN,
-    PRESET_HIGH,
     PRESET_LOW,
     PRESET_MID,
     PRESET_MODES,
 )
 from .coordinator import EcostreamDataUpdateCoordinator
+from .entity import EcostreamDataEntity
+from .websocket_api import WritePriority
 
 _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 0
@@ -71,7 +71,7 @@ async def async_setup_entry(
 
 
 class EcostreamVentilationFan(  # type: ignore[misc]
-    CoordinatorEntity[EcostreamDataUpdateCoordinator], FanEntity
+    EcostreamDataEntity, FanEntity
 ):
     """EcoStream main ventilation fan."""
 
@@ -107,58 +107,13 @@ class EcostreamVentilationFan(  # type: ignore[misc]
         self._attr_preset_modes = PRESET_MODES
         self._attr_preset_mode: str | None = None
 
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
-    def _status(self) -> dict[str, Any]:
-        return (self.coordinator.data or {}).get("status", {}) or {}
-
-    def _config(self) -> dict[str, Any]:
-        return (self.coordinator.data or {}).get("config", {}) or {}
-
-    def _get_qset(self) -> float:
-        try:
-            return float(self._status().get("qset", 0.0))
-        except (TypeError, ValueError):
-            return 0.0
-
-    def _get_setpoint(self, preset: str) -> float | None:
-        config = self._config()
-        key = {
-            PRESET_LOW: "setpoint_low",
-            PRESET_MID: "setpoint_mid",
-            PRESET_HIGH: "setpoint_high",
-        }.get(preset)
-        if key is None:
-            return None
-        try:
-            value = config.get(key)
-            if value is None:
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
-
-    def _calculate_preset(self, qset: float) -> str | None:
-        low = self._get_setpoint(PRESET_LOW)
-        mid = self._get_setpoint(PRESET_MID)
-        high = self._get_setpoint(PRESET_HIGH)
-        if low is None or mid is None or high is None:
-            return None
-        if abs(qset - low) <= abs(qset - mid) and abs(
-            qset - low
-        ) <= abs(qset - high):
-            return PRESET_LOW
-        if abs(qset - mid) <= abs(qset - high):
-            return PRESET_MID
-        return PRESET_HIGH
-
     # ------------------------------------------------------------------
     # State → Home Assistant
     # ------------------------------------------------------------------
     @property
     def is_on(self) -> bool:
-        return self._get_qset() > 0
+        qset = self.coordinator.presets.qset
+        return qset is not None and qset > 0
 
     # ------------------------------------------------------------------
     # Commands
@@ -176,7 +131,7 @@ class EcostreamVentilationFan(  # type: ignore[misc]
         await self.async_set_preset_mode(PRESET_LOW)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
-        qset = self._get_setpoint(preset_mode)
+        qset = self.coordinator.presets.setpoint(preset_mode)
         if qset is None:
             _LOGGER.error(
                 "EcoStream: no setpoint available for preset %s",
@@ -262,23 +217,30 @@ class EcostreamVentilationFan(  # type: ignore[misc]
 
         sender = getattr(self.coordinator, "async_send_config", None)
         if sender is not None:
-            result = sender(payload["config"], "manual qset")
+            result = sender(
+                payload["config"],
+                "manual qset",
+                WritePriority.AUTOMATION,
+            )
             if inspect.isawaitable(result):
                 await result
             else:
                 self.coordinator.mark_control_action()
-                await self.coordinator.ws.send_json(payload)
+                await self.coordinator.ws.send_json(
+                    payload, priority=WritePriority.AUTOMATION
+                )
         else:
             self.coordinator.mark_control_action()
-            await self.coordinator.ws.send_json(payload)
+            await self.coordinator.ws.send_json(
+                payload, priority=WritePriority.AUTOMATION
+            )
 
-        self._attr_preset_mode = self._calculate_preset(float(qset))
+        self._attr_preset_mode = self.coordinator.presets.classify(
+            float(qset)
+        )
         self.async_write_ha_state()
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        qset = self._get_qset()
-        self._attr_preset_mode = (
-            self._calculate_preset(qset) if qset > 0 else None
-        )
+        self._attr_preset_mode = self.coordinator.presets.preset_mode
         self.async_write_ha_state()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.issue_registry import IssueSeverity
+from homeassistant.util import dt as dt_util
+import logging
+import time
+from typing import Any
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+FILTER_ISSUE_ID = "filter_replacement_overdue"
+
+
+class EcostreamFilterState:
+    """Cached filter replacement state with a single due-time timer.
+
+    The device reports ``config.filter_datetime`` on every config frame,
+    but the overdue state only changes when that timestamp changes or
+    when the due moment passes. Both are handled here so the issue
+    registry is only touched on actual transitions.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_change: Callable[[], None],
+    ) -> None:
+        self.hass = hass
+        self._on_change = on_change
+
+        self.due_ts: float | None = None
+        self.overdue: bool = False
+
+        self._initialized = False
+        self._unsub_due: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_update(self, filter_ts: Any) -> None:
+        """Process a reported ``filter_datetime`` value."""
+        due = (
+            float(filter_ts)
+            if isinstance(filter_ts, (int, float))
+            and not isinstance(filter_ts, bool)
+            and filter_ts > 0
+            else None
+        )
+        if self._initialized and due == self.due_ts:
+            return
+
+        self.due_ts = due
+        self._cancel_timer()
+
+        overdue = due is not None and time.time() >= due
+        if due is not None and not overdue:
+            self._unsub_due = async_track_point_in_utc_time(
+                self.hass,
+                self._async_due_reached,
+                dt_util.utc_from_timestamp(due),
+            )
+        self._set_overdue(overdue)
+
+    @callback
+    def async_stop(self) -> None:
+        self._cancel_timer()
+
+    @callback
+    def _async_due_reached(self, _now: datetime) -> None:
+        self._unsub_due = None
+        self._set_overdue(True)
+        self._on_change()
+
+    def _cancel_timer(self) -> None:
+        if self._unsub_due is not None:
+            self._unsub_due()
+            self._unsub_due = None
+
+    def _set_overdue(self, overdue: bool) -> None:
+        if self._initialized and overdue == self.overdue:
+            return
+
+        self._initialized = True
+        self.overdue = overdue
+
+        if overdue:
+            _LOGGER.debug("EcoStream filter replacement is overdue")
+            ir.async_create_issue(
+                self.hass,
+                DOMAIN,
+                FILTER_ISSUE_ID,
+                is_fixable=False,
+                severity=IssueSeverity.WARNING,
+                translation_key=FILTER_ISSUE_ID,
+            )
+        else:
+            ir.async_delete_issue(self.hass, DOMAIN, FILTER_ISSUE_ID)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import gzip
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import slugify
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, cast
+
+from .const import (
+    FRAME_LOG_FLUSH_SECONDS,
+    FRAME_LOG_MAX_BUFFER,
+    FRAME_LOG_MAX_BYTES,
+)
+from .timer_wheel import Clock
+
+_LOGGER = logging.getLogger(__name__)
+
+FrameHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+def frame_log_path(hass: HomeAssistant, host: str) -> str:
+    """Default recording file for ``host`` in the HA config directory."""
+    return hass.config.path(
+        f"ecostream_frames_{slugify(host)}.ndjson.gz"
+    )
+
+
+def rotated_frame_log_path(path: str) -> str:
+    """Where a full recording is moved before a new one starts."""
+    return f"{path}.1"
+
+
+def _append_lines(path: str, lines: list[str], max_bytes: int) -> bool:
+    """Append one batch; returns True when the file was rotated first.
+
+    Each flush appends one gzip member; readers see one stream.
+    """
+    rotated = False
+    try:
+        rotated = os.path.getsize(path) >= max_bytes
+    except FileNotFoundError:
+        pass
+    if rotated:
+        os.replace(path, rotated_frame_log_path(path))
+    with gzip.open(path, "at", encoding="utf-8") as fh:
+        fh.write("\n".join(lines))
+        fh.write("\n")
+    return rotated
+
+
+def read_frames(path: str | Path) -> list[tuple[float, str]]:
+    """Load ``(monotonic_ts, raw_text)`` pairs from a recording.
+
+    Blocking; run it in the executor from the event loop.
+    """
+    frames: list[tuple[float, str]] = []
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            try:
+                ts, raw = json.loads(line)
+            except (ValueError, TypeError):
+                _LOGGER.debug(
+                    "Skipping corrupt frame log line: %s", line
+                )
+                continue
+            frames.append((float(ts), str(raw)))
+    return frames
+
+
+class EcostreamFrameRecorder:
+    """Append raw WebSocket text frames to a gzip NDJSON file.
+
+    Each line is ``[monotonic_seconds, "<raw frame>"]``, timed by the
+    hub clock. Frames are buffered on the event loop and written in
+    batches by the executor, one batch at a time so appends never
+    interleave. Once the file
+    reaches ``max_bytes`` it replaces the previous ``<path>.1`` and a
+    new file is started, so a forgotten recording stays bounded.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        clock: Clock,
+        max_bytes: int = FRAME_LOG_MAX_BYTES,
+    ) -> None:
+        self.hass = hass
+        self.path = path
+        self._clock = clock
+        self.max_bytes = max_bytes
+        self.frames_written = 0
+        self.rotations = 0
+
+        self._buffer: list[str] = []
+        self._write_lock = asyncio.Lock()
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+
+    @callback
+    def record(self, raw: str) -> None:
+        """Queue one raw text frame with the current monotonic time."""
+        self._buffer.append(
+            json.dumps(
+                [round(self._clock(), 3), raw], separators=(",", ":")
+            )
+        )
+        if len(self._buffer) >= FRAME_LOG_MAX_BUFFER:
+            self._async_flush()
+        elif self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass,
+                FRAME_LOG_FLUSH_SECONDS,
+                self._async_flush_timer,
+            )
+
+    async def async_stop(self) -> None:
+        """Write out everything still buffered."""
+        self._async_flush()
+        if self._pending:
+            await asyncio.gather(*self._pending)
+
+    @callback
+    def _async_flush_timer(self, _now: Any) -> None:
+        self._unsub_flush = None
+        self._async_flush()
+
+    @callback
+    def _async_flush(self) -> None:
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        task = self.hass.async_create_background_task(
+            self._async_write(lines), "ecostream_frame_log"
+        )
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _async_write(self, lines: list[str]) -> None:
+        async with self._write_lock:
+            try:
+                rotated = await self.hass.async_add_executor_job(
+                    _append_lines, self.path, lines, self.max_bytes
+                )
+            except OSError as err:
+                _LOGGER.warning(
+                    "Failed to write EcoStream frame log %s: %s",
+                    self.path,
+                    err,
+                )
+                return
+            self.frames_written += len(lines)
+            if rotated:
+                self.rotations += 1
+                _LOGGER.debug(
+                    "Rotated EcoStream frame log %s after %d bytes",
+                    self.path,
+                    self.max_bytes,
+                )
+
+
+async def async_replay_frames(
+    hass: HomeAssistant,
+    path: str | Path,
+    handler: FrameHandler,
+    speed: float = 1.0,
+    max_gap: float | None = None,
+) -> int:
+    """Feed a recording into ``handler`` (e.g. ``handle_ws_message``).
+
+    ``speed`` scales the recorded inter-frame gaps (2.0 replays twice as
+    fast); ``0`` replays without any delay. ``max_gap`` caps a single
+    gap, e.g. across HA restarts within one file. Frames are decoded
+    exactly like the live client: invalid or non-dict JSON is skipped.
+    Returns the number of frames delivered.
+    """
+    frames = await hass.async_add_executor_job(read_frames, path)
+
+    delivered = 0
+    previous: float | None = None
+    for ts, raw in frames:
+        if speed > 0 and previous is not None:
+            gap = max(0.0, ts - previous)
+            if max_gap is not None:
+                gap = min(gap, max_gap)
+            if gap:
+                await asyncio.sleep(gap / speed)
+        previous = ts
+
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(payload, dict):
+            continue
+
+        await handler(cast(dict[str, Any], payload))
+        delivered += 1
+    return delivered
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from dataclasses import dataclass
+from homeassistant.components import zeroconf
+from homeassistant.core import HomeAssistant, callback
+import logging
+import random
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientSession
+from aiohttp.abc import AbstractResolver
+from aiohttp_asyncmdnsresolver.api import AsyncDualMDNSResolver
+
+from .const import DOMAIN, HUB_LINK_CHECK_SECONDS
+from .session import create_session
+from .timer_wheel import Clock, EcostreamTimerWheel, WheelTimer
+
+if TYPE_CHECKING:
+    from .coordinator import EcostreamDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HUB = f"{DOMAIN}_hub"
+
+RECONNECT_INTERVAL = 3600
+RECONNECT_JITTER = 300
+RECONNECT_MIN_SLEEP = 60
+
+
+def _next_reconnect_delay() -> float:
+    jitter = random.uniform(-RECONNECT_JITTER, RECONNECT_JITTER)
+    return max(RECONNECT_MIN_SLEEP, RECONNECT_INTERVAL + jitter)
+
+
+@dataclass(slots=True)
+class _Device:
+    coordinator: EcostreamDataUpdateCoordinator
+    link_timer: WheelTimer | None = None
+    reconnect_timer: WheelTimer | None = None
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> EcostreamHub:
+    """Return the shared hub, creating it on first use."""
+    hub: EcostreamHub | None = hass.data.get(DATA_HUB)
+    if hub is None:
+        hub = hass.data[DATA_HUB] = EcostreamHub(hass)
+    return hub
+
+
+class EcostreamHub:
+    """Shared scheduler for every EcoStream unit in this HA instance.
+
+    Each device keeps its own WebSocket reader and coordinator (the
+    per-device state store frames are fanned out to). Heartbeats, stale
+    checks and the hourly reconnect are deadlines on one shared timer
+    wheel, so devices whose deadlines fall in the same wheel tick are
+    served by a single event-loop wake-up.
+
+    ``clock`` is the one monotonic time source for every interval and
+    deadline in the integration; tests drive it through ``loop.time``.
+    ``session`` is the client session every unit's WebSocket connects
+    through; ``dns_resolver`` looks unit hostnames up over mDNS and DNS
+    on Home Assistant's zeroconf instance.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.clock: Clock = hass.loop.time
+        self.wheel = EcostreamTimerWheel(hass.loop)
+        self._devices: dict[str, _Device] = {}
+        self._heartbeats: list[Coroutine[Any, Any, None]] = []
+        self._session: ClientSession | None = None
+        self._dns_resolver: AbstractResolver | None = None
+
+    @property
+    def device_count(self) -> int:
+        return len(self._devices)
+
+    @property
+    def session(self) -> ClientSession:
+        """Session for unit WebSockets, created on first use."""
+        if self._session is None or self._session.closed:
+            self._session = create_session(self.dns_resolver)
+        return self._session
+
+    @property
+    def dns_resolver(self) -> AbstractResolver:
+        """Resolver for unit hostnames, created on first use.
+
+        ``.local`` names are asked over mDNS and unicast DNS at once,
+        the same way Home Assistant's own client sessions resolve.
+        """
+        if self._dns_resolver is None:
+            self._dns_resolver = AsyncDualMDNSResolver(
+                async_zeroconf=zeroconf.async_get_async_zeroconf(
+                    self.hass
+                )
+            )
+        return self._dns_resolver
+
+    async def async_close_session(self) -> None:
+        """Close the session and resolver once no unit is registered."""
+        if self._devices:
+            return
+        session, self._session = self._session, None
+        resolver, self._dns_resolver = self._dns_resolver, None
+        if session is not None:
+            await session.close()
+        if resolver is not None:
+            # Zeroconf itself stays open; it is Home Assistant's
+            await resolver.close()
+
+    @callback
+    def async_register(
+        self, coordinator: EcostreamDataUpdateCoordinator
+    ) -> None:
+        """Start driving timers for ``coordinator``'s connection."""
+        previous = self._devices.pop(coordinator.host, None)
+        if previous is not None:
+            self._cancel_timers(previous)
+        device = _Device(coordinator)
+        device.link_timer = self.wheel.call_later(
+            HUB_LINK_CHECK_SECONDS, self._async_link_check, device
+        )
+        device.reconnect_timer = self.wheel.call_later(
+            _next_reconnect_delay(),
+            self._async_scheduled_reconnect,
+            device,
+        )
+        self._devices[coordinator.host] = device
+
+    @callback
+    def async_unregister(
+        self, coordinator: EcostreamDataUpdateCoordinator
+    ) -> None:
+        """Cancel every deadline registered for ``coordinator``."""
+        device = self._devices.get(coordinator.host)
+        if device is None or device.coordinator is not coordinator:
+            return
+        del self._devices[coordinator.host]
+        self._cancel_timers(device)
+        if not self._devices:
+            # Leave no armed loop timer behind after the last unload
+            self.wheel.stop()
+
+    @staticmethod
+    def _cancel_timers(device: _Device) -> None:
+        for timer in (device.link_timer, device.reconnect_timer):
+            if timer is not None:
+                timer.cancel()
+
+    @callback
+    def _async_link_check(self, device: _Device) -> None:
+        """Heartbeat a quiet link and run its stale check."""
+        ws = device.coordinator.ws
+        if ws is not None:
+            if ws.heartbeat_due(self.clock()):
+                if not self._heartbeats:
+                    # Flush once after the current wheel tick
+                    self.hass.loop.call_soon(
+                        self._async_flush_heartbeats
+                    )
+                self._heartbeats.append(ws.async_send_heartbeat())
+            ws.check_stale()
+        device.link_timer = self.wheel.call_later(
+            HUB_LINK_CHECK_SECONDS, self._async_link_check, device
+        )
+
+    @callback
+    def _async_scheduled_reconnect(self, device: _Device) -> None:
+        host = device.coordinator.host
+        _LOGGER.debug("Scheduled EcoStream reconnect for %s", host)
+        self.hass.async_create_background_task(
+            device.coordinator.async_reconnect(),
+            f"ecostream_reconnect_{host}",
+        )
+        device.reconnect_timer = self.wheel.call_later(
+            _next_reconnect_delay(),
+            self._async_scheduled_reconnect,
+            device,
+        )
+
+    @callback
+    def _async_flush_heartbeats(self) -> None:
+        heartbeats, self._heartbeats = self._heartbeats, []
+        if heartbeats:
+            self.hass.async_create_background_task(
+                self._async_send_heartbeats(heartbeats),
+                "ecostream_heartbeats",
+            )
+
+    @staticmethod
+    async def _async_send_heartbeats(
+        heartbeats: list[Coroutine[Any, Any, None]],
+    ) -> None:
+        await asyncio.gather(*heartbeats)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+import time
+from typing import Any
+
+from .const import METRICS_LAG_SAMPLE_SECONDS, METRICS_WINDOW_SECONDS
+
+# Bucket upper bounds: 1 µs doubling up to ~17 s, plus an overflow bucket
+_BUCKET_BOUNDS_NS: tuple[int, ...] = tuple(
+    1_000 << i for i in range(25)
+)
+_EMPTY_COUNTS: tuple[int, ...] = (0,) * (len(_BUCKET_BOUNDS_NS) + 1)
+
+_NS_PER_MS = 1_000_000
+_NS_PER_S = 1_000_000_000
+
+STAGE_RECEIVE = "receive"
+STAGE_DECODE = "decode"
+STAGE_PROCESS = "process"
+STAGE_LOOP_LAG = "loop_lag"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram over a sliding two-window span.
+
+    Counts live in two preallocated lists (current and previous window)
+    that are swapped and zeroed in place, so recording a sample never
+    allocates. Percentiles are the upper bound of the bucket the rank
+    falls in, i.e. accurate to within a factor of two.
+    """
+
+    __slots__ = (
+        "_current",
+        "_previous",
+        "_window_ns",
+        "_window_start",
+        "count",
+        "max_ns",
+    )
+
+    def __init__(
+        self, window_seconds: float = METRICS_WINDOW_SECONDS
+    ) -> None:
+        self._current = list(_EMPTY_COUNTS)
+        self._previous = list(_EMPTY_COUNTS)
+        self._window_ns = int(window_seconds * _NS_PER_S)
+        self._window_start = time.perf_counter_ns()
+        self.count = 0
+        self.max_ns = 0
+
+    def record(
+        self, elapsed_ns: int, now_ns: int | None = None
+    ) -> None:
+        if now_ns is None:
+            now_ns = time.perf_counter_ns()
+        if now_ns - self._window_start >= self._window_ns:
+            self._rotate(now_ns)
+        self._current[bisect_left(_BUCKET_BOUNDS_NS, elapsed_ns)] += 1
+        self.count += 1
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def _rotate(self, now_ns: int) -> None:
+        stale = self._previous
+        stale[:] = _EMPTY_COUNTS
+        if now_ns - self._window_start >= 2 * self._window_ns:
+            # Idle for two windows: nothing recent to keep
+            self._current[:] = _EMPTY_COUNTS
+        self._previous = self._current
+        self._current = stale
+        self._window_start = now_ns
+
+    def percentile_ms(self, quantile: float) -> float | None:
+        """Upper bound for ``quantile`` (0-1) in ms, None when empty."""
+        current, previous = self._current, self._previous
+        total = sum(current) + sum(previous)
+        if total == 0:
+            return None
+        rank = max(1, round(quantile * total))
+        seen = 0
+        for i, count in enumerate(current):
+            seen += count + previous[i]
+            if seen >= rank:
+                if i < len(_BUCKET_BOUNDS_NS):
+                    return _BUCKET_BOUNDS_NS[i] / _NS_PER_MS
+                return self.max_ns / _NS_PER_MS
+        return self.max_ns / _NS_PER_MS
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "p50_ms": self.percentile_ms(0.5),
+            "p95_ms": self.percentile_ms(0.95),
+            "p99_ms": self.percentile_ms(0.99),
+            "max_ms": self.max_ns / _NS_PER_MS,
+        }
+
+
+class EcostreamMetrics:
+    """Hot-path timings for one EcoStream connection.
+
+    - ``receive``: frame returned by ``ws.receive()`` until fully handled
+    - ``decode``: ``json.loads`` of the frame
+    - ``process``: coordinator merge and push decision
+    - ``loop_lag``: delay of a ``call_soon`` probe sent at frame arrival,
+      sampled at most once per ``METRICS_LAG_SAMPLE_SECONDS``
+    """
+
+    def __init__(self) -> None:
+        self.stages: dict[str, LatencyHistogram] = {
+            STAGE_RECEIVE: LatencyHistogram(),
+            STAGE_DECODE: LatencyHistogram(),
+            STAGE_PROCESS: LatencyHistogram(),
+            STAGE_LOOP_LAG: LatencyHistogram(),
+        }
+        self.receive = self.stages[STAGE_RECEIVE]
+        self.decode = self.stages[STAGE_DECODE]
+        self.process = self.stages[STAGE_PROCESS]
+        self.loop_lag = self.stages[STAGE_LOOP_LAG]
+
+        self._lag_probe_pending = False
+        self._next_lag_sample = 0
+
+    def sample_loop_lag(
+        self, loop: asyncio.AbstractEventLoop, now_ns: int
+    ) -> None:
+        """Measure how long the ready queue takes to reach a probe."""
+        if self._lag_probe_pending or now_ns < self._next_lag_sample:
+            return
+        self._lag_probe_pending = True
+        self._next_lag_sample = (
+            now_ns + METRICS_LAG_SAMPLE_SECONDS * _NS_PER_S
+        )
+        loop.call_soon(self._lag_probe, now_ns)
+
+    def _lag_probe(self, sent_ns: int) -> None:
+        self._lag_probe_pending = False
+        now_ns = time.perf_counter_ns()
+        self.loop_lag.record(now_ns - sent_ns, now_ns)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            name: hist.as_dict() for name, hist in self.stages.items()
+        }
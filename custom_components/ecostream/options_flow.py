@@ -7,25 +7,141 @@ from homeassistant.config_entries import (
 )
 from homeassistant.const import CONF_HOST
 from homeassistant.core import callback
+from homeassistant.data_entry_flow import section
 import logging
-from typing import Any
+from typing import Any, cast
 
 import voluptuous as vol
 
 from .const import (
     CONF_ALLOW_OVERRIDE_FILTER_DATE,
     CONF_BOOST_DURATION,
+    CONF_COMMAND_BURST,
+    CONF_COMMAND_LIMIT_SECTION,
+    CONF_COMMAND_RATE,
+    CONF_DATA_AGE_SECTION,
+    CONF_FAST_WINDOW_SECONDS,
     CONF_FILTER_REPLACEMENT_DAYS,
+    CONF_FULL_CAPTURE,
     CONF_PRESET_OVERRIDE_MINUTES,
+    CONF_PUSH_POLICY_SECTION,
+    CONF_RECORD_FRAMES,
+    CONF_RECORDER_LIGHT,
+    CONF_STALE_AS_ATTRIBUTE,
     CONF_SUMMER_COMFORT_TEMP,
     DEFAULT_BOOST_DURATION_MINUTES,
+    DEFAULT_COMMAND_BURST,
+    DEFAULT_COMMAND_RATE_PER_MINUTE,
+    DEFAULT_FAST_PUSH_INTERVALS,
+    DEFAULT_FAST_WINDOW_SECONDS,
     DEFAULT_FILTER_REPLACEMENT_DAYS,
+    DEFAULT_MAX_AGES,
     DEFAULT_PRESET_OVERRIDE_MINUTES,
+    DEFAULT_PUSH_INTERVALS,
     DEFAULT_SUMMER_COMFORT_TEMP,
+    INGEST_SECTIONS,
+    PUSH_GROUPS,
+    PUSH_IGNORABLE_GROUPS,
+)
+from .data_age import max_age_key
+from .push_policy import (
+    fast_push_interval_key,
+    ignore_key,
+    push_interval_key,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_PUSH_INTERVAL = vol.All(int, vol.Range(min=0, max=3600))
+
+
+def _push_groups(
+    options: dict[str, Any], groups: tuple[str, ...]
+) -> tuple[str, ...]:
+    """Groups that still reach the coordinator with these options.
+
+    Without full capture, sections outside ``INGEST_SECTIONS`` are
+    dropped at ingest, so their push settings would have no effect.
+    """
+    if options.get(CONF_FULL_CAPTURE, False):
+        return groups
+    return tuple(group for group in groups if group in INGEST_SECTIONS)
+
+
+def _push_policy_schema(options: dict[str, Any]) -> vol.Schema:
+    """Push interval fields, shown in a collapsed section."""
+    groups = _push_groups(options, PUSH_GROUPS)
+    fields: dict[Any, Any] = {}
+    for group in groups:
+        key = push_interval_key(group)
+        fields[
+            vol.Required(
+                key,
+                default=options.get(key, DEFAULT_PUSH_INTERVALS[group]),
+            )
+        ] = _PUSH_INTERVAL
+    fields[
+        vol.Required(
+            CONF_FAST_WINDOW_SECONDS,
+            default=options.get(
+                CONF_FAST_WINDOW_SECONDS, DEFAULT_FAST_WINDOW_SECONDS
+            ),
+        )
+    ] = _PUSH_INTERVAL
+    for group in groups:
+        key = fast_push_interval_key(group)
+        fields[
+            vol.Required(
+                key,
+                default=options.get(
+                    key, DEFAULT_FAST_PUSH_INTERVALS[group]
+                ),
+            )
+        ] = _PUSH_INTERVAL
+    for group in _push_groups(options, PUSH_IGNORABLE_GROUPS):
+        key = ignore_key(group)
+        fields[vol.Required(key, default=options.get(key, False))] = (
+            bool
+        )
+    return vol.Schema(fields)
+
+
+def _command_limit_schema(options: dict[str, Any]) -> vol.Schema:
+    """Command rate limit fields, shown in a collapsed section."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_COMMAND_BURST,
+                default=options.get(
+                    CONF_COMMAND_BURST, DEFAULT_COMMAND_BURST
+                ),
+            ): vol.All(int, vol.Range(min=1, max=60)),
+            vol.Required(
+                CONF_COMMAND_RATE,
+                default=options.get(
+                    CONF_COMMAND_RATE, DEFAULT_COMMAND_RATE_PER_MINUTE
+                ),
+            ): vol.All(int, vol.Range(min=1, max=600)),
+        }
+    )
+
+
+def _data_age_schema(options: dict[str, Any]) -> vol.Schema:
+    """Data age fields, shown in a collapsed section."""
+    fields: dict[Any, Any] = {}
+    for data_section, default in DEFAULT_MAX_AGES.items():
+        key = max_age_key(data_section)
+        fields[vol.Required(key, default=options.get(key, default))] = (
+            vol.All(int, vol.Range(min=0, max=86400))
+        )
+    fields[
+        vol.Required(
+            CONF_STALE_AS_ATTRIBUTE,
+            default=options.get(CONF_STALE_AS_ATTRIBUTE, False),
+        )
+    ] = bool
+    return vol.Schema(fields)
+
 
 class EcostreamOptionsFlow(OptionsFlowWithConfigEntry):
     """Handle EcoStream configuration options."""
@@ -68,6 +184,33 @@ class EcostreamOptionsFlow(OptionsFlowWithConfigEntry):
                         CONF_ALLOW_OVERRIDE_FILTER_DATE, False
                     )
                 )
+                recorder_light = bool(
+                    user_input.get(CONF_RECORDER_LIGHT, False)
+                )
+                record_frames = bool(
+                    user_input.get(CONF_RECORD_FRAMES, False)
+                )
+                full_capture = bool(
+                    user_input.get(CONF_FULL_CAPTURE, False)
+                )
+                push_policy = cast(
+                    dict[str, Any],
+                    _push_policy_schema(self._options)(
+                        user_input.get(CONF_PUSH_POLICY_SECTION, {})
+                    ),
+                )
+                command_limit = cast(
+                    dict[str, Any],
+                    _command_limit_schema(self._options)(
+                        user_input.get(CONF_COMMAND_LIMIT_SECTION, {})
+                    ),
+                )
+                data_age = cast(
+                    dict[str, Any],
+                    _data_age_schema(self._options)(
+                        user_input.get(CONF_DATA_AGE_SECTION, {})
+                    ),
+                )
 
                 if boost_duration < 5:
                     errors["base"] = "invalid_number"
@@ -91,13 +234,19 @@ class EcostreamOptionsFlow(OptionsFlowWithConfigEntry):
                     self._options[CONF_SUMMER_COMFORT_TEMP] = (
                         summer_comfort_temp
                     )
+                    self._options[CONF_RECORDER_LIGHT] = recorder_light
+                    self._options[CONF_RECORD_FRAMES] = record_frames
+                    self._options[CONF_FULL_CAPTURE] = full_capture
+                    self._options.update(push_policy)
+                    self._options.update(command_limit)
+                    self._options.update(data_age)
 
                     return self.async_create_entry(
                         title="EcoStream Options",
                         data=self._options,
                     )
 
-            except ValueError:
+            except (ValueError, vol.Invalid):
                 errors["base"] = "invalid_number"
 
         current_filter_days = self._options.get(
@@ -120,6 +269,18 @@ class EcostreamOptionsFlow(OptionsFlowWithConfigEntry):
             CONF_SUMMER_COMFORT_TEMP,
             DEFAULT_SUMMER_COMFORT_TEMP,
         )
+        current_recorder_light = self._options.get(
+            CONF_RECORDER_LIGHT,
+            False,
+        )
+        current_record_frames = self._options.get(
+            CONF_RECORD_FRAMES,
+            False,
+        )
+        current_full_capture = self._options.get(
+            CONF_FULL_CAPTURE,
+            False,
+        )
 
         schema = vol.Schema(
             {
@@ -143,6 +304,39 @@ class EcostreamOptionsFlow(OptionsFlowWithConfigEntry):
                     CONF_SUMMER_COMFORT_TEMP,
                     default=current_summer_comfort_temp,
                 ): vol.All(int, vol.Range(min=15, max=30)),
+                vol.Required(
+                    CONF_RECORDER_LIGHT,
+                    default=current_recorder_light,
+                ): bool,
+                vol.Required(
+                    CONF_RECORD_FRAMES,
+                    default=current_record_frames,
+                ): bool,
+                vol.Required(
+                    CONF_FULL_CAPTURE,
+                    default=current_full_capture,
+                ): bool,
+                vol.Required(
+                    CONF_PUSH_POLICY_SECTION,
+                    default={},
+                ): section(
+                    _push_policy_schema(self._options),
+                    {"collapsed": True},
+                ),
+                vol.Required(
+                    CONF_COMMAND_LIMIT_SECTION,
+                    default={},
+                ): section(
+                    _command_limit_schema(self._options),
+                    {"collapsed": True},
+                ),
+                vol.Required(
+                    CONF_DATA_AGE_SECTION,
+                    default={},
+                ): section(
+                    _data_age_schema(self._options),
+                    {"collapsed": True},
+                ),
             }
         )
 
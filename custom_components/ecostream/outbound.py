@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .const import (
+    OUTBOUND_COMMAND_TTL_SECONDS,
+    OUTBOUND_QUEUE_MAX_COMMANDS,
+)
+from .timer_wheel import Clock
+
+
+@dataclass(slots=True)
+class QueuedCommand:
+    config: dict[str, Any]
+    expires_at: float
+    # Runs once the command is replayed
+    on_sent: Callable[[], None] | None = None
+
+
+class EcostreamOutboundQueue:
+    """Config commands held while the WebSocket is down.
+
+    Each command is a ``config`` dict with its own expiry on the
+    monotonic clock. A newer command takes over the keys it shares with
+    queued ones, so only the latest value of each key is replayed and a
+    command left without keys is dropped. The queue is replayed oldest
+    first on reconnect, before the read loop resumes.
+    """
+
+    def __init__(
+        self,
+        clock: Clock,
+        ttl: float = OUTBOUND_COMMAND_TTL_SECONDS,
+        max_commands: int = OUTBOUND_QUEUE_MAX_COMMANDS,
+    ) -> None:
+        self._clock = clock
+        self.ttl = float(ttl)
+        self.max_commands = max_commands
+        self._commands: deque[QueuedCommand] = deque()
+
+        # Lifetime counters for diagnostics
+        self.queued = 0
+        self.coalesced = 0
+        self.expired = 0
+        self.overflowed = 0
+        self.replayed = 0
+
+    def __len__(self) -> int:
+        """Number of commands waiting for replay."""
+        return len(self._commands)
+
+    def push(
+        self,
+        config: dict[str, Any],
+        ttl: float | None = None,
+        on_sent: Callable[[], None] | None = None,
+    ) -> None:
+        """Queue ``config``, superseding older values of its keys."""
+        now = self._clock()
+        self._purge(now)
+        self._strip_keys(config.keys())
+        self._commands.append(
+            QueuedCommand(
+                dict(config),
+                now + (self.ttl if ttl is None else ttl),
+                on_sent,
+            )
+        )
+        self.queued += 1
+        while len(self._commands) > self.max_commands:
+            self._commands.popleft()
+            self.overflowed += 1
+
+    def pop(self) -> QueuedCommand | None:
+        """Take the oldest command that has not expired."""
+        self._purge(self._clock())
+        if not self._commands:
+            return None
+        self.replayed += 1
+        return self._commands.popleft()
+
+    def restore(self, command: QueuedCommand) -> None:
+        """Put back a command whose replay failed.
+
+        Keys queued again since it was taken keep their newer value.
+        """
+        self.replayed -= 1
+        for queued in self._commands:
+            for key in queued.config.keys() & command.config.keys():
+                del command.config[key]
+                self.coalesced += 1
+        if command.config:
+            self._commands.appendleft(command)
+
+    def as_dict(self) -> dict[str, Any]:
+        self._purge(self._clock())
+        return {
+            "depth": len(self._commands),
+            "ttl_seconds": self.ttl,
+            "max_commands": self.max_commands,
+            "queued": self.queued,
+            "coalesced": self.coalesced,
+            "expired": self.expired,
+            "overflowed": self.overflowed,
+            "replayed": self.replayed,
+        }
+
+    def _strip_keys(self, keys: Any) -> None:
+        kept: deque[QueuedCommand] = deque()
+        for command in self._commands:
+            for key in command.config.keys() & keys:
+                del command.config[key]
+                self.coalesced += 1
+            if command.config:
+                kept.append(command)
+        self._commands = kept
+
+    def _purge(self, now: float) -> None:
+        # Per-command TTLs can expire out of order
+        commands = self._commands
+        if any(c.expires_at <= now for c in commands):
+            kept = deque(c for c in commands if c.expires_at > now)
+            self.expired += len(commands) - len(kept)
+            self._commands = kept
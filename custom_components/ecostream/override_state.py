@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    OVERRIDE_CONFIRM_SECONDS,
+    OVERRIDE_DRIFT_TOLERANCE_SECONDS,
+)
+from .timer_wheel import Clock
+
+
+class EcostreamOverrideState:
+    """Locally extrapolated countdown of the active manual override.
+
+    The device reports ``status.override_set_time_left`` on every status
+    frame while a boost or preset override runs. Instead of following
+    each value, the end of the override is kept as one deadline on the
+    monotonic clock. A report only moves it when the extrapolated
+    remainder is off by more than ``OVERRIDE_DRIFT_TOLERANCE_SECONDS``,
+    so ``ends_at_utc`` changes when an override starts, is extended or
+    is cleared, not on every frame.
+    """
+
+    def __init__(self, clock: Clock) -> None:
+        self._clock = clock
+
+        # Deadline on ``clock``; None while no override runs
+        self.ends_at: float | None = None
+        # Same deadline as a wall-clock timestamp, for entities
+        self.ends_at_utc: datetime | None = None
+
+        # Device reports are ignored until this moment after a local
+        # change, as frames sent before the command still disagree
+        self._confirm_until = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self.ends_at is not None and self._clock() < self.ends_at
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left, extrapolated from the last sync."""
+        if self.ends_at is None:
+            return 0.0
+        return max(0.0, self.ends_at - self._clock())
+
+    def start(self, seconds: int) -> bool:
+        """Record an override sent from Home Assistant."""
+        self._confirm_until = self._clock() + OVERRIDE_CONFIRM_SECONDS
+        return self._set(seconds)
+
+    def sync(self, seconds_left: int | None) -> bool:
+        """Align with a reported ``override_set_time_left``.
+
+        Returns True when the end of the override changed.
+        """
+        if seconds_left is None or self._clock() < self._confirm_until:
+            return False
+        if seconds_left <= 0:
+            return self._set(0)
+        if self.ends_at is None:
+            # A remainder within the tolerance is the tail of an
+            # override that already ended locally
+            if seconds_left <= OVERRIDE_DRIFT_TOLERANCE_SECONDS:
+                return False
+            return self._set(seconds_left)
+        if (
+            abs(self.remaining - seconds_left)
+            <= OVERRIDE_DRIFT_TOLERANCE_SECONDS
+        ):
+            return False
+        return self._set(seconds_left)
+
+    def expire(self) -> bool:
+        """Clear the override once its deadline has passed."""
+        if self.ends_at is None or self._clock() < self.ends_at:
+            return False
+        return self._set(0)
+
+    def _set(self, seconds: int) -> bool:
+        if seconds <= 0:
+            changed = self.ends_at is not None
+            self.ends_at = None
+            self.ends_at_utc = None
+            return changed
+
+        self.ends_at = self._clock() + seconds
+        self.ends_at_utc = (
+            dt_util.utcnow() + timedelta(seconds=seconds)
+        ).replace(microsecond=0)
+        return True
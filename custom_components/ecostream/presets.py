@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Any
+
+from .const import PRESET_HIGH, PRESET_LOW, PRESET_MID
+
+PRESET_SETPOINT_KEYS: dict[str, str] = {
+    PRESET_LOW: "setpoint_low",
+    PRESET_MID: "setpoint_mid",
+    PRESET_HIGH: "setpoint_high",
+}
+
+# Tolerance for treating the running qset as "exactly" a preset
+PRESET_MATCH_TOLERANCE = 0.1
+
+
+def _to_float(value: Any) -> float | None:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class EcostreamPresetResolver:
+    """Cached mapping between the running qset and the three presets.
+
+    The setpoint table is only rebuilt when ``setpoint_low/mid/high``
+    change, and ``qset`` is only classified when it changes. Entities
+    read ``preset_mode`` / ``is_active`` without reparsing the payload.
+    """
+
+    __slots__ = (
+        "_bounds",
+        "_config",
+        "_qset_raw",
+        "_setpoints_raw",
+        "_status",
+        "_table",
+        "preset_mode",
+        "qset",
+        "setpoints",
+    )
+
+    def __init__(self) -> None:
+        self.setpoints: dict[str, float] = {}
+        self.qset: float | None = None
+        self.preset_mode: str | None = None
+
+        self._config: Mapping[str, Any] | None = None
+        self._status: Mapping[str, Any] | None = None
+        self._setpoints_raw: tuple[Any, ...] | None = None
+        self._qset_raw: Any = object()
+        self._table: tuple[str, ...] = ()
+        self._bounds: list[float] = []
+
+    def update(
+        self, config: Mapping[str, Any], status: Mapping[str, Any]
+    ) -> None:
+        """Refresh from the merged payload sections.
+
+        The coordinator replaces a section dict whenever a frame touches
+        it, so unchanged sections are skipped by identity.
+        """
+        rebuilt = False
+        if config is not self._config:
+            self._config = config
+            raw = tuple(
+                config.get(key) for key in PRESET_SETPOINT_KEYS.values()
+            )
+            if raw != self._setpoints_raw:
+                self._setpoints_raw = raw
+                self._rebuild_table()
+                rebuilt = True
+
+        if status is not self._status:
+            self._status = status
+            qset_raw = status.get("qset")
+            if qset_raw != self._qset_raw:
+                self._qset_raw = qset_raw
+                self.qset = _to_float(qset_raw)
+                rebuilt = True
+
+        if rebuilt:
+            self.preset_mode = (
+                self.classify(self.qset)
+                if self.qset is not None and self.qset > 0
+                else None
+            )
+
+    def _rebuild_table(self) -> None:
+        setpoints: dict[str, float] = {}
+        for preset, raw in zip(
+            PRESET_SETPOINT_KEYS,
+            self._setpoints_raw or (),
+            strict=False,
+        ):
+            value = _to_float(raw)
+            if value is not None:
+                setpoints[preset] = value
+        self.setpoints = setpoints
+
+        if len(setpoints) < len(PRESET_SETPOINT_KEYS):
+            self._table = ()
+            self._bounds = []
+            return
+
+        # Stable sort keeps low < mid < high order on equal setpoints, so
+        # ties resolve to the lower preset like the old pairwise checks.
+        ordered = sorted(setpoints.items(), key=lambda item: item[1])
+        self._table = tuple(preset for preset, _ in ordered)
+        self._bounds = [
+            (ordered[i][1] + ordered[i + 1][1]) / 2
+            for i in range(len(ordered) - 1)
+        ]
+
+    def setpoint(self, preset: str) -> float | None:
+        """Parsed setpoint for ``preset`` or None when unavailable."""
+        return self.setpoints.get(preset)
+
+    def classify(self, qset: float) -> str | None:
+        """Preset whose setpoint is closest to ``qset``."""
+        if not self._table:
+            return None
+        return self._table[bisect_left(self._bounds, qset)]
+
+    def is_active(self, preset: str) -> bool:
+        """Whether the running qset equals the preset's setpoint."""
+        setpoint = self.setpoints.get(preset)
+        if setpoint is None or self.qset is None:
+            return False
+        return abs(self.qset - setpoint) <= PRESET_MATCH_TOLERANCE
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine, Generator
+from contextlib import contextmanager
+import cProfile
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+import io
+import logging
+import pstats
+import time
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from .const import (
+    DOMAIN,
+    PROFILE_DEFAULT_SECONDS,
+    PROFILE_MAX_SECONDS,
+    PROFILE_SUMMARY_LINES,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import EcostreamDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+ATTR_DURATION = "duration"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            ATTR_DURATION, default=PROFILE_DEFAULT_SECONDS
+        ): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=PROFILE_MAX_SECONDS)
+        ),
+    }
+)
+
+
+class EcostreamProfiler:
+    """Deterministic profiler scoped to EcoStream code paths.
+
+    Unlike a global profiler, ``cProfile`` is only enabled while an
+    EcoStream message is being handled or listeners are dispatched, so
+    other integrations sharing the event loop stay out of the profile.
+    Nested captures are counted and only the outermost one toggles it.
+    """
+
+    def __init__(self) -> None:
+        self.profile = cProfile.Profile()
+        self.messages = 0
+        self._depth = 0
+
+    def begin(self) -> None:
+        if self._depth == 0:
+            self.profile.enable()
+        self._depth += 1
+
+    def end(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self.profile.disable()
+
+    @contextmanager
+    def capture(self) -> Generator[None]:
+        self.begin()
+        try:
+            yield
+        finally:
+            self.end()
+
+    def wrap[T](
+        self, coro: Coroutine[Any, Any, T]
+    ) -> _ProfiledCoroutine[T]:
+        """Profile ``coro`` only while it runs, not while it awaits."""
+        self.messages += 1
+        return _ProfiledCoroutine(self, coro)
+
+
+class _ProfiledCoroutine[T]:
+    __slots__ = ("_coro", "_profiler")
+
+    def __init__(
+        self, profiler: EcostreamProfiler, coro: Coroutine[Any, Any, T]
+    ) -> None:
+        self._profiler = profiler
+        self._coro = coro
+
+    def __await__(self) -> Generator[Any, Any, T]:
+        coro = self._coro
+        send: Any = None
+        error: BaseException | None = None
+        while True:
+            self._profiler.begin()
+            try:
+                if error is not None:
+                    yielded = coro.throw(error)
+                else:
+                    yielded = coro.send(send)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self._profiler.end()
+            try:
+                send = yield yielded
+                error = None
+            except BaseException as err:  # forwarded into the coroutine
+                send = None
+                error = err
+
+
+def _write_profile(
+    profile: cProfile.Profile, base_path: str
+) -> tuple[str, str]:
+    stats_path = f"{base_path}.prof"
+    summary_path = f"{base_path}.txt"
+    profile.dump_stats(stats_path)
+
+    buffer = io.StringIO()
+    stats = pstats.Stats(profile, stream=buffer)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+        PROFILE_SUMMARY_LINES
+    )
+    with open(summary_path, "w", encoding="utf-8") as fh:
+        fh.write(buffer.getvalue())
+    return stats_path, summary_path
+
+
+def _loaded_coordinators(
+    hass: HomeAssistant,
+) -> list[EcostreamDataUpdateCoordinator]:
+    return [
+        entry.runtime_data
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+    ]
+
+
+async def _async_handle_profile(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    duration: float = call.data[ATTR_DURATION]
+    coordinators = _loaded_coordinators(hass)
+    if not coordinators:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="profile_no_devices",
+        )
+    if any(c.profiler is not None for c in coordinators):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="profile_running",
+        )
+
+    profiler = EcostreamProfiler()
+    _LOGGER.info(
+        "Profiling %d EcoStream device(s) for %.0fs",
+        len(coordinators),
+        duration,
+    )
+    for coordinator in coordinators:
+        coordinator.profiler = profiler
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        for coordinator in coordinators:
+            coordinator.profiler = None
+
+    base_path = hass.config.path(
+        f"ecostream_profile_{int(time.time())}"
+    )
+    stats_path, summary_path = await hass.async_add_executor_job(
+        _write_profile, profiler.profile, base_path
+    )
+    _LOGGER.info("EcoStream profile written to %s", stats_path)
+    return {
+        "stats_file": stats_path,
+        "summary_file": summary_path,
+        "messages": profiler.messages,
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration-scoped ``ecostream.profile`` action."""
+
+    async def _handle(call: ServiceCall) -> ServiceResponse:
+        return await _async_handle_profile(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _handle,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
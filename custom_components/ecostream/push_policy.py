@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import math
+from typing import Any
+
+from .const import (
+    CONF_FAST_PUSH_INTERVAL_PREFIX,
+    CONF_FAST_WINDOW_SECONDS,
+    CONF_IGNORE_PREFIX,
+    CONF_PUSH_INTERVAL_PREFIX,
+    DEFAULT_FAST_PUSH_INTERVALS,
+    DEFAULT_FAST_WINDOW_SECONDS,
+    DEFAULT_PUSH_INTERVALS,
+    PUSH_GROUPS,
+    PUSH_IGNORABLE_GROUPS,
+)
+
+
+def push_interval_key(group: str) -> str:
+    return f"{CONF_PUSH_INTERVAL_PREFIX}{group}"
+
+
+def fast_push_interval_key(group: str) -> str:
+    return f"{CONF_FAST_PUSH_INTERVAL_PREFIX}{group}"
+
+
+def ignore_key(group: str) -> str:
+    return f"{CONF_IGNORE_PREFIX}{group}"
+
+
+class EcostreamPushPolicy:
+    """Decide when a device frame is pushed to the entities.
+
+    Every top-level key group (``status``, ``config``, ...) has its own
+    minimum interval, with a second set that applies for
+    ``fast_window`` seconds after a control action. A frame is pushed
+    as soon as one of its groups is due; all groups received since the
+    previous push are then stamped, since the push delivers them too.
+    Ignored groups never trigger a push.
+    """
+
+    def __init__(
+        self, options: Mapping[str, Any] | None = None
+    ) -> None:
+        self.intervals: dict[str, float] = dict(DEFAULT_PUSH_INTERVALS)
+        self.fast_intervals: dict[str, float] = dict(
+            DEFAULT_FAST_PUSH_INTERVALS
+        )
+        self.fast_window = float(DEFAULT_FAST_WINDOW_SECONDS)
+        self.ignored: frozenset[str] = frozenset()
+
+        self._last_push: dict[str, float] = {}
+        self._pending: set[str] = set()
+        self._fast_until = 0.0
+        self.configure(options or {})
+
+    def configure(self, options: Mapping[str, Any]) -> None:
+        """Apply push options; safe to call while running."""
+        self.intervals = {
+            group: float(
+                options.get(
+                    push_interval_key(group),
+                    DEFAULT_PUSH_INTERVALS[group],
+                )
+            )
+            for group in PUSH_GROUPS
+        }
+        self.fast_intervals = {
+            group: float(
+                options.get(
+                    fast_push_interval_key(group),
+                    DEFAULT_FAST_PUSH_INTERVALS[group],
+                )
+            )
+            for group in PUSH_GROUPS
+        }
+        self.fast_window = float(
+            options.get(
+                CONF_FAST_WINDOW_SECONDS, DEFAULT_FAST_WINDOW_SECONDS
+            )
+        )
+        self.ignored = frozenset(
+            group
+            for group in PUSH_IGNORABLE_GROUPS
+            if options.get(ignore_key(group), False)
+        )
+        self._pending -= self.ignored
+
+    def start_fast_window(self, now: float) -> None:
+        self._fast_until = now + self.fast_window
+
+    def in_fast_window(self, now: float) -> bool:
+        return now < self._fast_until
+
+    def reset(self) -> None:
+        """Forget push history so the next frame is pushed at once."""
+        self._last_push.clear()
+
+    def due(self, groups: Iterable[str], now: float) -> bool:
+        """Record ``groups`` as received; True when a push is due."""
+        intervals = (
+            self.fast_intervals
+            if now < self._fast_until
+            else self.intervals
+        )
+        last_push = self._last_push
+        is_due = False
+        for group in groups:
+            interval = intervals.get(group)
+            if interval is None or group in self.ignored:
+                continue
+            self._pending.add(group)
+            if now - last_push.get(group, -math.inf) >= interval:
+                is_due = True
+        return is_due
+
+    def mark_pushed(self, now: float) -> None:
+        for group in self._pending:
+            self._last_push[group] = now
+        self._pending.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "intervals": dict(self.intervals),
+            "fast_intervals": dict(self.fast_intervals),
+            "fast_window": self.fast_window,
+            "ignored": sorted(self.ignored),
+        }
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    CONF_COMMAND_BURST,
+    CONF_COMMAND_RATE,
+    DEFAULT_COMMAND_BURST,
+    DEFAULT_COMMAND_RATE_PER_MINUTE,
+)
+from .timer_wheel import Clock
+
+
+class EcostreamTokenBucket:
+    """Token bucket for the commands written to one unit.
+
+    Holds up to ``burst`` tokens and refills at ``rate`` tokens per
+    minute. Every command takes one token; without one the writer waits
+    for the next refill, coalescing commands queued meanwhile, instead
+    of sending. Heartbeats are not limited.
+    """
+
+    def __init__(
+        self,
+        clock: Clock,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
+        self._clock = clock
+        self.burst = DEFAULT_COMMAND_BURST
+        self.rate = float(DEFAULT_COMMAND_RATE_PER_MINUTE)
+        self._tokens = float(self.burst)
+        self._refilled_at = clock()
+
+        # Lifetime counters for diagnostics
+        self.sent = 0
+        self.throttled = 0
+        self.coalesced = 0
+        self.configure(options or {})
+
+    def configure(self, options: Mapping[str, Any]) -> None:
+        """Apply rate limit options; safe to call while running."""
+        self._refill(self._clock())
+        self.burst = max(
+            1,
+            int(options.get(CONF_COMMAND_BURST, DEFAULT_COMMAND_BURST)),
+        )
+        self.rate = max(
+            1.0,
+            float(
+                options.get(
+                    CONF_COMMAND_RATE, DEFAULT_COMMAND_RATE_PER_MINUTE
+                )
+            ),
+        )
+        self._tokens = min(self._tokens, float(self.burst))
+
+    def take(self) -> float:
+        """Take a token.
+
+        Returns 0 when one was available, else the seconds until the
+        next one; nothing is taken in that case.
+        """
+        now = self._clock()
+        self._refill(now)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self.sent += 1
+            return 0.0
+        self.throttled += 1
+        return (1 - self._tokens) * 60 / self.rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._refilled_at)
+        self._refilled_at = now
+        self._tokens = min(
+            float(self.burst), self._tokens + elapsed * self.rate / 60
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        self._refill(self._clock())
+        return {
+            "burst": self.burst,
+            "rate_per_minute": self.rate,
+            "tokens": round(self._tokens, 2),
+            "sent": self.sent,
+            "throttled": self.throttled,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.network import is_ip_address
+import logging
+import socket
+from typing import Any
+
+from .const import RESOLVER_TTL_SECONDS
+from .hub import async_get_hub
+from .timer_wheel import Clock
+
+_LOGGER = logging.getLogger(__name__)
+
+SOURCE_DNS = "dns"
+SOURCE_DISCOVERY = "discovery"
+
+
+class EcostreamHostResolver:
+    """Cached address of one unit, for hosts configured by name.
+
+    Resolving ``ecostream-xxxx.local`` over mDNS can take seconds, and
+    the WebSocket reconnects hourly. The last good address is pinned
+    and reused until ``ttl`` passes or a connect to it fails; zeroconf
+    and DHCP discovery refresh it without a lookup. Lookups go through
+    the hub's mDNS-aware resolver and ask for IPv4 only, so a
+    link-local IPv6 address without its scope is never pinned. When a
+    lookup fails the previous address is kept, or the hostname is
+    returned for aiohttp to resolve. Hosts given as an IP address are
+    returned unchanged.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        clock: Clock,
+        ttl: float = RESOLVER_TTL_SECONDS,
+    ) -> None:
+        self._hass = hass
+        self._clock = clock
+        self._ttl = ttl
+        self.host = host
+        self.static = is_ip_address(host)
+
+        self.address: str | None = host if self.static else None
+        self.source: str | None = None
+        self._expires_at = 0.0
+
+        # Lifetime counters for diagnostics
+        self.hits = 0
+        self.lookups = 0
+        self.lookup_failures = 0
+        self.invalidations = 0
+        self.discovery_updates = 0
+
+    async def async_resolve(self) -> str:
+        """Address to connect to, looked up only when none is pinned."""
+        if self.static:
+            return self.host
+        if (
+            self.address is not None
+            and self._clock() < self._expires_at
+        ):
+            self.hits += 1
+            return self.address
+
+        self.lookups += 1
+        resolver = async_get_hub(self._hass).dns_resolver
+        try:
+            results = await resolver.resolve(
+                self.host, 0, socket.AF_INET
+            )
+        except OSError as err:
+            results = []
+            _LOGGER.debug("Resolving %s failed: %s", self.host, err)
+        if not results:
+            self.lookup_failures += 1
+            # A stale address beats none; the lookup is retried on
+            # the next connect
+            return self.address or self.host
+
+        address = results[0]["host"]
+        self._pin(address, SOURCE_DNS)
+        return address
+
+    def invalidate(self) -> None:
+        """Look the host up again before the next connect."""
+        if self.static or not self._expires_at:
+            return
+        self.invalidations += 1
+        self._expires_at = 0.0
+
+    def update(self, address: str) -> None:
+        """Pin an address reported by discovery."""
+        if self.static:
+            return
+        self.discovery_updates += 1
+        if address != self.address:
+            _LOGGER.debug(
+                "EcoStream %s discovered at %s", self.host, address
+            )
+        self._pin(address, SOURCE_DISCOVERY)
+
+    def _pin(self, address: str, source: str) -> None:
+        self.address = address
+        self.source = source
+        self._expires_at = self._clock() + self._ttl
+
+    def as_dict(self) -> dict[str, Any]:
+        expires_in = (
+            max(0.0, self._expires_at - self._clock())
+            if self._expires_at
+            else None
+        )
+        return {
+            "host": self.host,
+            "static": self.static,
+            "address": self.address,
+            "source": self.source,
+            "expires_in_seconds": (
+                round(expires_in) if expires_in is not None else None
+            ),
+            "hits": self.hits,
+            "lookups": self.lookups,
+            "lookup_failures": self.lookup_failures,
+            "invalidations": self.invalidations,
+            "discovery_updates": self.discovery_updates,
+        }
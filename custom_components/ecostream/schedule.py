@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import re
+from typing import Any
+
+_SCHEDULE_KEY = re.compile(r"^schedule_(\d+)_(time|value)$")
+_MINUTES_PER_DAY = 24 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleTransition:
+    """One schedule entry: from ``minute`` of the day, run at ``value``."""
+
+    minute: int
+    value: Any
+    index: int
+
+    @property
+    def label(self) -> str:
+        return f"{self.minute // 60:02d}:{self.minute % 60:02d}"
+
+
+def _parse_minute(raw: Any) -> int | None:
+    """Parse ``HH:MM[:SS]`` or a minute-of-day number."""
+    if isinstance(raw, bool):
+        return None
+    if isinstance(raw, (int, float)):
+        minute = int(raw)
+    elif isinstance(raw, str):
+        parts = raw.strip().split(":")
+        if len(parts) < 2:
+            return None
+        try:
+            minute = int(parts[0]) * 60 + int(parts[1])
+        except ValueError:
+            return None
+    else:
+        return None
+
+    if not 0 <= minute < _MINUTES_PER_DAY:
+        return None
+    return minute
+
+
+def schedule_fields(
+    config: Mapping[str, Any],
+) -> tuple[tuple[str, Any], ...]:
+    """Raw ``schedule_*`` entries of ``config``, in a stable order."""
+    return tuple(
+        sorted(
+            (key, raw)
+            for key, raw in config.items()
+            if _SCHEDULE_KEY.match(key)
+        )
+    )
+
+
+class EcostreamSchedule:
+    """Parsed, sorted view of the device's ``schedule_*`` config keys.
+
+    Built once per config change; lookups bisect the sorted minute table
+    instead of scanning config keys.
+    """
+
+    __slots__ = ("_minutes", "entry_count", "transitions")
+
+    def __init__(
+        self,
+        transitions: tuple[ScheduleTransition, ...] = (),
+        entry_count: int = 0,
+    ) -> None:
+        self.transitions = transitions
+        self.entry_count = entry_count
+        self._minutes = [t.minute for t in transitions]
+
+    @classmethod
+    def from_config(
+        cls, config: Mapping[str, Any]
+    ) -> EcostreamSchedule:
+        times: dict[int, Any] = {}
+        values: dict[int, Any] = {}
+        for key, raw in config.items():
+            match = _SCHEDULE_KEY.match(key)
+            if match is None:
+                continue
+            target = times if match.group(2) == "time" else values
+            target[int(match.group(1))] = raw
+
+        complete = sorted(set(times) & set(values))
+        transitions: list[ScheduleTransition] = []
+        for index in complete:
+            minute = _parse_minute(times[index])
+            if minute is not None:
+                transitions.append(
+                    ScheduleTransition(minute, values[index], index)
+                )
+        transitions.sort(key=lambda t: (t.minute, t.index))
+        return cls(tuple(transitions), len(complete))
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether at least one entry has both a time and a value."""
+        return self.entry_count > 0
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def active_at(self, minute: int) -> ScheduleTransition | None:
+        """Entry in effect at ``minute`` (wrapping past midnight)."""
+        if not self.transitions:
+            return None
+        pos = bisect_right(self._minutes, minute)
+        return self.transitions[pos - 1]
+
+    def next_after(
+        self, minute: int
+    ) -> tuple[ScheduleTransition, int] | None:
+        """Next entry strictly after ``minute`` plus its day offset."""
+        if not self.transitions:
+            return None
+        pos = bisect_right(self._minutes, minute)
+        if pos < len(self.transitions):
+            return self.transitions[pos], 0
+        return self.transitions[0], 1
+
+    def next_change(self, now: datetime) -> datetime | None:
+        """Local datetime of the next schedule transition after ``now``."""
+        found = self.next_after(now.hour * 60 + now.minute)
+        if found is None:
+            return None
+        transition, day_offset = found
+        day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return day + timedelta(
+            days=day_offset, minutes=transition.minute
+        )
+
+    def iter_periods(
+        self, start: datetime, end: datetime
+    ) -> Iterator[tuple[datetime, datetime, ScheduleTransition]]:
+        """Yield ``(start, end, entry)`` periods overlapping the window."""
+        if not self.transitions:
+            return
+
+        count = len(self.transitions)
+        day = start.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=1)
+        while day < end:
+            for pos, transition in enumerate(self.transitions):
+                following = self.transitions[(pos + 1) % count]
+                period_start = day + timedelta(
+                    minutes=transition.minute
+                )
+                period_end = day + timedelta(minutes=following.minute)
+                if pos + 1 >= count:
+                    period_end += timedelta(days=1)
+                if period_end > start and period_start < end:
+                    yield period_start, period_end, transition
+            day += timedelta(days=1)
@@ -56,6 +56,10 @@ class EcostreamBoostDurationSelect(  # type: ignore[misc]
             model=DEVICE_MODEL,
         )
 
+    @property
+    def available(self) -> bool:  # type: ignore[override]
+        return self.coordinator.available
+
     @property
     def current_option(self) -> str | None:  # type: ignore[override]
         minutes = getattr(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -12,9 +12,11 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 import logging
 from typing import Any, cast
 
@@ -22,8 +24,11 @@ from .const import (
     DEVICE_MODEL,
     DEVICE_NAME,
     DOMAIN,
+    RECORDER_LIGHT_WRITE_INTERVAL,
 )
 from .coordinator import EcostreamDataUpdateCoordinator
+from .entity import EcostreamDataEntity
+from .metrics import STAGE_LOOP_LAG, STAGE_RECEIVE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,25 +51,6 @@ def _deep_get(
     return cur
 
 
-def _format_uptime(seconds: int) -> str:
-    if seconds < 0:
-        return "0m"
-
-    days = seconds // 86400
-    rem = seconds % 86400
-    hours = rem // 3600
-    rem %= 3600
-    minutes = rem // 60
-
-    parts: list[str] = []
-    if days:
-        parts.append(f"{days}d")
-    if hours or days:
-        parts.append(f"{hours}h")
-    parts.append(f"{minutes}m")
-    return " ".join(parts)
-
-
 def _number_value(
     path: list[str],
     decimals: int | None = None,
@@ -103,6 +89,11 @@ def _int_value(path: list[str]) -> Callable[[Mapping[str, Any]], Any]:
 class EcostreamSensorDescription(SensorEntityDescription):
     value_fn: Callable[[Mapping[str, Any]], Any] | None = None
     is_date: bool = False
+    # Top-level section value_fn reads, for data age
+    data_section: str = "status"
+    # High-frequency measurement; moved to hourly statistics in
+    # recorder-light mode.
+    recorder_light: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -129,6 +120,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         value_fn=_number_value(
             ["status", "sensor_eco2_eta"], round_int=True
         ),
+        recorder_light=True,
     ),
     EcostreamSensorDescription(
         key="tvoc_return",
@@ -139,6 +131,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         value_fn=_number_value(
             ["status", "sensor_tvoc_eta"], round_int=True
         ),
+        recorder_light=True,
     ),
     EcostreamSensorDescription(
         key="humidity_return",
@@ -149,6 +142,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         value_fn=_number_value(
             ["status", "sensor_rh_eta"], round_int=True
         ),
+        recorder_light=True,
     ),
     EcostreamSensorDescription(
         key="temperature_eha",
@@ -159,6 +153,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         value_fn=_number_value(
             ["status", "sensor_temp_eha"], decimals=1
         ),
+        recorder_light=True,
     ),
     EcostreamSensorDescription(
         key="temperature_eta",
@@ -169,6 +164,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         value_fn=_number_value(
             ["status", "sensor_temp_eta"], decimals=1
         ),
+        recorder_light=True,
     ),
     EcostreamSensorDescription(
         key="temperature_oda",
@@ -179,6 +175,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         value_fn=_number_value(
             ["status", "sensor_temp_oda"], decimals=1
         ),
+        recorder_light=True,
     ),
     EcostreamSensorDescription(
         key="fan_exhaust_speed",
@@ -188,6 +185,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         value_fn=_number_value(
             ["status", "fan_eha_speed"], round_int=True
         ),
+        recorder_light=True,
     ),
     EcostreamSensorDescription(
         key="fan_supply_speed",
@@ -197,6 +195,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         value_fn=_number_value(
             ["status", "fan_sup_speed"], round_int=True
         ),
+        recorder_light=True,
     ),
     EcostreamSensorDescription(
         key="qset",
@@ -209,6 +208,9 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         key="mode_time_left",
         name="Mode Time Left",
         native_unit_of_measurement="s",
+        # Changes on every status push; Override Ends is the cheap
+        # alternative
+        entity_registry_enabled_default=False,
         value_fn=_int_value(["status", "override_set_time_left"]),
     ),
     # -------------------------------------------------------------------
@@ -220,12 +222,14 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         native_unit_of_measurement="%",
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _calc_efficiency(d),
+        recorder_light=True,
     ),
     # -------------------------------------------------------------------
     # CONFIG
     # -------------------------------------------------------------------
     EcostreamSensorDescription(
         key="summer_comfort_temp",
+        data_section="config",
         name="Summer Comfort Temp",
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement="°C",
@@ -234,6 +238,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
     ),
     EcostreamSensorDescription(
         key="filter_replacement_date",
+        data_section="config",
         name="Filter Replacement Date",
         device_class=SensorDeviceClass.DATE,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -241,21 +246,11 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
         value_fn=lambda d: _deep_get(d, ["config", "filter_datetime"]),
     ),
     # -------------------------------------------------------------------
-    # SYSTEM
-    # -------------------------------------------------------------------
-    EcostreamSensorDescription(
-        key="uptime",
-        name="Uptime",
-        translation_key="uptime",
-        icon="mdi:timer-outline",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda d: _deep_get(d, ["system", "uptime"]),
-    ),
-    # -------------------------------------------------------------------
     # WIFI
     # -------------------------------------------------------------------
     EcostreamSensorDescription(
         key="wifi_ip",
+        data_section="comm_wifi",
         name="WiFi IP",
         translation_key="wifi_ip",
         icon="mdi:wifi",
@@ -264,6 +259,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
     ),
     EcostreamSensorDescription(
         key="wifi_ssid",
+        data_section="comm_wifi",
         name="WiFi SSID",
         translation_key="wifi_ssid",
         icon="mdi:wifi",
@@ -272,6 +268,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
     ),
     EcostreamSensorDescription(
         key="wifi_rssi",
+        data_section="comm_wifi",
         name="WiFi RSSI",
         native_unit_of_measurement="dBm",
         state_class=SensorStateClass.MEASUREMENT,
@@ -285,6 +282,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
     # -------------------------------------------------------------------
     EcostreamSensorDescription(
         key="setpoint_low",
+        data_section="config",
         name="Setpoint Low",
         native_unit_of_measurement="m³/h",
         state_class=SensorStateClass.MEASUREMENT,
@@ -294,6 +292,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
     ),
     EcostreamSensorDescription(
         key="setpoint_mid",
+        data_section="config",
         name="Setpoint Mid",
         native_unit_of_measurement="m³/h",
         state_class=SensorStateClass.MEASUREMENT,
@@ -303,6 +302,7 @@ SENSOR_DESCRIPTIONS: tuple[EcostreamSensorDescription, ...] = (
     ),
     EcostreamSensorDescription(
         key="setpoint_high",
+        data_section="config",
         name="Setpoint High",
         native_unit_of_measurement="m³/h",
         state_class=SensorStateClass.MEASUREMENT,
@@ -362,8 +362,9 @@ def _calc_efficiency(data: Mapping[str, Any]) -> float | None:
 # ---------------------------------------------------------------------------
 
 
-class EcostreamBaseSensor(
-    CoordinatorEntity[EcostreamDataUpdateCoordinator], SensorEntity
+class EcostreamBaseSensor(  # pyright: ignore[reportIncompatibleVariableOverride]
+    EcostreamDataEntity,
+    SensorEntity,
 ):
     _attr_has_entity_name = True
 
@@ -378,6 +379,7 @@ class EcostreamBaseSensor(
 
         self.entity_description = description
         self._entry = entry
+        self._data_section = description.data_section
 
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = DeviceInfo(
@@ -387,11 +389,21 @@ class EcostreamBaseSensor(
             model=DEVICE_MODEL,
         )
 
-    @property
-    def available(self) -> bool:  # type: ignore[override]
-        data = cast(dict[str, Any], self.coordinator.data or {})
-        status = cast(dict[str, Any], data.get("status") or {})
-        return bool(status.get("connect_status", 1) == 1)
+        # Recorder-light: sparse state writes, full-resolution samples
+        # go to hourly external statistics
+        self._statistics = (
+            coordinator.statistics
+            if description.recorder_light
+            else None
+        )
+        self._last_write: float = 0.0
+        self._written_state: tuple[bool, bool] | None = None
+        if self._statistics is not None:
+            self._statistics.async_register(
+                description.key,
+                str(description.name),
+                description.native_unit_of_measurement,
+            )
 
     @property
     def native_value(self) -> Any:  # type: ignore[override]
@@ -426,17 +438,288 @@ class EcostreamBaseSensor(
             except Exception:
                 return None
 
-        # Uptime formatting
-        if desc.key == "uptime":
-            try:
-                return _format_uptime(int(raw))
-            except Exception:
-                return None
-
         return raw
 
     @callback
     def _handle_coordinator_update(self) -> None:
+        if self._statistics is None:
+            self.async_write_ha_state()
+            return
+
+        value = self.native_value
+        if isinstance(value, (int, float)):
+            self._statistics.async_add_sample(
+                self.entity_description.key, float(value)
+            )
+
+        now = self.coordinator.hub.clock()
+        state = self._data_state
+        if (
+            self._last_write
+            and now - self._last_write < RECORDER_LIGHT_WRITE_INTERVAL
+            and state == self._written_state
+        ):
+            return
+        self._last_write = now
+        self._written_state = state
+        self.async_write_ha_state()
+
+
+class EcostreamNextScheduleChangeSensor(  # pyright: ignore[reportIncompatibleVariableOverride]
+    EcostreamDataEntity,
+    SensorEntity,
+):
+    """Timestamp of the next transition in the device schedule."""
+
+    _attr_has_entity_name = True
+    _data_section = "config"
+    _attr_translation_key = "next_schedule_change"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:calendar-arrow-right"
+
+    def __init__(
+        self,
+        coordinator: EcostreamDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_next_schedule_change"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.host)},
+            manufacturer="BUVA",
+            name=DEVICE_NAME,
+            model=DEVICE_MODEL,
+        )
+
+    @property
+    def native_value(self) -> datetime | None:  # type: ignore[override]
+        data = cast(dict[str, Any], self.coordinator.data or {})
+        if not _deep_get(data, ["config", "schedule_enabled"], False):
+            return None
+        return self.coordinator.schedule.next_change(dt_util.now())
+
+
+class EcostreamLastBootSensor(  # pyright: ignore[reportIncompatibleVariableOverride]
+    EcostreamDataEntity,
+    SensorEntity,
+):
+    """Time the unit last booted, derived from ``system.uptime``.
+
+    The timestamp is computed once and only moves when the reported
+    uptime goes down (a reboot), so the state does not change on every
+    push the way a formatted uptime string would.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "last_boot"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:restart"
+    _data_section = "system"
+
+    def __init__(
+        self,
+        coordinator: EcostreamDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_last_boot"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.host)},
+            manufacturer="BUVA",
+            name=DEVICE_NAME,
+            model=DEVICE_MODEL,
+        )
+        self._attr_native_value = None
+        self._last_uptime: int | None = None
+        self._written_state: tuple[bool, bool] | None = None
+        self._update_boot()
+
+    def _update_boot(self) -> bool:
+        """Recompute the boot time on a reboot; True when it changed."""
+        data = self.coordinator.data or {}
+        try:
+            uptime = int(_deep_get(data, ["system", "uptime"]))
+        except (TypeError, ValueError):
+            return False
+
+        rebooted = (
+            self._last_uptime is not None and uptime < self._last_uptime
+        )
+        self._last_uptime = uptime
+        if self._attr_native_value is not None and not rebooted:
+            return False
+
+        self._attr_native_value = (
+            dt_util.utcnow() - timedelta(seconds=uptime)
+        ).replace(microsecond=0)
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        changed = self._update_boot()
+        state = self._data_state
+        if not changed and state == self._written_state:
+            return
+        self._written_state = state
+        self.async_write_ha_state()
+
+
+class EcostreamOverrideEndSensor(  # pyright: ignore[reportIncompatibleVariableOverride]
+    EcostreamDataEntity,
+    SensorEntity,
+):
+    """Time the running boost or preset override ends.
+
+    Backed by the coordinator's local countdown, so the state only
+    changes when an override starts, is extended or is cleared.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "override_end"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(
+        self,
+        coordinator: EcostreamDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_override_end"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.host)},
+            manufacturer="BUVA",
+            name=DEVICE_NAME,
+            model=DEVICE_MODEL,
+        )
+        self._written: tuple[Any, ...] | None = None
+
+    @property
+    def native_value(self) -> datetime | None:  # type: ignore[override]
+        return self.coordinator.override.ends_at_utc
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        written = (self.native_value, self._data_state)
+        if written == self._written:
+            return
+        self._written = written
+        self.async_write_ha_state()
+
+
+class EcostreamLatencySensor(
+    CoordinatorEntity[EcostreamDataUpdateCoordinator], SensorEntity
+):
+    """p95 of one pipeline latency histogram (disabled by default)."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = "ms"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(
+        self,
+        coordinator: EcostreamDataUpdateCoordinator,
+        entry: ConfigEntry,
+        stage: str,
+        key: str,
+    ) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._histogram = coordinator.metrics.stages[stage]
+        self._attr_translation_key = key
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.host)},
+            manufacturer="BUVA",
+            name=DEVICE_NAME,
+            model=DEVICE_MODEL,
+        )
+
+    @property
+    def available(self) -> bool:  # type: ignore[override]
+        return self.coordinator.available
+
+    @property
+    def native_value(self) -> float | None:  # type: ignore[override]
+        return self._histogram.percentile_ms(0.95)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:  # type: ignore[override]
+        return {
+            "p50": self._histogram.percentile_ms(0.5),
+            "p99": self._histogram.percentile_ms(0.99),
+            "samples": self._histogram.count,
+        }
+
+
+class EcostreamReconnectsSensor(  # pyright: ignore[reportIncompatibleVariableOverride]
+    CoordinatorEntity[EcostreamDataUpdateCoordinator],
+    SensorEntity,
+):
+    """WebSocket reconnects since setup (disabled by default).
+
+    Disconnect reasons, failed attempts and decode errors are exposed
+    as attributes; frame and byte counters stay in diagnostics, as they
+    change on every frame.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "websocket_reconnects"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:lan-connect"
+
+    def __init__(
+        self,
+        coordinator: EcostreamDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._telemetry = coordinator.telemetry
+        self._attr_unique_id = f"{entry.entry_id}_websocket_reconnects"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.host)},
+            manufacturer="BUVA",
+            name=DEVICE_NAME,
+            model=DEVICE_MODEL,
+        )
+        self._written: tuple[int, int, int] | None = None
+
+    @property
+    def native_value(self) -> int:  # type: ignore[override]
+        return self._telemetry.reconnects
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:  # type: ignore[override]
+        telemetry = self._telemetry
+        return {
+            "last_disconnect_reason": telemetry.last_disconnect_reason,
+            "disconnect_reasons": dict(telemetry.reasons),
+            "connect_failures": telemetry.connect_failures,
+            "decode_errors": telemetry.decode_errors,
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        telemetry = self._telemetry
+        written = (
+            telemetry.connects,
+            telemetry.connect_failures,
+            telemetry.decode_errors,
+        )
+        if written == self._written:
+            return
+        self._written = written
         self.async_write_ha_state()
 
 
@@ -453,9 +736,32 @@ async def async_setup_entry(
 
     coordinator: EcostreamDataUpdateCoordinator = entry.runtime_data
 
+    # The formatted uptime sensor was replaced by last_boot
+    ent_reg = er.async_get(hass)
+    if old_uptime := ent_reg.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_uptime"
+    ):
+        ent_reg.async_remove(old_uptime)
+
     entities: list[Any] = [
         EcostreamBaseSensor(coordinator, entry, desc)
         for desc in SENSOR_DESCRIPTIONS
     ]
+    entities.append(
+        EcostreamNextScheduleChangeSensor(coordinator, entry)
+    )
+    entities.append(EcostreamLastBootSensor(coordinator, entry))
+    entities.append(EcostreamOverrideEndSensor(coordinator, entry))
+    entities.append(EcostreamReconnectsSensor(coordinator, entry))
+    entities.extend(
+        [
+            EcostreamLatencySensor(
+                coordinator, entry, STAGE_RECEIVE, "frame_latency"
+            ),
+            EcostreamLatencySensor(
+                coordinator, entry, STAGE_LOOP_LAG, "event_loop_lag"
+            ),
+        ]
+    )
 
     async_add_entities(entities, update_before_add=True)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import socket
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from aiohttp.abc import AbstractResolver
+
+from .const import (
+    WS_CONNECT_TIMEOUT,
+    WS_CONNECTOR_LIMIT_PER_HOST,
+    WS_KEEPALIVE_COUNT,
+    WS_KEEPALIVE_IDLE,
+    WS_KEEPALIVE_INTERVAL,
+)
+
+# Socket address: (host, port) for IPv4, plus flowinfo and scope id
+# for IPv6
+AddrInfo = tuple[
+    int | socket.AddressFamily,
+    int | socket.SocketKind,
+    int,
+    str,
+    tuple[str, int] | tuple[str, int, int, int],
+]
+
+# Linux names the idle time TCP_KEEPIDLE, macOS TCP_KEEPALIVE
+_TCP_KEEPIDLE = getattr(
+    socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None)
+)
+_KEEPALIVE_OPTIONS = tuple(
+    (option, value)
+    for option, value in (
+        (_TCP_KEEPIDLE, WS_KEEPALIVE_IDLE),
+        (getattr(socket, "TCP_KEEPINTVL", None), WS_KEEPALIVE_INTERVAL),
+        (getattr(socket, "TCP_KEEPCNT", None), WS_KEEPALIVE_COUNT),
+    )
+    if option is not None
+)
+
+
+def _socket_factory(addr_info: AddrInfo) -> socket.socket:
+    """Socket for one unit link: no Nagle delay, TCP keepalive on."""
+    family, type_, proto, _, _ = addr_info
+    sock = socket.socket(family=family, type=type_, proto=proto)
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, value in _KEEPALIVE_OPTIONS:
+            sock.setsockopt(socket.IPPROTO_TCP, option, value)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def create_session(
+    resolver: AbstractResolver | None = None,
+) -> ClientSession:
+    """Client session for the long-lived LAN WebSockets to the units.
+
+    Home Assistant's shared session is tuned for HTTP APIs; units are
+    a handful of local hosts each holding one WebSocket. There is no
+    overall connection limit, so a reconnect storm across a large
+    fleet is not queued behind a pool size, and a short connect
+    timeout lets an unreachable unit fall through to backoff.
+    ``resolver`` looks hostnames up; the hub passes its mDNS-aware
+    one, which the session does not close. Closed by the hub once the
+    last unit stops.
+    """
+    connector = TCPConnector(
+        limit=0,
+        limit_per_host=WS_CONNECTOR_LIMIT_PER_HOST,
+        socket_factory=_socket_factory,
+        resolver=resolver,
+    )
+    return ClientSession(
+        connector=connector,
+        # Bounds the connect and the handshake; an upgraded WebSocket
+        # drops the read timeout and relies on heartbeats instead
+        timeout=ClientTimeout(
+            total=None,
+            connect=WS_CONNECT_TIMEOUT,
+            sock_read=WS_CONNECT_TIMEOUT,
+        ),
+    )
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+import logging
+from typing import Any, cast
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+_HOUR = timedelta(hours=1)
+
+
+def _hour_start(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+@dataclass(slots=True)
+class _HourBucket:
+    """Time-weighted mean and min/max of one statistic in one hour."""
+
+    start: datetime
+    # Seconds covered, and the integral of the value over them
+    duration: float = 0.0
+    total: float = 0.0
+    minimum: float | None = None
+    maximum: float | None = None
+
+    def hold(self, value: float, seconds: float) -> None:
+        """Count ``value`` as the state for ``seconds``."""
+        if seconds > 0:
+            self.duration += seconds
+            self.total += value * seconds
+
+    def observe(self, value: float) -> None:
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    @property
+    def mean(self) -> float | None:
+        if self.duration:
+            return self.total / self.duration
+        return self.minimum
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "start": self.start.isoformat(),
+            "duration": self.duration,
+            "total": self.total,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _HourBucket | None:
+        start = dt_util.parse_datetime(str(data.get("start")))
+        if start is None:
+            return None
+        return cls(
+            start=start,
+            duration=float(data.get("duration", 0.0)),
+            total=float(data.get("total", 0.0)),
+            minimum=data.get("minimum"),
+            maximum=data.get("maximum"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _StatisticSource:
+    statistic_id: str
+    name: str
+    unit: str | None
+
+
+class EcostreamStatistics:
+    """Aggregate measurement samples into hourly external statistics.
+
+    Used in recorder-light mode: sensors write their state sparsely and
+    the full-resolution samples end up here instead, imported once per
+    hour as mean/min/max via ``async_add_external_statistics``.
+
+    The mean is weighted by how long each value held, so it does not
+    depend on how often the coordinator pushes. Only finished hours are
+    imported; the running hour is stored on shutdown and continued
+    after a restart or reload, so it is imported once and complete.
+    """
+
+    def __init__(self, hass: HomeAssistant, host: str) -> None:
+        self.hass = hass
+        self._prefix = f"{DOMAIN}:{slugify(host)}"
+        self._sources: dict[str, _StatisticSource] = {}
+        self._buckets: dict[str, _HourBucket] = {}
+        # Latest sample per key, held until the next one
+        self._last: dict[str, tuple[float, datetime]] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.statistics.{slugify(host)}",
+        )
+        self._unsub_hourly: CALLBACK_TYPE | None = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def async_start(self) -> None:
+        """Restore the running hour and flush after every full hour."""
+        if self._unsub_hourly is not None:
+            return
+        self._unsub_hourly = async_track_utc_time_change(
+            self.hass, self._async_hourly_flush, minute=0, second=10
+        )
+        stored = await self._store.async_load() or {}
+        for key, data in stored.items():
+            if key in self._buckets or not isinstance(data, dict):
+                continue
+            bucket = _HourBucket.from_dict(cast(dict[str, Any], data))
+            if bucket is not None:
+                # Imported by the next sample or hourly flush, once the
+                # sensors have registered
+                self._buckets[key] = bucket
+
+    async def async_stop(self) -> None:
+        """Stop the hourly timer and store the running hour."""
+        if self._unsub_hourly is not None:
+            self._unsub_hourly()
+            self._unsub_hourly = None
+        self.async_flush()
+        # Downtime is a gap, not a continuation of the last value
+        self._last.clear()
+        await self._store.async_save(
+            {
+                key: bucket.as_dict()
+                for key, bucket in self._buckets.items()
+            }
+        )
+
+    # ------------------------------------------------------------------
+    # Samples
+    # ------------------------------------------------------------------
+
+    def statistic_id(self, key: str) -> str:
+        return f"{self._prefix}_{key}"
+
+    @callback
+    def async_register(
+        self, key: str, name: str, unit: str | None
+    ) -> None:
+        self._sources[key] = _StatisticSource(
+            statistic_id=self.statistic_id(key),
+            name=f"EcoStream {name}",
+            unit=unit,
+        )
+
+    @callback
+    def async_add_sample(
+        self, key: str, value: float, now: datetime | None = None
+    ) -> None:
+        if key not in self._sources:
+            return
+
+        now = now or dt_util.utcnow()
+        bucket = self._advance(key, now)
+        bucket.observe(value)
+        self._last[key] = (value, now)
+
+    def _advance(self, key: str, now: datetime) -> _HourBucket:
+        """Hold the last value until ``now``; import finished hours."""
+        hour = _hour_start(now)
+        last = self._last.get(key)
+        bucket = self._buckets.get(key)
+
+        if bucket is not None and bucket.start != hour:
+            end = bucket.start + _HOUR
+            if last is not None:
+                bucket.hold(last[0], (end - last[1]).total_seconds())
+            self._import(key, bucket)
+            bucket = None
+            # The value carries into the next hour only
+            if last is not None and end == hour:
+                last = (last[0], hour)
+            else:
+                last = None
+                self._last.pop(key, None)
+
+        if bucket is None:
+            bucket = self._buckets[key] = _HourBucket(start=hour)
+            if last is not None:
+                bucket.observe(last[0])
+
+        if last is not None:
+            bucket.hold(last[0], (now - last[1]).total_seconds())
+            self._last[key] = (last[0], now)
+        return bucket
+
+    # ------------------------------------------------------------------
+    # Import
+    # ------------------------------------------------------------------
+
+    @callback
+    def _async_hourly_flush(self, now: datetime) -> None:
+        self.async_flush(now=now)
+
+    @callback
+    def async_flush(self, now: datetime | None = None) -> None:
+        """Import every finished hour."""
+        now = now or dt_util.utcnow()
+        current_hour = _hour_start(now)
+
+        for key, bucket in list(self._buckets.items()):
+            if bucket.start >= current_hour:
+                continue
+            if key in self._last:
+                self._advance(key, now)
+            else:
+                self._import(key, bucket)
+                del self._buckets[key]
+
+    def _import(self, key: str, bucket: _HourBucket) -> None:
+        source = self._sources.get(key)
+        mean, low, high = bucket.mean, bucket.minimum, bucket.maximum
+        if (
+            source is None
+            or mean is None
+            or low is None
+            or high is None
+        ):
+            return
+
+        metadata = StatisticMetaData(
+            has_sum=False,
+            mean_type=StatisticMeanType.ARITHMETIC,
+            name=source.name,
+            source=DOMAIN,
+            statistic_id=source.statistic_id,
+            unit_class=None,
+            unit_of_measurement=source.unit,
+        )
+        data = StatisticData(
+            start=bucket.start,
+            mean=mean,
+            min=low,
+            max=high,
+        )
+
+        try:
+            async_add_external_statistics(self.hass, metadata, [data])
+        except Exception as err:
+            _LOGGER.warning(
+                "Failed to import EcoStream statistics for %s: %s",
+                source.statistic_id,
+                err,
+            )
+            return
+
+        _LOGGER.debug(
+            "Imported EcoStream statistics %s for %s (%.0f s covered)",
+            source.statistic_id,
+            bucket.start.isoformat(),
+            bucket.duration,
+        )
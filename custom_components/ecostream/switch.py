@@ -5,7 +5,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 import inspect
 import logging
 from typing import Any
@@ -24,6 +23,7 @@ from .const import (
     PRESET_MID,
 )
 from .coordinator import EcostreamDataUpdateCoordinator
+from .entity import EcostreamDataEntity
 
 _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 0
@@ -61,7 +61,7 @@ async def async_setup_entry(
 
 
 class EcostreamBaseEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
-    CoordinatorEntity[EcostreamDataUpdateCoordinator],
+    EcostreamDataEntity,
     SwitchEntity,
 ):
     """Shared device info for EcoStream entities."""
@@ -114,6 +114,7 @@ class EcostreamBaseEntity(  # pyright: ignore[reportIncompatibleVariableOverride
 class EcostreamConfigSwitch(EcostreamBaseEntity):
     _config_key: str
     _log_action: str
+    _data_section = "config"
 
     def __init__(
         self,
@@ -231,22 +232,12 @@ class EcostreamBoostSwitch(EcostreamBaseEntity):
     ) -> None:
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{self._entry.entry_id}_boost"
-        status = self._get_status()
-        val = status.get("override_set_time_left")
-        try:
-            self._attr_is_on = val is not None and int(float(val)) > 0
-        except (TypeError, ValueError):
-            self._attr_is_on = False
+        self._attr_is_on = self.coordinator.override.active
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Update UI wanneer nieuwe EcoStream data binnenkomt."""
-        status = self._get_status()
-        val = status.get("override_set_time_left")
-        try:
-            self._attr_is_on = val is not None and int(float(val)) > 0
-        except (TypeError, ValueError):
-            self._attr_is_on = False
+        """Update UI via de lokale override-countdown van de coordinator."""
+        self._attr_is_on = self.coordinator.override.active
         self.async_write_ha_state()
 
     # ------------------------------
@@ -410,32 +401,10 @@ class EcostreamPresetSwitch(EcostreamBaseEntity):
         self._attr_is_on = self._is_active()
 
     def _get_setpoint(self) -> float | None:
-        config = self._get_config()
-        key = {
-            PRESET_LOW: "setpoint_low",
-            PRESET_MID: "setpoint_mid",
-            PRESET_HIGH: "setpoint_high",
-        }.get(self._preset)
-        if key is None:
-            return None
-        try:
-            value = config.get(key)
-            if value is None:
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
+        return self.coordinator.presets.setpoint(self._preset)
 
     def _is_active(self) -> bool:
-        qset_raw = self._get_status().get("qset")
-        setpoint = self._get_setpoint()
-        if qset_raw is None or setpoint is None:
-            return False
-        try:
-            qset = float(qset_raw)
-        except (TypeError, ValueError):
-            return False
-        return abs(qset - setpoint) <= 0.1
+        return self.coordinator.presets.is_active(self._preset)
 
     @callback
     def _handle_coordinator_update(self) -> None:
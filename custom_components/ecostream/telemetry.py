@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import Any
+
+from .timer_wheel import Clock
+
+STATE_CONNECTING = "connecting"
+STATE_CONNECTED = "connected"
+STATE_DISCONNECTED = "disconnected"
+STATE_STOPPED = "stopped"
+
+REASON_CLOSED = "closed"
+REASON_ERROR = "error"
+REASON_STALE = "stale"
+REASON_STOPPED = "stopped"
+REASON_CONNECTION_ERROR = "connection_error"
+REASON_UNEXPECTED = "unexpected"
+DISCONNECT_REASONS = (
+    REASON_CLOSED,
+    REASON_ERROR,
+    REASON_STALE,
+    REASON_STOPPED,
+    REASON_CONNECTION_ERROR,
+    REASON_UNEXPECTED,
+)
+
+# Characters of the last frame shown in diagnostics
+LAST_FRAME_PREVIEW_CHARS = 200
+
+
+class EcostreamConnectionTelemetry:
+    """Counters describing one unit's WebSocket connection.
+
+    Every field is a plain counter or timestamp updated in place, so
+    recording a frame never allocates; the last frame is kept by
+    reference only. ``bytes_in`` / ``bytes_out`` count characters of
+    the text frames, which equals bytes for the unit's ASCII JSON.
+    """
+
+    __slots__ = (
+        "_clock",
+        "bytes_in",
+        "bytes_out",
+        "connect_failures",
+        "connected_seconds",
+        "connected_since",
+        "connects",
+        "decode_errors",
+        "disconnects",
+        "frames_in",
+        "frames_out",
+        "last_disconnect_reason",
+        "last_frame",
+        "last_frame_ts",
+        "reasons",
+        "state",
+    )
+
+    def __init__(self, clock: Clock) -> None:
+        self._clock = clock
+        self.state = STATE_DISCONNECTED
+        self.connects = 0
+        self.connect_failures = 0
+        self.disconnects = 0
+        self.reasons: dict[str, int] = dict.fromkeys(
+            DISCONNECT_REASONS, 0
+        )
+        self.last_disconnect_reason: str | None = None
+        self.connected_since: float | None = None
+        # Time spent connected in earlier connections
+        self.connected_seconds = 0.0
+        self.frames_in = 0
+        self.bytes_in = 0
+        self.frames_out = 0
+        self.bytes_out = 0
+        self.decode_errors = 0
+        self.last_frame: str | None = None
+        self.last_frame_ts: float | None = None
+
+    @property
+    def reconnects(self) -> int:
+        return max(0, self.connects - 1)
+
+    def connecting(self) -> None:
+        self.state = STATE_CONNECTING
+
+    def connected(self, now: float) -> None:
+        self.state = STATE_CONNECTED
+        self.connects += 1
+        self.connected_since = now
+
+    def disconnected(self, reason: str, stopping: bool) -> None:
+        """Record the end of a connection or of a failed attempt."""
+        if self.connected_since is not None:
+            self.connected_seconds += (
+                self._clock() - self.connected_since
+            )
+            self.connected_since = None
+            self.disconnects += 1
+            self.reasons[reason] += 1
+            self.last_disconnect_reason = reason
+        elif self.state == STATE_CONNECTING and not stopping:
+            self.connect_failures += 1
+        self.state = STATE_STOPPED if stopping else STATE_DISCONNECTED
+
+    def frame_in(self, data: str, now: float) -> None:
+        self.frames_in += 1
+        self.bytes_in += len(data)
+        self.last_frame = data
+        self.last_frame_ts = now
+
+    def frame_out(self, size: int) -> None:
+        self.frames_out += 1
+        self.bytes_out += size
+
+    def last_frame_preview(self) -> str | None:
+        frame = self.last_frame
+        if frame is None:
+            return None
+        return frame[:LAST_FRAME_PREVIEW_CHARS]
+
+    def as_dict(self) -> dict[str, Any]:
+        now = self._clock()
+        connected_seconds = self.connected_seconds
+        if self.connected_since is not None:
+            connected_seconds += now - self.connected_since
+        return {
+            "state": self.state,
+            "connects": self.connects,
+            "connect_failures": self.connect_failures,
+            "disconnects": self.disconnects,
+            "disconnect_reasons": dict(self.reasons),
+            "last_disconnect_reason": self.last_disconnect_reason,
+            "current_connection_seconds": (
+                round(now - self.connected_since, 1)
+                if self.connected_since is not None
+                else None
+            ),
+            "connected_seconds": round(connected_seconds, 1),
+            "frames_in": self.frames_in,
+            "bytes_in": self.bytes_in,
+            "frames_out": self.frames_out,
+            "bytes_out": self.bytes_out,
+            "decode_errors": self.decode_errors,
+            "last_frame_age_seconds": (
+                round(now - self.last_frame_ts, 1)
+                if self.last_frame_ts is not None
+                else None
+            ),
+        }
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import math
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+WHEEL_RESOLUTION = 1.0
+WHEEL_SLOTS = 64
+
+# Monotonic time source in seconds. In production this is the event
+# loop's ``loop.time``, the same clock the wheel arms its timers on, so
+# intervals and deadlines are immune to wall-clock steps.
+Clock = Callable[[], float]
+
+
+class WheelTimer:
+    """Handle for a deadline registered with ``EcostreamTimerWheel``."""
+
+    __slots__ = ("_args", "_callback", "_wheel", "active", "tick")
+
+    def __init__(
+        self,
+        wheel: EcostreamTimerWheel,
+        tick: int,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        self._wheel = wheel
+        self._callback = callback
+        self._args = args
+        self.tick = tick
+        self.active = True
+
+    def cancel(self) -> None:
+        if self.active:
+            self.active = False
+            self._wheel._live -= 1  # pyright: ignore[reportPrivateUsage]
+
+    def _run(self) -> None:
+        try:
+            self._callback(*self._args)
+        except Exception:
+            _LOGGER.exception("Error in EcoStream timer callback")
+
+
+class EcostreamTimerWheel:
+    """Hashed timer wheel shared by every EcoStream connection.
+
+    Deadlines are rounded up to ``resolution`` and hashed into ``slots``
+    buckets by tick number. Only one loop timer is armed at a time, for
+    the next occupied slot, so all deadlines that land in the same tick
+    fire from a single event-loop wake-up regardless of device count.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        resolution: float = WHEEL_RESOLUTION,
+        slots: int = WHEEL_SLOTS,
+    ) -> None:
+        self._loop = loop
+        self._resolution = resolution
+        self._slots: list[list[WheelTimer]] = [[] for _ in range(slots)]
+        self._tick = int(loop.time() // resolution)
+        self._live = 0
+
+        self._handle: asyncio.TimerHandle | None = None
+        self._wake_tick: int | None = None
+        self._firing = False
+
+        self.wakeups = 0
+
+    def __len__(self) -> int:
+        """Number of timers still pending."""
+        return self._live
+
+    def call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> WheelTimer:
+        """Run ``callback(*args)`` at or shortly after loop time ``when``."""
+        tick = max(math.ceil(when / self._resolution), self._tick + 1)
+        timer = WheelTimer(self, tick, callback, args)
+        self._slots[tick % len(self._slots)].append(timer)
+        self._live += 1
+        if not self._firing and (
+            self._wake_tick is None or tick < self._wake_tick
+        ):
+            self._arm(tick)
+        return timer
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> WheelTimer:
+        """Run ``callback(*args)`` roughly ``delay`` seconds from now."""
+        return self.call_at(self._loop.time() + delay, callback, *args)
+
+    def stop(self) -> None:
+        """Drop every pending deadline and disarm the loop timer."""
+        for slot in self._slots:
+            for timer in slot:
+                timer.active = False
+            slot.clear()
+        self._live = 0
+        self._disarm()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _arm(self, tick: int) -> None:
+        self._disarm()
+        self._wake_tick = tick
+        self._handle = self._loop.call_at(
+            tick * self._resolution, self._on_wake
+        )
+
+    def _disarm(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._wake_tick = None
+
+    def _on_wake(self) -> None:
+        self.wakeups += 1
+        target = self._wake_tick or self._tick + 1
+        self._handle = None
+        self._wake_tick = None
+
+        size = len(self._slots)
+        now_tick = max(
+            int(self._loop.time() // self._resolution), target
+        )
+        # After a long stall every slot is visited once at most
+        first = max(self._tick + 1, now_tick - size + 1)
+
+        due: list[WheelTimer] = []
+        for tick in range(first, now_tick + 1):
+            slot = self._slots[tick % size]
+            if not slot:
+                continue
+            keep: list[WheelTimer] = []
+            for timer in slot:
+                if not timer.active:
+                    continue
+                if timer.tick <= now_tick:
+                    due.append(timer)
+                else:
+                    keep.append(timer)
+            slot[:] = keep
+        self._tick = now_tick
+
+        self._firing = True
+        try:
+            for timer in due:
+                # An earlier callback may have cancelled this one
+                if not timer.active:
+                    continue
+                timer.active = False
+                self._live -= 1
+                timer._run()  # pyright: ignore[reportPrivateUsage]
+        finally:
+            self._firing = False
+
+        self._arm_next()
+
+    def _arm_next(self) -> None:
+        if self._wake_tick is not None or self._live <= 0:
+            return
+        size = len(self._slots)
+        for offset in range(1, size + 1):
+            tick = self._tick + offset
+            slot = self._slots[tick % size]
+            if any(timer.active for timer in slot):
+                # May be a later round of this slot; waking early is safe
+                self._arm(tick)
+                return
@@ -1,29 +1,110 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections import deque
+from collections.abc import Awaitable, Callable, Set as AbstractSet
+from dataclasses import dataclass
+from enum import IntEnum
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.issue_registry import IssueSeverity
+from homeassistant.util.network import is_ipv6_address
+import itertools
 import json
 import logging
 import time
 from typing import Any, cast
 
-from aiohttp import ClientError, WSMsgType
+from aiohttp import ClientError, ClientSession, WSMsgType
 
 from .const import (
     DOMAIN,
     WS_HEARTBEAT_INTERVAL,
     WS_RECONNECT_INITIAL_DELAY,
     WS_RECONNECT_MAX_DELAY,
+    WS_SEND_TIMEOUT,
     WS_STALE_TIMEOUT,
 )
+from .metrics import EcostreamMetrics
+from .outbound import EcostreamOutboundQueue
+from .rate_limit import EcostreamTokenBucket
+from .resolver import EcostreamHostResolver
+from .telemetry import (
+    REASON_CLOSED,
+    REASON_CONNECTION_ERROR,
+    REASON_ERROR,
+    REASON_STALE,
+    REASON_STOPPED,
+    REASON_UNEXPECTED,
+    EcostreamConnectionTelemetry,
+)
+from .timer_wheel import Clock
 
 _LOGGER = logging.getLogger(__name__)
 
 MessageCallback = Callable[[dict[str, Any]], Awaitable[None]]
+FrameRecorder = Callable[[str], None]
+
+
+def _ws_url(address: str) -> str:
+    if is_ipv6_address(address):
+        return f"ws://[{address}]/"
+    return f"ws://{address}/"
+
+
+class WritePriority(IntEnum):
+    """Writer lanes, served lowest value first."""
+
+    USER = 0
+    AUTOMATION = 1
+    HOUSEKEEPING = 2
+
+
+@dataclass(slots=True)
+class _Write:
+    payload: dict[str, Any]
+    ttl: float | None
+    done: asyncio.Future[None]
+    # Submit order, across all lanes
+    seq: int
+    heartbeat: bool = False
+    # Runs once the payload is written to the socket
+    on_sent: Callable[[], None] | None = None
+    sent: bool = False
+
+    def config(self) -> dict[str, Any] | None:
+        """Config of a pending config-only write."""
+        config = self.payload.get("config")
+        if (
+            self.done.done()
+            or len(self.payload) != 1
+            or not isinstance(config, dict)
+        ):
+            return None
+        return cast(dict[str, Any], config)
+
+    def drop_keys(self, keys: AbstractSet[str]) -> int:
+        """Stop sending ``keys``; completes unsent if none are left.
+
+        Returns how many of them the write carried.
+        """
+        config = self.config()
+        if config is None:
+            return 0
+        dropped = keys & config.keys()
+        if not dropped:
+            return 0
+        remaining = {
+            key: value
+            for key, value in config.items()
+            if key not in dropped
+        }
+        if remaining:
+            self.payload = {"config": remaining}
+        else:
+            self.done.set_result(None)
+        return len(dropped)
 
 
 class EcostreamWebsocket:
@@ -34,6 +115,14 @@ class EcostreamWebsocket:
         hass: HomeAssistant,
         host: str,
         message_callback: MessageCallback,
+        frame_recorder: FrameRecorder | None = None,
+        metrics: EcostreamMetrics | None = None,
+        clock: Clock | None = None,
+        outbound: EcostreamOutboundQueue | None = None,
+        limiter: EcostreamTokenBucket | None = None,
+        telemetry: EcostreamConnectionTelemetry | None = None,
+        resolver: EcostreamHostResolver | None = None,
+        session: ClientSession | None = None,
     ) -> None:
         """Initialize the EcoStream WebSocket client.
 
@@ -41,6 +130,15 @@ class EcostreamWebsocket:
             hass: Home Assistant instance.
             host: The hostname or IP address of the EcoStream device.
             message_callback: Async callback function to process received messages.
+            frame_recorder: Optional callback receiving every raw text frame.
+            metrics: Optional hot-path latency histograms to record into.
+            clock: Monotonic time source; defaults to the event loop clock.
+            outbound: Queue for commands sent while disconnected.
+            limiter: Token bucket limiting commands written to the unit.
+            telemetry: Connection counters to update.
+            resolver: Cached address of ``host`` to connect to.
+            session: Client session to connect through; defaults to
+                Home Assistant's shared session.
 
         """
         self._hass = hass
@@ -48,17 +146,43 @@ class EcostreamWebsocket:
         self._host = host
         self._ws_url = f"ws://{self._host}/"
 
-        self._session = async_get_clientsession(hass)
+        self._session = session or async_get_clientsession(hass)
         self._message_callback = message_callback
+        self._frame_recorder = frame_recorder
+        self._metrics = metrics
+        self._clock: Clock = clock or hass.loop.time
+        self._outbound = outbound or EcostreamOutboundQueue(self._clock)
+        self._limiter = limiter or EcostreamTokenBucket(self._clock)
+        self.telemetry = telemetry or EcostreamConnectionTelemetry(
+            self._clock
+        )
+        self._resolver = resolver or EcostreamHostResolver(
+            hass, host, self._clock
+        )
 
         self._task: asyncio.Task[None] | None = None
         self._ws = None
         self._stopping = False
 
+        # The only task writing to the socket, running while connected;
+        # it replays the outbound queue before serving the lanes
+        self._writer: asyncio.Task[None] | None = None
+        self._lanes: tuple[deque[_Write], ...] = tuple(
+            deque() for _ in WritePriority
+        )
+        self._write_ready = asyncio.Event()
+        self._inflight: _Write | None = None
+        self._write_seq = itertools.count()
+        self._last_write_ts: float = 0.0
+
         self._last_message_ts: float | None = None
+        self._last_heartbeat_ts: float = 0.0
         self._has_received_payload = False
         self._stale_logged = False
         self._logged_unavailable = False
+        # Why the current connection is being closed, when known
+        # before the read loop sees it
+        self._close_reason: str | None = None
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -99,20 +223,279 @@ class EcostreamWebsocket:
     # Sending
     # ------------------------------------------------------------------
 
-    async def send_json(self, payload: dict[str, Any]) -> None:
-        """Send JSON to the EcoStream device."""
-        if not self._ws:
+    async def send_json(
+        self,
+        payload: dict[str, Any],
+        ttl: float | None = None,
+        priority: WritePriority = WritePriority.USER,
+        on_sent: Callable[[], None] | None = None,
+    ) -> bool:
+        """Send JSON to the EcoStream device.
+
+        The payload goes out through the writer in ``priority``'s lane;
+        the caller waits at most ``WS_SEND_TIMEOUT`` seconds for it, so
+        a command held back by the rate limit does not block a service
+        call. Config commands are queued while the socket is down and
+        replayed on reconnect unless older than ``ttl`` seconds.
+
+        Returns whether the payload was written before returning.
+        ``on_sent`` runs when it is written, also when that happens
+        later, from the lanes or the replay; it never runs for a
+        command that expires or is superseded entirely.
+        """
+        if self._writer is None:
+            if self._queue(payload, ttl, on_sent):
+                return False
             _LOGGER.warning(
                 "Cannot send JSON to EcoStream; WebSocket not connected (%s)",
                 self._host,
             )
+            return False
+
+        return await self._submit(
+            payload, ttl, priority, on_sent=on_sent
+        )
+
+    def _queue(
+        self,
+        payload: dict[str, Any],
+        ttl: float | None,
+        on_sent: Callable[[], None] | None = None,
+    ) -> bool:
+        config = payload.get("config")
+        if len(payload) != 1 or not isinstance(config, dict):
+            return False
+        command = cast(dict[str, Any], config)
+        self._outbound.push(command, ttl, on_sent)
+        _LOGGER.debug(
+            "Queued EcoStream command for %s until reconnect: %s",
+            self._host,
+            command,
+        )
+        return True
+
+    async def _replay_outbound(self, ws: Any) -> None:
+        """Send commands queued while disconnected, oldest first."""
+        outbound = self._outbound
+        if not len(outbound):
+            return
+        replayed = 0
+        # Runs in the writer before it serves the lanes, so sends made
+        # meanwhile wait behind the older commands
+        while (command := outbound.pop()) is not None:
+            delay = self._limiter.take()
+            if delay:
+                outbound.restore(command)
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await self._send_text(
+                    ws, json.dumps({"config": command.config})
+                )
+            except BaseException:
+                # Also when cancelled: kept for the next connection
+                outbound.restore(command)
+                raise
+            if command.on_sent is not None:
+                command.on_sent()
+            replayed += 1
+        if replayed:
+            _LOGGER.info(
+                "Replayed %d queued EcoStream command(s) to %s",
+                replayed,
+                self._host,
+            )
+
+    async def _submit(
+        self,
+        payload: dict[str, Any],
+        ttl: float | None,
+        priority: WritePriority,
+        heartbeat: bool = False,
+        on_sent: Callable[[], None] | None = None,
+    ) -> bool:
+        """Queue ``payload`` in its lane; whether it was written in time."""
+        write = _Write(
+            payload,
+            ttl,
+            asyncio.get_running_loop().create_future(),
+            next(self._write_seq),
+            heartbeat,
+            on_sent,
+        )
+        self._supersede(write, priority)
+        self._lanes[priority].append(write)
+        self._write_ready.set()
+        try:
+            async with asyncio.timeout(WS_SEND_TIMEOUT):
+                # Shielded: the write stays queued after a timeout
+                await asyncio.shield(write.done)
+        except TimeoutError:
+            _LOGGER.debug(
+                "EcoStream write to %s still queued after %ss: %s",
+                self._host,
+                WS_SEND_TIMEOUT,
+                payload,
+            )
+        return write.sent
+
+    def _supersede(
+        self, write: _Write, priority: WritePriority
+    ) -> None:
+        """Drop ``write``'s config keys from pending writes in other lanes.
+
+        Lanes are served by priority, so an older automation value
+        still queued would otherwise be sent after a newer user value
+        and overwrite it.
+        """
+        config = write.config()
+        if config is None:
             return
+        for lane_priority, lane in zip(
+            WritePriority, self._lanes, strict=True
+        ):
+            if lane_priority is priority:
+                continue
+            for pending in lane:
+                self._limiter.coalesced += pending.drop_keys(
+                    config.keys()
+                )
+
+    def _next_lane(self) -> deque[_Write] | None:
+        for lane in self._lanes:
+            while lane and lane[0].done.done():
+                lane.popleft()
+            if lane:
+                return lane
+        return None
 
+    async def _async_writer(self, ws: Any) -> None:
+        """Write queued frames one at a time, highest lane first.
+
+        Commands queued while disconnected are replayed first. This
+        runs beside the read loop, so a throttled replay never delays
+        the device's frames.
+        """
         try:
-            await self._ws.send_json(payload)
-            _LOGGER.debug("Sent JSON to EcoStream %s: %s", self._host, payload)
+            await self._replay_outbound(ws)
         except Exception as err:
-            _LOGGER.error("Failed to send JSON to EcoStream %s: %s", self._host, err)
+            _LOGGER.warning(
+                "Failed to replay queued EcoStream commands to %s: %s",
+                self._host,
+                err,
+            )
+            # The read loop sees the close and reconnects
+            self._close_reason = REASON_ERROR
+            await ws.close()
+            return
+        while True:
+            lane = self._next_lane()
+            if lane is None:
+                self._write_ready.clear()
+                await self._write_ready.wait()
+                continue
+            write = lane[0]
+            if not write.heartbeat:
+                delay = self._limiter.take()
+                if delay:
+                    self._coalesce_lanes()
+                    await asyncio.sleep(delay)
+                    continue
+            lane.popleft()
+            self._inflight = write
+            await self._write(ws, write)
+            self._inflight = None
+
+    def _coalesce_lanes(self) -> None:
+        """Drop config values that a newer write in any lane sets.
+
+        Recency follows submit order, not lanes. A write left without
+        keys completes without being sent.
+        """
+        pending = sorted(
+            (write for lane in self._lanes for write in lane),
+            key=lambda write: write.seq,
+            reverse=True,
+        )
+        newer: set[str] = set()
+        for write in pending:
+            config = write.config()
+            if config is None:
+                continue
+            keys = config.keys()
+            superseded = newer & keys
+            newer.update(keys)
+            if superseded:
+                self._limiter.coalesced += write.drop_keys(superseded)
+
+    async def _write(self, ws: Any, write: _Write) -> None:
+        try:
+            await self._send(ws, write)
+        except Exception as err:
+            if write.heartbeat:
+                _LOGGER.debug(
+                    "Failed to send EcoStream heartbeat → %s",
+                    self._host,
+                    exc_info=True,
+                )
+            else:
+                _LOGGER.error(
+                    "Failed to send JSON to EcoStream %s: %s",
+                    self._host,
+                    err,
+                )
+                self._queue(write.payload, write.ttl, write.on_sent)
+        else:
+            write.sent = True
+            if write.on_sent is not None:
+                write.on_sent()
+        # Left pending when cancelled, so it is queued for replay
+        if not write.done.done():
+            write.done.set_result(None)
+
+    async def _send(self, ws: Any, write: _Write) -> None:
+        if not write.heartbeat:
+            await self._send_text(ws, json.dumps(write.payload))
+            _LOGGER.debug(
+                "Sent JSON to EcoStream %s: %s",
+                self._host,
+                write.payload,
+            )
+            return
+
+        if self._clock() - self._last_write_ts < WS_HEARTBEAT_INTERVAL:
+            # Real traffic in this window kept the link busy
+            return
+        await ws.send_str("{}")
+        self.telemetry.frame_out(2)
+        _LOGGER.debug("EcoStream heartbeat → %s", self._host)
+
+    async def _send_text(self, ws: Any, text: str) -> None:
+        await ws.send_str(text)
+        self._last_write_ts = self._clock()
+        self.telemetry.frame_out(len(text))
+
+    async def _async_stop_writer(self) -> None:
+        """Stop the writer and queue whatever it had not sent."""
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        writer.cancel()
+        await asyncio.wait([writer])
+
+        pending: list[_Write] = []
+        if self._inflight is not None:
+            pending.append(self._inflight)
+            self._inflight = None
+        for lane in self._lanes:
+            pending.extend(lane)
+            lane.clear()
+        for write in pending:
+            if write.done.done():
+                continue
+            if not write.heartbeat:
+                self._queue(write.payload, write.ttl, write.on_sent)
+            write.done.set_result(None)
 
     # ------------------------------------------------------------------
     # Main worker
@@ -122,8 +505,17 @@ class EcostreamWebsocket:
         """Persistent WS loop with instant shutdown and safe timeouts."""
         backoff = WS_RECONNECT_INITIAL_DELAY
 
+        telemetry = self.telemetry
+
         while not self._stopping:
+            reason = REASON_STOPPED
+            self._close_reason = None
+            connected = False
+            telemetry.connecting()
             try:
+                self._ws_url = _ws_url(
+                    await self._resolver.async_resolve()
+                )
                 if not self._logged_unavailable:
                     _LOGGER.info("Connecting to EcoStream WS at %s", self._ws_url)
 
@@ -132,7 +524,9 @@ class EcostreamWebsocket:
                     heartbeat=None,  # we manage heartbeats manually
                 ) as ws:
                     self._ws = ws
-                    self._last_message_ts = time.time()
+                    connected = True
+                    self._last_message_ts = self._clock()
+                    telemetry.connected(self._last_message_ts)
                     self._has_received_payload = False
                     self._stale_logged = False
                     backoff = WS_RECONNECT_INITIAL_DELAY
@@ -144,71 +538,75 @@ class EcostreamWebsocket:
                         _LOGGER.info("EcoStream WebSocket connected: %s", self._ws_url)
                     self._logged_unavailable = False
 
+                    # Replays commands queued while down, then
+                    # serves new writes; reading starts right away
+                    self._writer = asyncio.create_task(
+                        self._async_writer(ws),
+                        name=f"ecostream_ws_writer_{self._host}",
+                    )
+
                     # ------------------------------
                     # READ LOOP
                     # ------------------------------
-                    while True:
-                        if self._stopping:
-                            break
-
-                        # Turn coroutine into a Task (required for asyncio.wait)
-                        receive_task = asyncio.create_task(ws.receive())
-
-                        try:
-                            done, _ = await asyncio.wait(
-                                {receive_task},
-                                timeout=WS_HEARTBEAT_INTERVAL,
-                                return_when=asyncio.FIRST_COMPLETED,
-                            )
-                        except asyncio.CancelledError:
-                            receive_task.cancel()
-                            raise
+                    # Heartbeats and stale checks are driven by the
+                    # shared hub timer, so this only waits for frames.
+                    while not self._stopping:
+                        msg = await ws.receive()
 
                         if self._stopping:
-                            receive_task.cancel()
                             break
 
-                        # TIMEOUT → send heartbeat & stale-check
-                        if not done:
-                            receive_task.cancel()
-                            await self._send_heartbeat()
-                            if not self._stopping:
-                                self._check_stale()
-                            continue
-
-                        # MESSAGE RECEIVED
-                        msg = receive_task.result()
-
                         if msg.type == WSMsgType.TEXT:
-                            self._last_message_ts = time.time()
+                            received_ns = time.perf_counter_ns()
+                            metrics = self._metrics
+                            if metrics is not None:
+                                metrics.sample_loop_lag(
+                                    self._hass.loop, received_ns
+                                )
+                            self._last_message_ts = self._clock()
+                            telemetry.frame_in(
+                                msg.data, self._last_message_ts
+                            )
                             self._has_received_payload = True
                             self._stale_logged = False
-                            if not self._stopping:
-                                await self._handle_text(msg.data)
+                            if self._frame_recorder is not None:
+                                self._frame_recorder(msg.data)
+                            await self._handle_text(msg.data)
+                            if metrics is not None:
+                                metrics.receive.record(
+                                    time.perf_counter_ns() - received_ns
+                                )
 
                         elif msg.type == WSMsgType.BINARY:
                             _LOGGER.debug("Ignoring binary WS message from EcoStream")
 
-                        elif msg.type in (WSMsgType.CLOSE, WSMsgType.CLOSING):
+                        elif msg.type in (
+                            WSMsgType.CLOSE,
+                            WSMsgType.CLOSING,
+                            WSMsgType.CLOSED,
+                        ):
                             _LOGGER.warning(
                                 "EcoStream WS closing (type=%s)", msg.type
                             )
+                            reason = self._close_reason or REASON_CLOSED
                             break
 
                         elif msg.type == WSMsgType.ERROR:
                             _LOGGER.error(
                                 "EcoStream WebSocket error: %s", ws.exception()
                             )
+                            reason = REASON_ERROR
                             break
 
-                        if not self._stopping:
-                            self._check_stale()
-
             except asyncio.CancelledError:
                 _LOGGER.debug("EcoStream WS loop cancelled for %s", self._host)
                 break
 
             except (ClientError, OSError) as err:
+                reason = REASON_CONNECTION_ERROR
+                if not connected:
+                    # The unit may have a new address
+                    self._resolver.invalidate()
                 if not self._stopping:
                     if not self._logged_unavailable:
                         _LOGGER.warning(
@@ -227,6 +625,7 @@ class EcostreamWebsocket:
                         )
 
             except Exception as err:
+                reason = REASON_UNEXPECTED
                 if not self._stopping:
                     if not self._logged_unavailable:
                         _LOGGER.exception("Unexpected error in EcoStream WS loop: %s", err)
@@ -243,6 +642,8 @@ class EcostreamWebsocket:
 
             finally:
                 self._ws = None
+                await self._async_stop_writer()
+                telemetry.disconnected(reason, self._stopping)
 
             if self._stopping:
                 break
@@ -255,19 +656,31 @@ class EcostreamWebsocket:
     # Heartbeat / stale checking
     # ------------------------------------------------------------------
 
-    async def _send_heartbeat(self) -> None:
-        """Send lightweight application-level heartbeat."""
-        if self._stopping or not self._ws:
+    def heartbeat_due(self, now: float) -> bool:
+        """Whether the link has been silent for a heartbeat interval."""
+        if self._stopping or self._writer is None:
+            return False
+        last_activity = max(
+            self._last_message_ts or 0.0,
+            self._last_heartbeat_ts,
+            self._last_write_ts,
+        )
+        return now - last_activity >= WS_HEARTBEAT_INTERVAL
+
+    async def async_send_heartbeat(self) -> None:
+        """Send lightweight application-level heartbeat.
+
+        It waits in the housekeeping lane and is dropped if other
+        frames went out within the heartbeat interval meanwhile.
+        """
+        if self._stopping or self._writer is None:
             return
-        try:
-            await self._ws.send_str("{}")
-            _LOGGER.debug("EcoStream heartbeat → %s", self._host)
-        except Exception:
-            _LOGGER.debug(
-                "Failed to send EcoStream heartbeat → %s", self._host, exc_info=True
-            )
+        self._last_heartbeat_ts = self._clock()
+        await self._submit(
+            {}, None, WritePriority.HOUSEKEEPING, heartbeat=True
+        )
 
-    def _check_stale(self) -> None:
+    def check_stale(self) -> None:
         """Reconnect if too long without data — only after first payload."""
         if self._stopping:
             return
@@ -277,7 +690,7 @@ class EcostreamWebsocket:
         if not self._ws or not self._last_message_ts:
             return
 
-        elapsed = time.time() - self._last_message_ts
+        elapsed = self._clock() - self._last_message_ts
         if elapsed > WS_STALE_TIMEOUT:
             if not self._stale_logged:
                 _LOGGER.warning(
@@ -289,6 +702,7 @@ class EcostreamWebsocket:
 
             ws = self._ws
             if ws and not ws.closed:
+                self._close_reason = REASON_STALE
                 # Closing triggers exit from read-loop and reconnect in _run
                 self._hass.loop.create_task(ws.close())
 
@@ -297,11 +711,15 @@ class EcostreamWebsocket:
     # ------------------------------------------------------------------
 
     async def _handle_text(self, data: str) -> None:
+        metrics = self._metrics
+        start_ns = time.perf_counter_ns()
         try:
             payload = json.loads(data)
         except json.JSONDecodeError:
+            self.telemetry.decode_errors += 1
             _LOGGER.warning("Invalid JSON from EcoStream: %s", data)
             return
+        decoded_ns = time.perf_counter_ns()
 
         if not isinstance(payload, dict):
             _LOGGER.debug("Ignoring non-dict JSON from EcoStream: %s", payload)
@@ -316,3 +734,6 @@ class EcostreamWebsocket:
             _LOGGER.exception(
                 "Error while processing EcoStream payload in coordinator: %s", err
             )
+        if metrics is not None:
+            metrics.decode.record(decoded_ns - start_ns, decoded_ns)
+            metrics.process.record(time.perf_counter_ns() - decoded_ns)
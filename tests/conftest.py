@@ -1,9 +1,11 @@
 """Global fixtures for ecostream integration."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
 
+from .simulator import EcostreamSimulator
+
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
@@ -13,3 +15,21 @@ def auto_enable_custom_integrations(
 ) -> Generator[None]:
     """Enable custom integrations for all tests."""
     yield
+
+
+@pytest.fixture
+async def ecostream_simulator(
+    socket_enabled: None,
+) -> AsyncGenerator[EcostreamSimulator]:
+    """Simulated EcoStream unit on a random localhost port.
+
+    Frames are sped up so tests see several status frames per second.
+    Depends on ``socket_enabled`` since the test harness blocks
+    sockets by default.
+    """
+    simulator = EcostreamSimulator(
+        status_interval=0.05, slow_interval=0.2, seed=0
+    )
+    await simulator.start()
+    yield simulator
+    await simulator.stop()
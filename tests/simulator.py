@@ -0,0 +1,361 @@
+"""Local EcoStream device simulator for load and soak testing.
+
+Speaks the unit's WebSocket JSON protocol on ``ws://<host>:<port>/``:
+a full ``status``/``config``/``system``/``comm_wifi`` snapshot on
+connect, ``status`` frames at ``status_interval`` and the slow sections
+at ``slow_interval``. ``{"config": ...}`` writes are applied and echoed
+back; ``"{}"`` heartbeats are accepted silently.
+
+Faults can be injected at runtime through ``SimulatorFaults``: stalls
+(socket open, no frames), half-open sockets (nothing read or sent,
+never closed), malformed JSON and slow write acknowledgements.
+
+Use the ``ecostream_simulator`` fixture from ``conftest.py`` in tests,
+or run a fleet from the command line:
+
+    python -m tests.simulator --devices 50 --port 8100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+from dataclasses import dataclass
+import json
+import logging
+import random
+import time
+from typing import Any, cast
+
+from aiohttp import WSMsgType, web
+
+_LOGGER = logging.getLogger(__name__)
+
+MALFORMED_FRAME = '{"status": {"qset": '
+
+_TEMPERATURE_KEYS = (
+    "sensor_temp_eha",
+    "sensor_temp_eta",
+    "sensor_temp_oda",
+)
+
+
+@dataclass(slots=True)
+class SimulatorFaults:
+    """Faults applied to every connection of one simulated unit."""
+
+    # Keep sockets open but stop sending frames
+    stall: bool = False
+    # Stop reading and sending; the socket is never closed
+    half_open: bool = False
+    # Probability that an outgoing frame is truncated JSON
+    malformed_rate: float = 0.0
+    # Delay before a config write is echoed back
+    ack_delay: float = 0.0
+
+
+def _initial_state(index: int) -> dict[str, dict[str, Any]]:
+    now = int(time.time())
+    return {
+        "status": {
+            "connect_status": 1,
+            "qset": 150.0,
+            "override_set_time_left": 0,
+            "bypass_pos": 0,
+            "frost_protection": False,
+            "sensor_eco2_eta": 650,
+            "sensor_tvoc_eta": 120,
+            "sensor_rh_eta": 48,
+            "sensor_temp_eha": 12.4,
+            "sensor_temp_eta": 21.3,
+            "sensor_temp_oda": 8.7,
+            "sensor_ext_co2": 700,
+            "fan_eha_speed": 1450,
+            "fan_sup_speed": 1420,
+        },
+        "config": {
+            "setpoint_low": 90,
+            "setpoint_mid": 150,
+            "setpoint_high": 250,
+            "schedule_enabled": False,
+            "sum_com_enabled": False,
+            "sum_com_temp": 23.0,
+            "filter_datetime": now + 90 * 86400,
+            "man_override_set": 0,
+            "man_override_set_time": 0,
+            "man_override_bypass": 0,
+            "schedule_0_time": "07:00",
+            "schedule_0_value": 150,
+            "schedule_1_time": "23:00",
+            "schedule_1_value": 90,
+        },
+        "system": {"uptime": 3600},
+        "comm_wifi": {
+            "wifi_ip": f"10.99.{index // 250}.{index % 250 + 1}",
+            "ssid": "ecostream-sim",
+            "rssi": -58,
+        },
+    }
+
+
+class EcostreamSimulator:
+    """One simulated EcoStream unit served by an aiohttp app."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        status_interval: float = 1.0,
+        slow_interval: float = 10.0,
+        index: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.status_interval = status_interval
+        self.slow_interval = slow_interval
+        self.faults = SimulatorFaults()
+        self.state = _initial_state(index)
+
+        self.writes: list[dict[str, Any]] = []
+        self.heartbeats = 0
+        self.frames_sent = 0
+        self.connections = 0
+
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._started = time.monotonic()
+        self._override_until = 0.0
+
+    @property
+    def address(self) -> str:
+        """``host:port`` as entered in the integration's host field."""
+        return f"{self.host}:{self.port}"
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.address}/"
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/", self._handle_ws)
+        self._runner = web.AppRunner(app, handle_signals=False)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = self._runner.addresses[0][1]
+        self._started = time.monotonic()
+
+    async def stop(self) -> None:
+        await self.disconnect_all()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def disconnect_all(self) -> None:
+        """Close every client connection (simulates a unit reboot)."""
+        for ws in list(self._sockets):
+            await ws.close()
+
+    # ------------------------------------------------------------------
+    # Device model
+    # ------------------------------------------------------------------
+
+    def _tick_status(self) -> dict[str, Any]:
+        status = self.state["status"]
+        rnd = self._random
+        status["sensor_eco2_eta"] = max(
+            400, status["sensor_eco2_eta"] + rnd.randint(-15, 15)
+        )
+        status["sensor_ext_co2"] = max(
+            400, status["sensor_ext_co2"] + rnd.randint(-15, 15)
+        )
+        status["sensor_tvoc_eta"] = max(
+            0, status["sensor_tvoc_eta"] + rnd.randint(-5, 5)
+        )
+        status["sensor_rh_eta"] = min(
+            100, max(0, status["sensor_rh_eta"] + rnd.randint(-1, 1))
+        )
+        for key in _TEMPERATURE_KEYS:
+            status[key] = round(status[key] + rnd.uniform(-0.1, 0.1), 1)
+
+        if status["override_set_time_left"] > 0:
+            left = max(
+                0, round(self._override_until - time.monotonic())
+            )
+            status["override_set_time_left"] = left
+            if left == 0:
+                status["qset"] = float(
+                    self.state["config"]["setpoint_mid"]
+                )
+
+        rpm = int(status["qset"] * 9.5)
+        status["fan_eha_speed"] = rpm + rnd.randint(-20, 20)
+        status["fan_sup_speed"] = rpm + rnd.randint(-20, 20)
+        return {"status": dict(status)}
+
+    def _tick_slow(self) -> dict[str, Any]:
+        self.state["system"]["uptime"] = 3600 + int(
+            time.monotonic() - self._started
+        )
+        self.state["comm_wifi"]["rssi"] = self._random.randint(-70, -50)
+        return {
+            "config": dict(self.state["config"]),
+            "system": dict(self.state["system"]),
+            "comm_wifi": dict(self.state["comm_wifi"]),
+        }
+
+    def _apply_config(self, changes: dict[str, Any]) -> None:
+        self.state["config"].update(changes)
+        status = self.state["status"]
+        if "man_override_set_time" in changes:
+            seconds = int(changes["man_override_set_time"] or 0)
+            status["override_set_time_left"] = seconds
+            self._override_until = time.monotonic() + seconds
+            if seconds > 0:
+                status["qset"] = float(
+                    changes.get(
+                        "man_override_set",
+                        self.state["config"]["man_override_set"],
+                    )
+                )
+        if "man_override_bypass" in changes:
+            status["bypass_pos"] = changes["man_override_bypass"]
+
+    # ------------------------------------------------------------------
+    # WebSocket handling
+    # ------------------------------------------------------------------
+
+    async def _send(
+        self, ws: web.WebSocketResponse, frame: Any
+    ) -> None:
+        if self.faults.stall or self.faults.half_open or ws.closed:
+            return
+        if self._random.random() < self.faults.malformed_rate:
+            await ws.send_str(MALFORMED_FRAME)
+        else:
+            await ws.send_str(json.dumps(frame))
+        self.frames_sent += 1
+
+    async def _stream(self, ws: web.WebSocketResponse) -> None:
+        next_slow = time.monotonic() + self.slow_interval
+        while not ws.closed:
+            await asyncio.sleep(self.status_interval)
+            await self._send(ws, self._tick_status())
+            if time.monotonic() >= next_slow:
+                next_slow += self.slow_interval
+                await self._send(ws, self._tick_slow())
+
+    async def _ack(
+        self, ws: web.WebSocketResponse, changes: Any
+    ) -> None:
+        if self.faults.ack_delay:
+            await asyncio.sleep(self.faults.ack_delay)
+        await self._send(ws, {"config": changes})
+
+    async def _handle_ws(
+        self, request: web.Request
+    ) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        self.connections += 1
+        _LOGGER.debug("Client connected to simulator %s", self.address)
+
+        snapshot = {
+            section: dict(values)
+            for section, values in self.state.items()
+        }
+        await self._send(ws, snapshot)
+        stream = asyncio.create_task(self._stream(ws))
+        acks: set[asyncio.Task[None]] = set()
+
+        try:
+            async for msg in ws:
+                if self.faults.half_open:
+                    continue
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    payload = json.loads(msg.data)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(payload, dict):
+                    continue
+                if not payload:
+                    self.heartbeats += 1
+                    continue
+                changes = cast(dict[str, Any], payload).get("config")
+                if isinstance(changes, dict):
+                    changes = cast(dict[str, Any], changes)
+                    self.writes.append(changes)
+                    self._apply_config(changes)
+                    ack = asyncio.create_task(self._ack(ws, changes))
+                    acks.add(ack)
+                    ack.add_done_callback(acks.discard)
+        finally:
+            self._sockets.discard(ws)
+            for task in (stream, *acks):
+                task.cancel()
+            for task in (stream, *acks):
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        return ws
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    simulators = [
+        EcostreamSimulator(
+            host=args.host,
+            port=args.port + index if args.port else 0,
+            status_interval=args.status_interval,
+            slow_interval=args.slow_interval,
+            index=index,
+        )
+        for index in range(args.devices)
+    ]
+    for simulator in simulators:
+        simulator.faults.malformed_rate = args.malformed_rate
+        simulator.faults.ack_delay = args.ack_delay
+        await simulator.start()
+        print(simulator.address, flush=True)
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for simulator in simulators:
+            await simulator.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").partition("\n")[0]
+    )
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=0,
+        help="first port; units use consecutive ports (0 = random)",
+    )
+    parser.add_argument("--status-interval", type=float, default=1.0)
+    parser.add_argument("--slow-interval", type=float, default=10.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--ack-delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(args))
+
+
+if __name__ == "__main__":
+    main()
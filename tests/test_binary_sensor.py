@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from pathlib import Path
 import sys
-import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -26,10 +25,14 @@ from custom_components.ecostream.binary_sensor import (
 
 def _make_binary_sensor(
     data: dict[str, Any] | None = None,
+    overdue: bool = False,
+    available: bool = True,
 ) -> EcostreamFilterReplacementWarningBinarySensor:
     coordinator = MagicMock()
     coordinator.data = data or {}
     coordinator.host = "192.168.1.1"
+    coordinator.available = available
+    coordinator.filter_state.overdue = overdue
     entry = MagicMock(spec=ConfigEntry)
     entry.entry_id = "test_entry"
 
@@ -88,36 +91,35 @@ def test_bool_value_uses_default():
 
 def test_filter_replacement_warning_is_on_when_due():
     sensor = _make_binary_sensor(
-        {
-            "config": {"filter_datetime": int(time.time()) - 10},
-            "status": {"connect_status": 1},
-        }
+        {"status": {"connect_status": 1}}, overdue=True
     )
     assert sensor.is_on is True
 
 
 def test_filter_replacement_warning_is_off_when_not_due():
     sensor = _make_binary_sensor(
-        {
-            "config": {"filter_datetime": int(time.time()) + 3600},
-            "status": {"connect_status": 1},
-        }
+        {"status": {"connect_status": 1}}, overdue=False
     )
     assert sensor.is_on is False
 
 
-def test_filter_replacement_warning_is_off_when_missing_timestamp():
+def test_filter_replacement_warning_follows_filter_state_on_update():
     sensor = _make_binary_sensor({"status": {"connect_status": 1}})
     assert sensor.is_on is False
 
+    sensor.coordinator.filter_state.overdue = True
+    sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+
+    assert sensor.is_on is True
+
 
 def test_filter_replacement_warning_available_connected():
-    sensor = _make_binary_sensor({"status": {"connect_status": 1}})
+    sensor = _make_binary_sensor(available=True)
     assert sensor.available is True
 
 
 def test_filter_replacement_warning_available_disconnected():
-    sensor = _make_binary_sensor({"status": {"connect_status": 0}})
+    sensor = _make_binary_sensor(available=False)
     assert sensor.available is False
 
 
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+import sys
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from custom_components.ecostream.calendar import (
+    EcostreamScheduleCalendar,
+)
+from custom_components.ecostream.schedule import EcostreamSchedule
+
+_SCHEDULE = EcostreamSchedule.from_config(
+    {
+        "schedule_0_time": "08:00",
+        "schedule_0_value": 120,
+        "schedule_1_time": "22:00",
+        "schedule_1_value": 90,
+    }
+)
+
+
+def _local(*args: int) -> datetime:
+    return datetime(*args, tzinfo=dt_util.get_default_time_zone())
+
+
+def _make_calendar() -> EcostreamScheduleCalendar:
+    coordinator = MagicMock()
+    coordinator.host = "192.168.1.1"
+    coordinator.schedule = _SCHEDULE
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "test_entry"
+
+    def _mock_coordinator_entity_init(
+        self: CoordinatorEntity[Any], c: Any
+    ) -> None:
+        self.coordinator = c
+
+    with patch.object(
+        CoordinatorEntity, "__init__", _mock_coordinator_entity_init
+    ):
+        return EcostreamScheduleCalendar(coordinator, entry)
+
+
+def test_calendar_unique_id():
+    assert _make_calendar().unique_id == "test_entry_schedule_calendar"
+
+
+def test_calendar_current_event():
+    calendar = _make_calendar()
+    with patch(
+        "custom_components.ecostream.calendar.dt_util.now",
+        return_value=_local(2026, 1, 1, 12, 0),
+    ):
+        event = calendar.event
+
+    assert event is not None
+    assert event.summary == "Ventilation 120"
+    assert event.start == _local(2026, 1, 1, 8)
+    assert event.end == _local(2026, 1, 1, 22)
+
+
+@pytest.mark.asyncio
+async def test_calendar_get_events():
+    calendar = _make_calendar()
+    events = await calendar.async_get_events(
+        MagicMock(),
+        dt_util.as_utc(_local(2026, 1, 1, 9)),
+        dt_util.as_utc(_local(2026, 1, 1, 23)),
+    )
+
+    assert [e.summary for e in events] == [
+        "Ventilation 120",
+        "Ventilation 90",
+    ]
+    assert events[0].start == _local(2026, 1, 1, 8)
+    for event in events:
+        assert isinstance(event.start, datetime)
+        assert isinstance(event.end, datetime)
+        assert event.start.tzinfo is not None
+        assert event.end.tzinfo is not None
@@ -229,6 +229,36 @@ async def test_zeroconf_step_already_configured(
     assert result.get("reason") == "already_configured"
 
 
+async def test_zeroconf_pins_address_of_hostname_entry(
+    hass: HomeAssistant,
+) -> None:
+    entry = MagicMock()
+    entry.data = {CONF_HOST: f"{MOCK_SYSTEM_NAME}.local"}
+    entry.state = config_entries.ConfigEntryState.LOADED
+
+    with patch.object(
+        hass.config_entries,
+        "async_entry_for_domain_unique_id",
+        return_value=entry,
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": config_entries.SOURCE_ZEROCONF},
+            data=_make_zeroconf_service_info(
+                host=MOCK_HOST,
+                name=f"{MOCK_SYSTEM_NAME}._http._tcp.local.",
+            ),
+        )
+
+    # The hostname is kept; only the running resolver learns the IP
+    assert result.get("type") == FlowResultType.ABORT
+    assert result.get("reason") == "already_configured"
+    assert entry.data == {CONF_HOST: f"{MOCK_SYSTEM_NAME}.local"}
+    entry.runtime_data.resolver.update.assert_called_once_with(
+        MOCK_HOST
+    )
+
+
 # ---------------------------------------------------------------------------
 # DHCP STEP
 # ---------------------------------------------------------------------------
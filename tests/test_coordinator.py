@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import asyncio
+from collections.abc import Callable
 from pathlib import Path
 import sys
-from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any, cast
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -13,16 +13,17 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 from homeassistant.core import HomeAssistant
 
 from custom_components.ecostream.const import (
+    AVAILABILITY_GRACE_SECONDS,
+    DEFAULT_FAST_PUSH_INTERVALS,
+    DEFAULT_FAST_WINDOW_SECONDS,
+    DEFAULT_PUSH_INTERVALS,
     DOMAIN,
-    FAST_MODE_SECONDS,
-    SLOW_PUSH_INTERVAL,
 )
 from custom_components.ecostream.coordinator import (
-    RECONNECT_INTERVAL,
-    RECONNECT_JITTER,
-    RECONNECT_MIN_SLEEP,
     EcostreamDataUpdateCoordinator,
 )
+from custom_components.ecostream.profiler import EcostreamProfiler
+from custom_components.ecostream.websocket_api import WritePriority
 
 
 def _make_coordinator(
@@ -36,6 +37,8 @@ def _make_coordinator(
         hass.bus = MagicMock()
         hass.bus.async_listen_once = MagicMock()
         hass.data = {}  # Required for issue registry
+        hass.loop = MagicMock()  # Required for the hub timer wheel
+        hass.loop.time.return_value = 0.0
 
     coordinator = EcostreamDataUpdateCoordinator(
         hass=hass,
@@ -46,6 +49,41 @@ def _make_coordinator(
     return coordinator, hass  # type: ignore[return-value]
 
 
+async def _send_now(
+    _payload: dict[str, Any],
+    on_sent: Callable[[], None] | None = None,
+    **_kwargs: Any,
+) -> bool:
+    """``send_json`` stand-in that writes the payload at once."""
+    if on_sent is not None:
+        on_sent()
+    return True
+
+
+def _set_time(
+    coordinator: EcostreamDataUpdateCoordinator, now: float
+) -> None:
+    """Move the coordinator's monotonic clock (the loop time)."""
+    cast(MagicMock, coordinator.hass.loop.time).return_value = now
+
+
+async def _run_created_tasks(hass: HomeAssistant) -> None:
+    """Await the coroutines handed to the mocked async_create_task."""
+    create_task = cast(MagicMock, hass.async_create_task)
+    for call in create_task.call_args_list:
+        await call.args[0]
+    create_task.reset_mock()
+
+
+def _mark_pushed(
+    coordinator: EcostreamDataUpdateCoordinator,
+    now: float,
+    *groups: str,
+) -> None:
+    coordinator.push_policy.due(groups, now)
+    coordinator.push_policy.mark_pushed(now)
+
+
 # ---------------------------------------------------------------------------
 # Initialization
 # ---------------------------------------------------------------------------
@@ -71,19 +109,260 @@ def test_coordinator_initialization_with_options():
     assert coordinator.options == options
 
 
-def test_coordinator_push_intervals():
+def test_coordinator_recorder_light_creates_statistics():
+    coordinator, _ = _make_coordinator()
+    assert coordinator.recorder_light is False
+    assert coordinator.statistics is None
+
+    with patch("custom_components.ecostream.statistics.Store"):
+        coordinator, _ = _make_coordinator(
+            options={"recorder_light": True}
+        )
+    assert coordinator.recorder_light is True
+    assert coordinator.statistics is not None
+
+
+def test_coordinator_presets_follow_payload():
     coordinator, _ = _make_coordinator()
+    coordinator.data = {
+        "config": {
+            "setpoint_low": 90,
+            "setpoint_mid": 180,
+            "setpoint_high": 270,
+        },
+        "status": {"qset": 180},
+    }
+    assert coordinator.presets.preset_mode == "mid"
 
-    assert coordinator._push_interval == float(SLOW_PUSH_INTERVAL)
-    assert coordinator._fast_push_interval == int(FAST_MODE_SECONDS)
+    coordinator._merge_payload({"status": {"qset": 270}})
+    assert coordinator.presets.preset_mode == "high"
 
 
-def test_coordinator_initial_timestamps():
+def test_schedule_is_parsed_only_when_schedule_entries_change():
     coordinator, _ = _make_coordinator()
+    coordinator.data = {
+        "config": {"schedule_0_time": "08:00", "schedule_0_value": 120},
+    }
+    schedule = coordinator.schedule
+
+    # A config frame without schedule changes still replaces the dict
+    coordinator._merge_payload({"config": {"setpoint_low": 90}})
+    assert coordinator.schedule is schedule
 
-    assert coordinator._last_push == 0.0
-    assert coordinator._last_slow_push == 0.0
-    assert coordinator._fast_mode_until == 0.0
+    coordinator._merge_payload({"config": {"schedule_0_value": 150}})
+    assert coordinator.schedule is not schedule
+    transition = coordinator.schedule.transitions[0]
+    assert transition.value == 150
+
+
+# ---------------------------------------------------------------------------
+# Availability
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_availability_follows_frames_and_connect_status():
+    coordinator, _ = _make_coordinator()
+    assert coordinator.available is False
+
+    _set_time(coordinator, 1000.0)
+    with (
+        patch.object(coordinator.hub.wheel, "call_later") as call_later,
+        patch.object(coordinator, "async_set_updated_data") as push,
+    ):
+        await coordinator.handle_ws_message(
+            {"status": {"connect_status": 1}}
+        )
+        assert coordinator.available is True
+        call_later.assert_called_once()
+        assert call_later.call_args[0][0] == AVAILABILITY_GRACE_SECONDS
+
+        # Lost device connection is pushed even inside the throttle
+        await coordinator.handle_ws_message(
+            {"status": {"connect_status": 0}}
+        )
+        assert coordinator.available is False
+        assert push.call_count == 2
+
+
+def test_availability_timer_marks_stale_data_unavailable():
+    coordinator, _ = _make_coordinator()
+    with patch.object(
+        coordinator.hub.wheel, "call_later"
+    ) as call_later:
+        coordinator._last_frame_ts = 1000.0
+        coordinator._refresh_availability(1000.0)
+        fire = call_later.call_args[0][1]
+
+        # A newer frame re-arms for the remaining grace period
+        coordinator._last_frame_ts = 1050.0
+        _set_time(coordinator, 1090.0)
+        fire()
+        assert coordinator.available is True
+        assert call_later.call_args[0][0] == 50.0
+
+        _set_time(coordinator, 1140.0)
+        with patch.object(
+            coordinator, "async_update_listeners"
+        ) as notify:
+            call_later.call_args[0][1]()
+        assert coordinator.available is False
+        notify.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_stop_marks_unavailable_and_cancels_timer():
+    coordinator, _ = _make_coordinator()
+    timer = MagicMock()
+    with patch.object(
+        coordinator.hub.wheel, "call_later", return_value=timer
+    ):
+        coordinator._last_frame_ts = 1000.0
+        coordinator._refresh_availability(1000.0)
+
+    await coordinator.async_stop()
+
+    timer.cancel.assert_called_once()
+    assert coordinator.available is False
+
+
+# ---------------------------------------------------------------------------
+# Data age
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_data_age_timer_marks_section_stale():
+    coordinator, _ = _make_coordinator(options={"max_age_status": 60})
+    _set_time(coordinator, 1000.0)
+    with (
+        patch.object(coordinator.hub.wheel, "call_later"),
+        patch.object(coordinator.hub.wheel, "call_at") as call_at,
+        patch.object(coordinator, "async_set_updated_data"),
+    ):
+        await coordinator.handle_ws_message({"status": {"qset": 100}})
+        assert call_at.call_args[0][0] == 1060.0
+
+        # Later frames leave the single timer armed
+        _set_time(coordinator, 1030.0)
+        await coordinator.handle_ws_message({"status": {"qset": 110}})
+        call_at.assert_called_once()
+
+    fire = call_at.call_args[0][1]
+    _set_time(coordinator, 1060.0)
+    with (
+        patch.object(coordinator.hub.wheel, "call_at") as call_at,
+        patch.object(coordinator, "async_update_listeners") as notify,
+    ):
+        # Still fresh: re-armed for the newer frame's deadline
+        fire()
+        notify.assert_not_called()
+        assert call_at.call_args[0][0] == 1090.0
+
+        _set_time(coordinator, 1090.0)
+        call_at.call_args[0][1]()
+
+    notify.assert_called_once()
+    call_at.assert_called_once()
+    assert coordinator.data_age.unavailable == frozenset({"status"})
+
+
+@pytest.mark.asyncio
+async def test_data_age_timer_moves_to_earlier_deadline():
+    coordinator, _ = _make_coordinator(
+        options={"max_age_status": 60, "max_age_config": 600}
+    )
+    _set_time(coordinator, 1000.0)
+    with (
+        patch.object(coordinator.hub.wheel, "call_later"),
+        patch.object(coordinator.hub.wheel, "call_at") as call_at,
+        patch.object(coordinator, "async_set_updated_data"),
+    ):
+        await coordinator.handle_ws_message(
+            {"config": {"sum_com_temp": 23}}
+        )
+        assert call_at.call_args[0][0] == 1600.0
+
+        await coordinator.handle_ws_message({"status": {"qset": 100}})
+
+    call_at.return_value.cancel.assert_called_once()
+    assert call_at.call_args[0][0] == 1060.0
+
+
+@pytest.mark.asyncio
+async def test_stale_section_is_pushed_inside_throttle():
+    coordinator, _ = _make_coordinator(
+        options={"max_age_config": 60, "push_interval_status": 3600}
+    )
+    _set_time(coordinator, 1000.0)
+    with patch.object(
+        coordinator, "async_set_updated_data"
+    ) as mock_update:
+        await coordinator.handle_ws_message(
+            {"config": {}, "status": {}}
+        )
+        _set_time(coordinator, 1061.0)
+        await coordinator.handle_ws_message({"status": {"qset": 100}})
+        _set_time(coordinator, 1062.0)
+        await coordinator.handle_ws_message({"status": {"qset": 110}})
+
+    # First frame, then config going stale; the third is throttled
+    assert mock_update.call_count == 2
+    assert coordinator.data_age.unavailable == frozenset({"config"})
+
+
+def test_configure_data_age_updates_entities():
+    coordinator, _ = _make_coordinator(options={"max_age_status": 600})
+    coordinator.data_age.touch({"status": {}}, 0.0)
+    _set_time(coordinator, 100.0)
+
+    with (
+        patch.object(coordinator.hub.wheel, "call_at") as call_at,
+        patch.object(coordinator, "async_update_listeners") as notify,
+    ):
+        coordinator.configure_data_age({"max_age_status": 60})
+        notify.assert_called_once()
+        call_at.assert_not_called()
+
+        coordinator.configure_data_age({"max_age_status": 300})
+        assert notify.call_count == 2
+        assert call_at.call_args[0][0] == 300.0
+
+
+@pytest.mark.asyncio
+async def test_async_stop_cancels_data_age_timer():
+    coordinator, _ = _make_coordinator(options={"max_age_status": 60})
+    _set_time(coordinator, 1000.0)
+    with (
+        patch.object(coordinator.hub.wheel, "call_later"),
+        patch.object(coordinator.hub.wheel, "call_at") as call_at,
+        patch.object(coordinator, "async_set_updated_data"),
+    ):
+        await coordinator.handle_ws_message({"status": {"qset": 100}})
+
+    await coordinator.async_stop()
+
+    call_at.return_value.cancel.assert_called_once()
+
+
+def test_coordinator_push_intervals():
+    coordinator, _ = _make_coordinator()
+
+    assert coordinator.push_policy.intervals == DEFAULT_PUSH_INTERVALS
+    assert (
+        coordinator.push_policy.fast_intervals
+        == DEFAULT_FAST_PUSH_INTERVALS
+    )
+    assert coordinator.push_policy.ignored == frozenset()
+
+
+def test_coordinator_push_intervals_from_options():
+    coordinator, _ = _make_coordinator(
+        options={"push_interval_status": 30, "ignore_debug": True}
+    )
+
+    assert coordinator.push_policy.intervals["status"] == 30.0
+    assert coordinator.push_policy.ignored == {"debug"}
 
 
 # ---------------------------------------------------------------------------
@@ -114,8 +393,9 @@ async def test_async_start_registers_event_listeners():
     ):
         await coordinator.async_start()
 
-        # Should register two event listeners
-        assert hass.bus.async_listen_once.call_count == 2  # type: ignore[attr-defined]
+        # Only the shutdown listener; reconnects run on the hub timer
+        assert hass.bus.async_listen_once.call_count == 1  # type: ignore[attr-defined]
+        assert coordinator.hub.device_count == 1
 
 
 @pytest.mark.asyncio
@@ -147,18 +427,17 @@ async def test_async_stop_sets_stopping_flag():
 
 
 @pytest.mark.asyncio
-async def test_async_stop_cancels_reconnect_task():
+async def test_async_stop_unregisters_from_hub():
     coordinator, _ = _make_coordinator()
+    coordinator.hub = MagicMock()
+    coordinator.hub.async_close_session = AsyncMock()
 
-    mock_task = MagicMock()
-    mock_task.cancel = MagicMock()
-    coordinator._reconnect_task = mock_task
-
-    with patch("asyncio.CancelledError", Exception):
-        await coordinator.async_stop()
+    await coordinator.async_stop()
 
-    mock_task.cancel.assert_called_once()
-    assert coordinator._reconnect_task is None
+    coordinator.hub.async_unregister.assert_called_once_with(
+        coordinator
+    )
+    coordinator.hub.async_close_session.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -184,9 +463,14 @@ async def test_async_stop_disconnects_websocket():
 async def test_ensure_ws_started_creates_websocket():
     coordinator, _ = _make_coordinator()
 
-    with patch(
-        "custom_components.ecostream.coordinator.EcostreamWebsocket"
-    ) as mock_ws_class:
+    with (
+        patch(
+            "custom_components.ecostream.coordinator.EcostreamWebsocket"
+        ) as mock_ws_class,
+        patch("custom_components.ecostream.hub.create_session"),
+        patch("custom_components.ecostream.hub.AsyncDualMDNSResolver"),
+        patch("custom_components.ecostream.hub.zeroconf"),
+    ):
         mock_ws_instance = MagicMock()
         mock_ws_instance.async_start = AsyncMock()
         mock_ws_class.return_value = mock_ws_instance
@@ -195,6 +479,31 @@ async def test_ensure_ws_started_creates_websocket():
 
         assert coordinator.ws is mock_ws_instance
         mock_ws_instance.async_start.assert_called_once()
+        # Per-device state outlives the WebSocket client
+        kwargs = mock_ws_class.call_args.kwargs
+        assert kwargs["outbound"] is coordinator.outbound
+        assert kwargs["limiter"] is coordinator.rate_limiter
+        assert kwargs["telemetry"] is coordinator.telemetry
+        assert kwargs["session"] is coordinator.hub.session
+
+
+def test_connection_telemetry_properties():
+    coordinator, _ = _make_coordinator()
+    assert coordinator.ws_state == "disconnected"
+    assert coordinator.last_payload is None
+
+    telemetry = coordinator.telemetry
+    for _ in range(3):
+        telemetry.connecting()
+        telemetry.connected(1000.0)
+        telemetry.disconnected("closed", stopping=False)
+    telemetry.connecting()
+    telemetry.connected(1000.0)
+    telemetry.frame_in('{"status": {}}', 1000.0)
+
+    assert coordinator.ws_state == "connected"
+    assert coordinator.ws_reconnects == 3
+    assert coordinator.last_payload == '{"status": {}}'
 
 
 @pytest.mark.asyncio
@@ -212,32 +521,33 @@ async def test_ensure_ws_started_reuses_existing():
 
 
 @pytest.mark.asyncio
-async def test_force_ws_reconnect_creates_if_none():
+async def test_async_reconnect_creates_if_none():
     coordinator, _ = _make_coordinator()
 
     with patch.object(
         coordinator, "_ensure_ws_started", new_callable=AsyncMock
     ) as mock_ensure:
-        await coordinator._force_ws_reconnect()
+        await coordinator.async_reconnect()
 
         mock_ensure.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_force_ws_reconnect_disconnects_and_reconnects():
+async def test_async_reconnect_disconnects_and_reconnects():
     coordinator, _ = _make_coordinator()
 
     mock_ws = MagicMock()
     mock_ws.async_disconnect = AsyncMock()
     mock_ws.async_start = AsyncMock()
     coordinator.ws = mock_ws
-    coordinator._last_push = 123.45
+    coordinator.push_policy.due(["status"], 123.45)
+    coordinator.push_policy.mark_pushed(123.45)
 
-    await coordinator._force_ws_reconnect()
+    await coordinator.async_reconnect()
 
     mock_ws.async_disconnect.assert_called_once()
     mock_ws.async_start.assert_called_once()
-    assert coordinator._last_push == 0.0
+    assert coordinator.push_policy.due(["status"], 124.0)
 
 
 @pytest.mark.asyncio
@@ -251,125 +561,204 @@ async def test_async_handle_hass_stop_calls_async_stop():
 
 
 @pytest.mark.asyncio
-async def test_start_background_tasks_skips_when_existing():
+async def test_async_send_config_returns_false_without_ws():
     coordinator, _ = _make_coordinator()
-    coordinator._reconnect_task = MagicMock()
-    with patch("asyncio.create_task") as create_task:
-        await coordinator._async_start_background_tasks(MagicMock())
-    create_task.assert_not_called()
+    coordinator.ws = None
+    ok = await coordinator.async_send_config({"x": 1}, "test")
+    assert ok is False
 
 
 @pytest.mark.asyncio
-async def test_start_background_tasks_creates_task():
+async def test_async_send_config_sends_payload_with_ws():
     coordinator, _ = _make_coordinator()
-    coordinator._reconnect_task = None
-    fake_task = MagicMock()
+    coordinator.ws = MagicMock()
+    coordinator.ws.send_json = AsyncMock(side_effect=_send_now)
+    coordinator.mark_control_action = MagicMock()
 
-    def _consume_task(coro: Any, name: Any = None) -> MagicMock:
-        coro.close()
-        return fake_task
+    ok = await coordinator.async_send_config({"x": 1}, "test")
 
-    with patch(
-        "asyncio.create_task", side_effect=_consume_task
-    ) as create_task:
-        await coordinator._async_start_background_tasks(MagicMock())
-    create_task.assert_called_once()
-    assert coordinator._reconnect_task is fake_task
+    assert ok is True
+    coordinator.mark_control_action.assert_called_once()
+    coordinator.ws.send_json.assert_called_once_with(
+        {"config": {"x": 1}},
+        priority=WritePriority.USER,
+        on_sent=ANY,
+    )
 
 
 @pytest.mark.asyncio
-async def test_reconnect_loop_handles_cancelled_error():
+async def test_async_send_config_marks_preset_restore_flag():
     coordinator, _ = _make_coordinator()
-    coordinator._stopping = False
+    coordinator.ws = MagicMock()
+    coordinator.ws.send_json = AsyncMock(side_effect=_send_now)
 
-    async def _raise_cancelled(_sleep_s: Any) -> None:
-        raise asyncio.CancelledError()
+    await coordinator.async_send_config(
+        {"man_override_set_time": 600}, "preset mid"
+    )
 
-    with patch("asyncio.sleep", new=_raise_cancelled):
-        with pytest.raises(asyncio.CancelledError):
-            await coordinator._async_reconnect_loop()
+    assert coordinator._restore_schedule_after_override is True
+    assert coordinator.override.active is True
 
 
 @pytest.mark.asyncio
-async def test_reconnect_loop_handles_generic_exception():
+async def test_async_send_config_non_preset_override_disables_restore_flag():
     coordinator, _ = _make_coordinator()
-    coordinator._stopping = False
+    coordinator.ws = MagicMock()
+    coordinator.ws.send_json = AsyncMock(side_effect=_send_now)
 
-    async def _raise_error(_sleep_s: Any) -> None:
-        raise RuntimeError("boom")
+    await coordinator.async_send_config(
+        {"man_override_set_time": 600}, "boost"
+    )
 
-    with patch("asyncio.sleep", new=_raise_error):
-        await coordinator._async_reconnect_loop()
+    assert coordinator._restore_schedule_after_override is False
+    assert coordinator.override.active is True
 
 
 @pytest.mark.asyncio
-async def test_reconnect_loop_calls_force_reconnect_once():
+async def test_async_send_config_starts_override_countdown():
     coordinator, _ = _make_coordinator()
-    coordinator._stopping = False
-    coordinator._force_ws_reconnect = AsyncMock(
-        side_effect=lambda: setattr(coordinator, "_stopping", True)
-    )
-
-    async def _noop_sleep(_sleep_s: Any) -> None:
-        return None
+    coordinator.ws = MagicMock()
+    coordinator.ws.send_json = AsyncMock(side_effect=_send_now)
+    _set_time(coordinator, 1000.0)
 
-    with patch("asyncio.sleep", new=_noop_sleep):
-        with patch("random.uniform", return_value=0):
-            await coordinator._async_reconnect_loop()
+    with (
+        patch.object(coordinator.hub.wheel, "call_at") as call_at,
+        patch.object(coordinator, "async_update_listeners") as notify,
+    ):
+        await coordinator.async_send_config(
+            {"man_override_set_time": 600}, "boost"
+        )
 
-    coordinator._force_ws_reconnect.assert_awaited_once()
+    assert coordinator.override.active is True
+    assert call_at.call_args[0][0] == 1600.0
+    notify.assert_called_once()
 
+    # The deadline ends the override without waiting for a frame
+    _set_time(coordinator, 1600.0)
+    with patch.object(coordinator, "async_update_listeners") as notify:
+        call_at.call_args[0][1]()
 
-@pytest.mark.asyncio
-async def test_async_send_config_returns_false_without_ws():
-    coordinator, _ = _make_coordinator()
-    coordinator.ws = None
-    ok = await coordinator.async_send_config({"x": 1}, "test")
-    assert ok is False
+    assert coordinator.override.active is False
+    assert coordinator.override.ends_at_utc is None
+    notify.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_async_send_config_sends_payload_with_ws():
+async def test_queued_override_starts_countdown_once_sent():
     coordinator, _ = _make_coordinator()
     coordinator.ws = MagicMock()
-    coordinator.ws.send_json = AsyncMock()
+    # Offline: only queued for replay
+    coordinator.ws.send_json = AsyncMock(return_value=False)
     coordinator.mark_control_action = MagicMock()
+    _set_time(coordinator, 1000.0)
 
-    ok = await coordinator.async_send_config({"x": 1}, "test")
+    with patch.object(coordinator.hub.wheel, "call_at") as call_at:
+        ok = await coordinator.async_send_config(
+            {"man_override_set": 270, "man_override_set_time": 600},
+            "preset high",
+        )
 
-    assert ok is True
+        assert ok is True
+        assert coordinator.override.active is False
+        assert coordinator._restore_schedule_after_override is False
+        coordinator.mark_control_action.assert_not_called()
+        call_at.assert_not_called()
+
+        # Replayed after the reconnect
+        _set_time(coordinator, 1050.0)
+        coordinator.ws.send_json.call_args.kwargs["on_sent"]()
+
+    assert coordinator.override.active is True
+    assert coordinator._restore_schedule_after_override is True
     coordinator.mark_control_action.assert_called_once()
+    assert call_at.call_args[0][0] == 1650.0
+
+
+@pytest.mark.asyncio
+async def test_override_deadline_restores_schedule_without_frame():
+    coordinator, hass = _make_coordinator()
+    coordinator.ws = MagicMock()
+    coordinator.ws.send_json = AsyncMock(side_effect=_send_now)
+    coordinator.data = {
+        "config": {
+            "schedule_enabled": False,
+            "schedule_0_time": "08:00",
+            "schedule_0_value": 120,
+        },
+    }
+    _set_time(coordinator, 1000.0)
+
+    with patch.object(coordinator.hub.wheel, "call_at") as call_at:
+        await coordinator.async_send_config(
+            {"man_override_set": 270, "man_override_set_time": 600},
+            "preset high",
+        )
+        # Sending a new override re-arms the single deadline
+        await coordinator.async_send_config(
+            {"man_override_set": 180, "man_override_set_time": 900},
+            "preset mid",
+        )
+    first_timer = call_at.return_value
+    first_timer.cancel.assert_called_once()
+    assert call_at.call_args[0][0] == 1900.0
+    coordinator.ws.send_json.reset_mock()
+
+    _set_time(coordinator, 1900.0)
+    call_at.call_args[0][1]()
+    restore = cast(MagicMock, hass.async_create_task).call_args[0][0]
+    await restore
+
     coordinator.ws.send_json.assert_called_once_with(
-        {"config": {"x": 1}}
+        {"config": {"schedule_enabled": True}},
+        priority=WritePriority.AUTOMATION,
+        on_sent=ANY,
     )
+    assert coordinator._restore_schedule_after_override is False
 
 
 @pytest.mark.asyncio
-async def test_async_send_config_marks_preset_restore_flag():
-    coordinator, _ = _make_coordinator()
+async def test_boost_deadline_does_not_restore_schedule():
+    coordinator, hass = _make_coordinator()
     coordinator.ws = MagicMock()
-    coordinator.ws.send_json = AsyncMock()
+    coordinator.ws.send_json = AsyncMock(side_effect=_send_now)
+    _set_time(coordinator, 1000.0)
 
-    await coordinator.async_send_config(
-        {"man_override_set_time": 600}, "preset mid"
-    )
+    with patch.object(coordinator.hub.wheel, "call_at") as call_at:
+        await coordinator.async_send_config(
+            {"man_override_set_time": 600}, "boost"
+        )
 
-    assert coordinator._restore_schedule_after_override is True
-    assert coordinator._last_override_active is True
+    _set_time(coordinator, 1600.0)
+    call_at.call_args[0][1]()
+
+    cast(MagicMock, hass.async_create_task).assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_async_send_config_non_preset_override_disables_restore_flag():
+async def test_handle_ws_message_override_countdown_pushes_on_change():
     coordinator, _ = _make_coordinator()
-    coordinator.ws = MagicMock()
-    coordinator.ws.send_json = AsyncMock()
+    coordinator.available = True
+    _mark_pushed(coordinator, 1000.0, "status")
+    _set_time(coordinator, 1001.0)
 
-    await coordinator.async_send_config(
-        {"man_override_set_time": 600}, "boost"
-    )
+    with patch.object(
+        coordinator, "async_set_updated_data"
+    ) as mock_update:
+        # A new override is pushed even inside the throttle interval
+        await coordinator.handle_ws_message(
+            {"status": {"override_set_time_left": 600}}
+        )
+        assert mock_update.call_count == 1
+        ends_at = coordinator.override.ends_at_utc
 
-    assert coordinator._restore_schedule_after_override is False
-    assert coordinator._last_override_active is True
+        # Ticking down in step with the local countdown is not a change
+        _set_time(coordinator, 1005.0)
+        await coordinator.handle_ws_message(
+            {"status": {"override_set_time_left": 596}}
+        )
+
+    assert mock_update.call_count == 1
+    assert coordinator.override.ends_at_utc == ends_at
 
 
 # ---------------------------------------------------------------------------
@@ -380,11 +769,16 @@ async def test_async_send_config_non_preset_override_disables_restore_flag():
 def test_mark_control_action_sets_fast_mode():
     coordinator, _ = _make_coordinator()
 
-    with patch("time.time", return_value=1000.0):
-        coordinator.mark_control_action()
+    _set_time(coordinator, 1000.0)
+    coordinator.mark_control_action()
 
-    expected = 1000.0 + FAST_MODE_SECONDS
-    assert coordinator._fast_mode_until == expected
+    policy = coordinator.push_policy
+    assert policy.in_fast_window(
+        1000.0 + DEFAULT_FAST_WINDOW_SECONDS - 1
+    )
+    assert not policy.in_fast_window(
+        1000.0 + DEFAULT_FAST_WINDOW_SECONDS
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -412,17 +806,29 @@ async def test_handle_ws_message_merges_payload():
 
     with patch.object(coordinator, "async_set_updated_data"):
         with patch.object(coordinator, "_update_filter_issue"):
-            with patch("time.time", return_value=1000.0):
-                await coordinator.handle_ws_message(message)
+            _set_time(coordinator, 1000.0)
+            await coordinator.handle_ws_message(message)
 
     assert "status" in coordinator.data
     assert coordinator.data["status"]["qset"] == 100
 
 
+@pytest.mark.asyncio
+async def test_handle_ws_message_runs_inside_active_profiler():
+    coordinator, _ = _make_coordinator()
+    profiler = EcostreamProfiler()
+    coordinator.profiler = profiler
+
+    with patch.object(coordinator, "_update_filter_issue"):
+        await coordinator.handle_ws_message({"status": {"qset": 100}})
+
+    assert profiler.messages == 1
+    assert coordinator.data["status"]["qset"] == 100
+
+
 @pytest.mark.asyncio
 async def test_handle_ws_message_triggers_push_on_first_message():
     coordinator, _ = _make_coordinator()
-    coordinator._last_push = 0.0
 
     message = {"status": {"qset": 100}}
 
@@ -430,8 +836,8 @@ async def test_handle_ws_message_triggers_push_on_first_message():
         coordinator, "async_set_updated_data"
     ) as mock_update:
         with patch.object(coordinator, "_update_filter_issue"):
-            with patch("time.time", return_value=1000.0):
-                await coordinator.handle_ws_message(message)
+            _set_time(coordinator, 1000.0)
+            await coordinator.handle_ws_message(message)
 
     mock_update.assert_called_once()
 
@@ -439,7 +845,7 @@ async def test_handle_ws_message_triggers_push_on_first_message():
 @pytest.mark.asyncio
 async def test_handle_ws_message_fast_key_triggers_push():
     coordinator, _ = _make_coordinator()
-    coordinator._last_push = 100.0
+    _mark_pushed(coordinator, 100.0, "status")
 
     # Fast key message after enough time
     message = {"status": {"qset": 200}}
@@ -448,10 +854,11 @@ async def test_handle_ws_message_fast_key_triggers_push():
         coordinator, "async_set_updated_data"
     ) as mock_update:
         with patch.object(coordinator, "_update_filter_issue"):
-            with patch(
-                "time.time", return_value=100.0 + SLOW_PUSH_INTERVAL + 1
-            ):
-                await coordinator.handle_ws_message(message)
+            _set_time(
+                coordinator,
+                100.0 + DEFAULT_PUSH_INTERVALS["status"] + 1,
+            )
+            await coordinator.handle_ws_message(message)
 
     mock_update.assert_called_once()
 
@@ -459,8 +866,11 @@ async def test_handle_ws_message_fast_key_triggers_push():
 @pytest.mark.asyncio
 async def test_handle_ws_message_slow_key_respects_interval():
     coordinator, _ = _make_coordinator()
-    coordinator._last_push = 100.0
-    coordinator._last_slow_push = 100.0
+    _mark_pushed(coordinator, 100.0, "status", "config")
+    # Already available, so the frame does not flip availability and
+    # force a push of its own
+    coordinator.available = True
+    coordinator._last_frame_ts = 100.0
 
     # Slow key message but not enough time passed
     message = {"config": {"setpoint_low": 90}}
@@ -468,45 +878,44 @@ async def test_handle_ws_message_slow_key_respects_interval():
     with patch.object(
         coordinator, "async_set_updated_data"
     ) as mock_update:
-        with patch(
-            "time.time", return_value=105.0
-        ):  # Only 5 seconds passed
-            await coordinator.handle_ws_message(message)
+        _set_time(coordinator, 105.0)  # Only 5 seconds passed
+        await coordinator.handle_ws_message(message)
 
     mock_update.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_handle_ws_message_slow_key_updates_snapshot_when_interval_passed():
+async def test_handle_ws_message_slow_key_pushes_when_interval_passed():
     coordinator, _ = _make_coordinator()
     coordinator.data = {
         "config": {"setpoint_low": 90},
         "status": {"qset": 100},
     }
-    coordinator._last_push = 100.0
-    coordinator._last_slow_push = 100.0
+    _mark_pushed(coordinator, 100.0, "status", "config")
 
     with patch.object(
         coordinator, "async_set_updated_data"
     ) as mock_update:
         with patch.object(coordinator, "_update_filter_issue"):
-            with patch(
-                "time.time", return_value=100.0 + SLOW_PUSH_INTERVAL + 1
-            ):
-                await coordinator.handle_ws_message(
-                    {"config": {"setpoint_mid": 180}}
-                )
+            _set_time(
+                coordinator,
+                100.0 + DEFAULT_PUSH_INTERVALS["status"] + 1,
+            )
+            await coordinator.handle_ws_message(
+                {"config": {"setpoint_mid": 180}}
+            )
 
     mock_update.assert_called_once()
-    assert coordinator._last_slow_push > 100.0
-    assert "config" in coordinator._last_slow_snapshot
+    # The config group was stamped, so an immediate repeat is throttled
+    assert not coordinator.push_policy.due(["config"], 112.0)
 
 
 @pytest.mark.asyncio
 async def test_handle_ws_message_fast_mode_uses_shorter_interval():
     coordinator, _ = _make_coordinator()
-    coordinator._last_push = 100.0
-    coordinator._fast_mode_until = 200.0  # In fast mode
+    _mark_pushed(coordinator, 100.0, "status")
+    _set_time(coordinator, 103.0)
+    coordinator.mark_control_action()
 
     message = {"status": {"qset": 150}}
 
@@ -514,19 +923,17 @@ async def test_handle_ws_message_fast_mode_uses_shorter_interval():
         coordinator, "async_set_updated_data"
     ) as mock_update:
         with patch.object(coordinator, "_update_filter_issue"):
-            # Fast interval (20s) passed, but not slow interval (10s default)
-            with patch(
-                "time.time", return_value=100.0 + FAST_MODE_SECONDS + 1
-            ):
-                await coordinator.handle_ws_message(message)
+            # Fast interval (5s) passed, but not the normal one (10s)
+            _set_time(coordinator, 106.0)
+            await coordinator.handle_ws_message(message)
 
     mock_update.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_handle_ws_message_preset_expiry_restores_schedule():
-    coordinator, _ = _make_coordinator()
-    coordinator._last_override_active = True
+    coordinator, hass = _make_coordinator()
+    coordinator.override.sync(10)
     coordinator._restore_schedule_after_override = True
     coordinator.data = {
         "config": {
@@ -542,23 +949,69 @@ async def test_handle_ws_message_preset_expiry_restores_schedule():
         coordinator, "async_set_updated_data"
     ) as mock_update:
         with patch.object(coordinator, "_update_filter_issue"):
-            with patch("time.time", return_value=1000.0):
-                await coordinator.handle_ws_message(
-                    {"status": {"override_set_time_left": 0}}
-                )
+            _set_time(coordinator, 1000.0)
+            await coordinator.handle_ws_message(
+                {"status": {"override_set_time_left": 0}}
+            )
+            await _run_created_tasks(hass)
 
     coordinator.async_send_config.assert_awaited_once_with(
         {"schedule_enabled": True},
         "schedule restore after preset",
+        WritePriority.AUTOMATION,
     )
     assert coordinator._restore_schedule_after_override is False
     mock_update.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_preset_deadline_waits_for_device_to_report_override_end():
+    coordinator, hass = _make_coordinator()
+    coordinator.override.sync(10)
+    coordinator._restore_schedule_after_override = True
+    coordinator.data = {
+        "config": {
+            "schedule_enabled": False,
+            "schedule_0_time": "08:00",
+            "schedule_0_value": 120,
+        },
+        "status": {"override_set_time_left": 3},
+    }
+    coordinator.async_send_config = AsyncMock(return_value=True)
+
+    # Local deadline passes while the device still counts down
+    _set_time(coordinator, 10.0)
+    coordinator._async_override_timer()
+    await _run_created_tasks(hass)
+    coordinator.async_send_config.assert_not_called()
+    assert coordinator._restore_schedule_after_override is True
+
+    with patch.object(coordinator, "_update_filter_issue"):
+        _set_time(coordinator, 12.0)
+        await coordinator.handle_ws_message(
+            {"status": {"override_set_time_left": 1}}
+        )
+        await _run_created_tasks(hass)
+        coordinator.async_send_config.assert_not_called()
+
+        _set_time(coordinator, 13.0)
+        await coordinator.handle_ws_message(
+            {"status": {"override_set_time_left": 0}}
+        )
+        await _run_created_tasks(hass)
+
+    coordinator.async_send_config.assert_awaited_once_with(
+        {"schedule_enabled": True},
+        "schedule restore after preset",
+        WritePriority.AUTOMATION,
+    )
+    assert coordinator._restore_schedule_after_override is False
+
+
 @pytest.mark.asyncio
 async def test_handle_ws_message_preset_expiry_skips_restore_when_schedule_on():
-    coordinator, _ = _make_coordinator()
-    coordinator._last_override_active = True
+    coordinator, hass = _make_coordinator()
+    coordinator.override.sync(10)
     coordinator._restore_schedule_after_override = True
     coordinator.data = {
         "config": {"schedule_enabled": True},
@@ -567,10 +1020,11 @@ async def test_handle_ws_message_preset_expiry_skips_restore_when_schedule_on():
     coordinator.async_send_config = AsyncMock(return_value=True)
 
     with patch.object(coordinator, "_update_filter_issue"):
-        with patch("time.time", return_value=1000.0):
-            await coordinator.handle_ws_message(
-                {"status": {"override_set_time_left": 0}}
-            )
+        _set_time(coordinator, 1000.0)
+        await coordinator.handle_ws_message(
+            {"status": {"override_set_time_left": 0}}
+        )
+        await _run_created_tasks(hass)
 
     coordinator.async_send_config.assert_not_called()
     assert coordinator._restore_schedule_after_override is False
@@ -578,9 +1032,9 @@ async def test_handle_ws_message_preset_expiry_skips_restore_when_schedule_on():
 
 @pytest.mark.asyncio
 async def test_preset_click_then_expiry_reenables_schedule_end_to_end():
-    coordinator, _ = _make_coordinator()
+    coordinator, hass = _make_coordinator()
     coordinator.ws = MagicMock()
-    coordinator.ws.send_json = AsyncMock()
+    coordinator.ws.send_json = AsyncMock(side_effect=_send_now)
     coordinator.data = {
         "config": {
             "schedule_enabled": False,
@@ -599,13 +1053,16 @@ async def test_preset_click_then_expiry_reenables_schedule_end_to_end():
     coordinator.ws.send_json.reset_mock()
 
     with patch.object(coordinator, "_update_filter_issue"):
-        with patch("time.time", return_value=1000.0):
-            await coordinator.handle_ws_message(
-                {"status": {"override_set_time_left": 0}}
-            )
+        _set_time(coordinator, 1000.0)
+        await coordinator.handle_ws_message(
+            {"status": {"override_set_time_left": 0}}
+        )
+        await _run_created_tasks(hass)
 
     coordinator.ws.send_json.assert_called_once_with(
-        {"config": {"schedule_enabled": True}}
+        {"config": {"schedule_enabled": True}},
+        priority=WritePriority.AUTOMATION,
+        on_sent=ANY,
     )
     assert coordinator._restore_schedule_after_override is False
 
@@ -613,8 +1070,8 @@ async def test_preset_click_then_expiry_reenables_schedule_end_to_end():
 @pytest.mark.asyncio
 async def test_preset_expiry_skips_restore_when_no_schedule_exists():
     """Test that schedule is NOT enabled if no schedule is configured."""
-    coordinator, _ = _make_coordinator()
-    coordinator._last_override_active = True
+    coordinator, hass = _make_coordinator()
+    coordinator.override.sync(10)
     coordinator._restore_schedule_after_override = True
     coordinator.data = {
         "config": {
@@ -626,10 +1083,11 @@ async def test_preset_expiry_skips_restore_when_no_schedule_exists():
     coordinator.async_send_config = AsyncMock(return_value=True)
 
     with patch.object(coordinator, "_update_filter_issue"):
-        with patch("time.time", return_value=1000.0):
-            await coordinator.handle_ws_message(
-                {"status": {"override_set_time_left": 0}}
-            )
+        _set_time(coordinator, 1000.0)
+        await coordinator.handle_ws_message(
+            {"status": {"override_set_time_left": 0}}
+        )
+        await _run_created_tasks(hass)
 
     # Should NOT call async_send_config because no schedule exists
     coordinator.async_send_config.assert_not_called()
@@ -639,8 +1097,8 @@ async def test_preset_expiry_skips_restore_when_no_schedule_exists():
 @pytest.mark.asyncio
 async def test_preset_expiry_restores_when_schedule_exists():
     """Test that schedule IS enabled when valid schedule exists."""
-    coordinator, _ = _make_coordinator()
-    coordinator._last_override_active = True
+    coordinator, hass = _make_coordinator()
+    coordinator.override.sync(10)
     coordinator._restore_schedule_after_override = True
     coordinator.data = {
         "config": {
@@ -655,63 +1113,21 @@ async def test_preset_expiry_restores_when_schedule_exists():
     coordinator.async_send_config = AsyncMock(return_value=True)
 
     with patch.object(coordinator, "_update_filter_issue"):
-        with patch("time.time", return_value=1000.0):
-            await coordinator.handle_ws_message(
-                {"status": {"override_set_time_left": 0}}
-            )
+        _set_time(coordinator, 1000.0)
+        await coordinator.handle_ws_message(
+            {"status": {"override_set_time_left": 0}}
+        )
+        await _run_created_tasks(hass)
 
     # Should call async_send_config because valid schedule exists
     coordinator.async_send_config.assert_awaited_once_with(
         {"schedule_enabled": True},
         "schedule restore after preset",
+        WritePriority.AUTOMATION,
     )
     assert coordinator._restore_schedule_after_override is False
 
 
-def test_has_valid_schedule_with_valid_entries():
-    """Test _has_valid_schedule returns True when schedule exists."""
-    coordinator, _ = _make_coordinator()
-    config = {
-        "schedule_0_time": "08:00",
-        "schedule_0_value": 120,
-        "schedule_1_time": "18:00",
-        "schedule_1_value": 180,
-    }
-    assert coordinator._has_valid_schedule(config) is True
-
-
-def test_has_valid_schedule_with_no_entries():
-    """Test _has_valid_schedule returns False when no schedule exists."""
-    coordinator, _ = _make_coordinator()
-    config = {
-        "schedule_enabled": False,
-        "setpoint_low": 90,
-        "setpoint_mid": 180,
-    }
-    assert coordinator._has_valid_schedule(config) is False
-
-
-def test_has_valid_schedule_with_incomplete_entries():
-    """Test _has_valid_schedule returns False when schedule is incomplete."""
-    coordinator, _ = _make_coordinator()
-    # Only time, no value
-    config = {
-        "schedule_0_time": "08:00",
-    }
-    assert coordinator._has_valid_schedule(config) is False
-
-
-def test_has_valid_schedule_with_partial_valid_entries():
-    """Test _has_valid_schedule returns True when at least one complete entry exists."""
-    coordinator, _ = _make_coordinator()
-    config = {
-        "schedule_0_time": "08:00",  # incomplete
-        "schedule_1_time": "18:00",
-        "schedule_1_value": 180,  # complete
-    }
-    assert coordinator._has_valid_schedule(config) is True
-
-
 # ---------------------------------------------------------------------------
 # Merge Payload
 # ---------------------------------------------------------------------------
@@ -756,43 +1172,88 @@ def test_merge_payload_replaces_non_dict_with_dict():
     assert coordinator.data["status"] == {"qset": 100}
 
 
+@pytest.mark.asyncio
+async def test_handle_ws_message_drops_unused_sections():
+    coordinator, _ = _make_coordinator()
+
+    with patch.object(coordinator, "async_set_updated_data"):
+        await coordinator.handle_ws_message(
+            {
+                "status": {"qset": 100},
+                "debug": {"heap": 1},
+                "comm_bt": {"enabled": False},
+            }
+        )
+
+    assert set(coordinator.data) == {"status"}
+
+
+@pytest.mark.asyncio
+async def test_handle_ws_message_full_capture_keeps_everything():
+    coordinator, _ = _make_coordinator(options={"full_capture": True})
+
+    with patch.object(coordinator, "async_set_updated_data"):
+        await coordinator.handle_ws_message(
+            {"status": {"qset": 100}, "debug": {"heap": 1}}
+        )
+
+    assert coordinator.data["debug"] == {"heap": 1}
+
+    coordinator.set_full_capture(False)
+
+    assert set(coordinator.data) == {"status"}
+
+
 # ---------------------------------------------------------------------------
 # Filter Issue Management
 # ---------------------------------------------------------------------------
 
 
-def test_update_filter_issue_creates_warning_when_overdue():
+def test_update_filter_issue_feeds_filter_state():
     coordinator, _ = _make_coordinator()
     coordinator.data = {"config": {"filter_datetime": 1000.0}}
+    coordinator.filter_state = MagicMock()
 
-    with patch(
-        "time.time", return_value=2000.0
-    ):  # Past the filter date
-        with patch(
-            "custom_components.ecostream.coordinator.ir"
-        ) as mock_ir:
-            coordinator._update_filter_issue()
+    coordinator._update_filter_issue()
 
-            mock_ir.async_create_issue.assert_called_once()
-            call_args = mock_ir.async_create_issue.call_args
-            assert call_args[0][1] == DOMAIN
-            assert call_args[0][2] == "filter_replacement_overdue"
+    coordinator.filter_state.async_update.assert_called_once_with(
+        1000.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_handle_ws_message_updates_filter_only_on_filter_datetime():
+    coordinator, _ = _make_coordinator()
+
+    with patch.object(coordinator, "async_set_updated_data"):
+        with patch.object(
+            coordinator, "_update_filter_issue"
+        ) as update:
+            await coordinator.handle_ws_message(
+                {"config": {"setpoint_low": 90}}
+            )
+            update.assert_not_called()
+
+            await coordinator.handle_ws_message(
+                {"config": {"filter_datetime": 2000}}
+            )
+            update.assert_called_once()
 
 
-def test_update_filter_issue_deletes_when_not_overdue():
+def test_update_filter_issue_creates_warning_when_overdue():
     coordinator, _ = _make_coordinator()
-    coordinator.data = {"config": {"filter_datetime": 2000.0}}
+    coordinator.data = {"config": {"filter_datetime": 1000.0}}
 
     with patch(
-        "time.time", return_value=1000.0
-    ):  # Before the filter date
+        "time.time", return_value=2000.0
+    ):  # Past the filter date
         with patch(
-            "custom_components.ecostream.coordinator.ir"
+            "custom_components.ecostream.filter_state.ir"
         ) as mock_ir:
             coordinator._update_filter_issue()
 
-            mock_ir.async_delete_issue.assert_called_once()
-            call_args = mock_ir.async_delete_issue.call_args
+            mock_ir.async_create_issue.assert_called_once()
+            call_args = mock_ir.async_create_issue.call_args
             assert call_args[0][1] == DOMAIN
             assert call_args[0][2] == "filter_replacement_overdue"
 
@@ -801,17 +1262,9 @@ def test_update_filter_issue_deletes_when_no_filter_datetime():
     coordinator, _ = _make_coordinator()
     coordinator.data = {"config": {}}
 
-    with patch("custom_components.ecostream.coordinator.ir") as mock_ir:
-        coordinator._update_filter_issue()
-
-        mock_ir.async_delete_issue.assert_called_once()
-
-
-def test_update_filter_issue_deletes_when_filter_datetime_zero():
-    coordinator, _ = _make_coordinator()
-    coordinator.data = {"config": {"filter_datetime": 0}}
-
-    with patch("custom_components.ecostream.coordinator.ir") as mock_ir:
+    with patch(
+        "custom_components.ecostream.filter_state.ir"
+    ) as mock_ir:
         coordinator._update_filter_issue()
 
         mock_ir.async_delete_issue.assert_called_once()
@@ -830,20 +1283,3 @@ async def test_async_update_data_returns_current_data():
     result = await coordinator._async_update_data()
 
     assert result == {"status": {"qset": 123}}
-
-
-# ---------------------------------------------------------------------------
-# Reconnect Loop Constants
-# ---------------------------------------------------------------------------
-
-
-def test_reconnect_constants():
-    """Test that constants are reasonable."""
-    assert RECONNECT_INTERVAL == 3600  # 1 hour
-    assert RECONNECT_JITTER == 300  # 5 minutes
-    assert RECONNECT_MIN_SLEEP == 60  # 1 minute
-
-    # Ensure min sleep is less than interval
-    assert RECONNECT_MIN_SLEEP < RECONNECT_INTERVAL
-    # Ensure jitter doesn't make sleep negative
-    assert RECONNECT_INTERVAL - RECONNECT_JITTER > 0
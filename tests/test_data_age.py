@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.const import CONF_STALE_AS_ATTRIBUTE
+from custom_components.ecostream.data_age import (
+    EcostreamDataAge,
+    max_age_key,
+)
+
+_MODULE = "custom_components.ecostream.data_age"
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def mock_utcnow():
+    with patch(
+        f"{_MODULE}.dt_util.utcnow",
+        return_value=datetime(2026, 1, 1, 12, tzinfo=UTC),
+    ) as mock:
+        yield mock
+
+
+def test_defaults_check_nothing():
+    data_age = EcostreamDataAge(_Clock())
+
+    assert data_age.max_ages == {
+        "status": 0,
+        "config": 0,
+        "system": 0,
+        "comm_wifi": 0,
+    }
+    data_age.touch({"status": {}, "config": {}}, 1000.0)
+    assert data_age.next_deadline() is None
+
+    # A silent status stream is left to the availability grace timer,
+    # config is only sent on change
+    assert data_age.refresh(5000.0) is False
+    assert data_age.stale == frozenset()
+    assert data_age.unavailable == frozenset()
+
+
+def test_touch_stamps_only_tracked_sections_in_frame():
+    data_age = EcostreamDataAge(_Clock())
+
+    data_age.touch({"status": {}, "debug": {}}, 1000.0)
+    data_age.touch({"comm_wifi": {}}, 1010.0)
+
+    assert data_age.updated == {"status": 1000.0, "comm_wifi": 1010.0}
+
+
+def test_refresh_reports_changes_once():
+    clock = _Clock()
+    data_age = EcostreamDataAge(clock, {max_age_key("status"): 60})
+    data_age.touch({"status": {}}, 1000.0)
+
+    assert data_age.refresh(1059.0) is False
+    assert data_age.refresh(1060.0) is True
+    assert data_age.refresh(1100.0) is False
+
+    # A new frame makes the section fresh again
+    data_age.touch({"status": {}}, 1100.0)
+    assert data_age.refresh(1100.0) is True
+    assert data_age.stale == frozenset()
+    assert data_age.next_deadline() == 1160.0
+
+
+def test_next_deadline_is_earliest_fresh_section():
+    data_age = EcostreamDataAge(
+        _Clock(),
+        {max_age_key("status"): 60, max_age_key("config"): 600},
+    )
+    data_age.touch({"config": {}}, 1000.0)
+    data_age.touch({"status": {}}, 1100.0)
+
+    assert data_age.next_deadline() == 1160.0
+    data_age.refresh(1160.0)
+    assert data_age.next_deadline() == 1600.0
+
+
+def test_stale_as_attribute_flags_instead_of_unavailable():
+    clock = _Clock()
+    data_age = EcostreamDataAge(
+        clock,
+        {max_age_key("status"): 60, CONF_STALE_AS_ATTRIBUTE: True},
+    )
+    data_age.touch({"status": {}}, 1000.0)
+
+    assert data_age.attributes("status") is None
+    assert data_age.refresh(1090.0) is True
+    assert data_age.unavailable == frozenset()
+    assert data_age.flagged == frozenset({"status"})
+    # Last update derived from the monotonic age, stable per write
+    assert data_age.attributes("status") == {
+        "stale": True,
+        "last_data_update": datetime(
+            2026, 1, 1, 11, 58, 30, tzinfo=UTC
+        ),
+    }
+    assert data_age.attributes("config") is None
+
+
+def test_configure_switches_mode_of_stale_sections():
+    clock = _Clock(1090.0)
+    data_age = EcostreamDataAge(clock, {max_age_key("status"): 60})
+    data_age.touch({"status": {}}, 1000.0)
+    data_age.refresh(1090.0)
+    assert data_age.unavailable == frozenset({"status"})
+
+    options = {max_age_key("status"): 60, CONF_STALE_AS_ATTRIBUTE: True}
+    assert data_age.configure(options) is True
+    assert data_age.unavailable == frozenset()
+    assert data_age.flagged == frozenset({"status"})
+    assert data_age.configure(options) is False
+
+    # Disabling the check clears the stale state
+    assert data_age.configure({max_age_key("status"): 0}) is True
+    assert data_age.stale == frozenset()
+    assert data_age.flagged == frozenset()
+
+
+def test_as_dict():
+    clock = _Clock(1012.34)
+    data_age = EcostreamDataAge(clock)
+    data_age.touch({"status": {}}, 1000.0)
+
+    assert data_age.as_dict() == {
+        "max_ages": {
+            "status": 0,
+            "config": 0,
+            "system": 0,
+            "comm_wifi": 0,
+        },
+        "stale_as_attribute": False,
+        "ages": {"status": 12.3},
+        "stale": [],
+    }
@@ -15,9 +15,23 @@ import pytest
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from custom_components.ecostream import diagnostics
+from custom_components.ecostream.data_age import (
+    EcostreamDataAge,
+    max_age_key,
+)
 from custom_components.ecostream.diagnostics import (
     async_get_config_entry_diagnostics,
 )
+from custom_components.ecostream.metrics import EcostreamMetrics
+from custom_components.ecostream.outbound import (
+    EcostreamOutboundQueue,
+)
+from custom_components.ecostream.push_policy import EcostreamPushPolicy
+from custom_components.ecostream.rate_limit import EcostreamTokenBucket
+from custom_components.ecostream.resolver import EcostreamHostResolver
+from custom_components.ecostream.telemetry import (
+    EcostreamConnectionTelemetry,
+)
 
 
 class IconsFileData(TypedDict):
@@ -209,3 +223,124 @@ class TestAsyncGetConfigEntryDiagnostics:
         assert result["raw_data"] == {
             "status": {"temp": 25, "humidity": 60}
         }
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_includes_latency_percentiles(self):
+        """Test diagnostics reports pipeline latency histograms."""
+        hass = AsyncMock(spec=HomeAssistant)
+        entry = MagicMock(spec=ConfigEntry)
+        entry.as_dict.return_value = {}
+
+        metrics = EcostreamMetrics()
+        metrics.process.record(3_000_000)
+        coordinator = MagicMock()
+        coordinator.options = {}
+        coordinator.data = {}
+        coordinator.last_update_success_time = None
+        coordinator.metrics = metrics
+        entry.runtime_data = coordinator
+
+        with patch(
+            "custom_components.ecostream.diagnostics._validate_icons",
+            return_value={"ok": True},
+        ):
+            result = await async_get_config_entry_diagnostics(
+                hass, entry
+            )
+
+        assert set(result["latency"]) == {
+            "receive",
+            "decode",
+            "process",
+            "loop_lag",
+        }
+        assert result["latency"]["process"]["count"] == 1
+        assert result["latency"]["receive"]["p95_ms"] is None
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_includes_push_policy(self):
+        """Test diagnostics reports push intervals and data age."""
+        hass = AsyncMock(spec=HomeAssistant)
+        entry = MagicMock(spec=ConfigEntry)
+        entry.as_dict.return_value = {}
+
+        coordinator = MagicMock()
+        coordinator.options = {}
+        coordinator.data = {}
+        coordinator.last_update_success_time = None
+        coordinator.push_policy = EcostreamPushPolicy(
+            {"push_interval_status": 30, "ignore_debug": True}
+        )
+        coordinator.data_age = EcostreamDataAge(
+            lambda: 1100.0, {max_age_key("status"): 60}
+        )
+        coordinator.data_age.touch({"status": {}}, 1000.0)
+        coordinator.data_age.refresh(1100.0)
+        entry.runtime_data = coordinator
+
+        with patch(
+            "custom_components.ecostream.diagnostics._validate_icons",
+            return_value={"ok": True},
+        ):
+            result = await async_get_config_entry_diagnostics(
+                hass, entry
+            )
+
+        push_policy = result["coordinator"]["push_policy"]
+        assert push_policy["intervals"]["status"] == 30.0
+        assert push_policy["ignored"] == ["debug"]
+        data_age = result["coordinator"]["data_age"]
+        assert data_age["ages"] == {"status": 100.0}
+        assert data_age["stale"] == ["status"]
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_includes_command_path(self):
+        """Test diagnostics reports queue, rate limit and telemetry."""
+        hass = AsyncMock(spec=HomeAssistant)
+        entry = MagicMock(spec=ConfigEntry)
+        entry.as_dict.return_value = {}
+
+        coordinator = MagicMock()
+        coordinator.options = {}
+        coordinator.data = {}
+        coordinator.last_update_success_time = None
+        coordinator.outbound = EcostreamOutboundQueue(lambda: 1000.0)
+        coordinator.outbound.push({"schedule_enabled": False})
+        coordinator.outbound.push({"schedule_enabled": True})
+        coordinator.rate_limiter = EcostreamTokenBucket(
+            lambda: 1000.0, {"command_burst": 2}
+        )
+        coordinator.rate_limiter.take()
+        coordinator.telemetry = EcostreamConnectionTelemetry(
+            lambda: 1000.0
+        )
+        coordinator.telemetry.connecting()
+        coordinator.telemetry.connected(990.0)
+        coordinator.resolver = EcostreamHostResolver(
+            hass, "ecostream.local", lambda: 1000.0
+        )
+        coordinator.resolver.update("192.168.1.7")
+        entry.runtime_data = coordinator
+
+        with patch(
+            "custom_components.ecostream.diagnostics._validate_icons",
+            return_value={"ok": True},
+        ):
+            result = await async_get_config_entry_diagnostics(
+                hass, entry
+            )
+
+        outbound = result["websocket"]["outbound_queue"]
+        assert outbound["depth"] == 1
+        assert outbound["queued"] == 2
+        assert outbound["coalesced"] == 1
+        rate_limit = result["websocket"]["command_rate_limit"]
+        assert rate_limit["burst"] == 2
+        assert rate_limit["tokens"] == 1
+        assert rate_limit["sent"] == 1
+        telemetry = result["websocket"]["telemetry"]
+        assert telemetry["state"] == "connected"
+        assert telemetry["current_connection_seconds"] == 10
+        resolver = result["websocket"]["resolver"]
+        assert resolver["address"] == "192.168.1.7"
+        assert resolver["source"] == "discovery"
@@ -36,22 +36,29 @@ from custom_components.ecostream.const import (
     PRESET_MID,
 )
 from custom_components.ecostream.fan import EcostreamVentilationFan
+from custom_components.ecostream.presets import EcostreamPresetResolver
+from custom_components.ecostream.websocket_api import WritePriority
 
 
 def _make_fan(
     data: dict[str, Any] | None = None,
     ws: bool = True,
-    last_update_success: bool = True,
+    available: bool = True,
     entry_options: dict[str, Any] | None = None,
 ) -> tuple[EcostreamVentilationFan, MagicMock]:
     coordinator = MagicMock()
     coordinator.data = data or {}
     coordinator.host = "192.168.1.1"
-    coordinator.last_update_success = last_update_success
+    coordinator.available = available
     coordinator.ws = MagicMock() if ws else None
     if ws:
         coordinator.ws.send_json = AsyncMock()
     coordinator.mark_control_action = MagicMock()
+    coordinator.presets = EcostreamPresetResolver()
+    coordinator.presets.update(
+        coordinator.data.get("config", {}),
+        coordinator.data.get("status", {}),
+    )
     entry = MagicMock(spec=ConfigEntry)
     entry.entry_id = "test_entry"
     entry.options = entry_options or {}
@@ -110,13 +117,13 @@ def test_device_info():
     assert device_info.get("model") == DEVICE_MODEL
 
 
-def test_available_when_last_update_success():
-    fan, _ = _make_fan(last_update_success=True)
+def test_available_follows_coordinator():
+    fan, _ = _make_fan(available=True)
     assert fan.available is True
 
 
-def test_not_available_when_last_update_success_false():
-    fan, _ = _make_fan(last_update_success=False)
+def test_not_available_when_coordinator_unavailable():
+    fan, _ = _make_fan(available=False)
     assert fan.available is False
 
 
@@ -362,7 +369,8 @@ def test_calculate_preset_closest_to_low():
             },
         }
     )
-    assert fan._calculate_preset(95) == PRESET_LOW
+    fan._handle_coordinator_update()
+    assert fan.preset_mode == PRESET_LOW
 
 
 def test_calculate_preset_closest_to_mid():
@@ -376,7 +384,8 @@ def test_calculate_preset_closest_to_mid():
             },
         }
     )
-    assert fan._calculate_preset(175) == PRESET_MID
+    fan._handle_coordinator_update()
+    assert fan.preset_mode == PRESET_MID
 
 
 def test_calculate_preset_closest_to_high():
@@ -390,55 +399,14 @@ def test_calculate_preset_closest_to_high():
             },
         }
     )
-    assert fan._calculate_preset(265) == PRESET_HIGH
+    fan._handle_coordinator_update()
+    assert fan.preset_mode == PRESET_HIGH
 
 
 def test_calculate_preset_no_setpoints_returns_none():
-    fan, _ = _make_fan({"config": {}})
-    assert fan._calculate_preset(100) is None
-
-
-# Additional tests for coverage improvement
-def test_get_setpoint_with_invalid_value():
-    """Test _get_setpoint when setpoint value cannot be converted to float."""
-    fan, _ = _make_fan(
-        {
-            "config": {
-                "setpoint_low": "invalid",
-                "setpoint_mid": 180,
-                "setpoint_high": 270,
-            }
-        }
-    )
-    assert fan._get_setpoint(PRESET_LOW) is None
-
-
-def test_get_setpoint_with_none_value():
-    """Test _get_setpoint when setpoint value is None."""
-    fan, _ = _make_fan(
-        {
-            "config": {
-                "setpoint_low": None,
-                "setpoint_mid": 180,
-                "setpoint_high": 270,
-            }
-        }
-    )
-    assert fan._get_setpoint(PRESET_LOW) is None
-
-
-def test_get_setpoint_with_invalid_preset():
-    """Test _get_setpoint with invalid preset name."""
-    fan, _ = _make_fan(
-        {
-            "config": {
-                "setpoint_low": 90,
-                "setpoint_mid": 180,
-                "setpoint_high": 270,
-            }
-        }
-    )
-    assert fan._get_setpoint("invalid_preset") is None
+    fan, _ = _make_fan({"config": {}, "status": {"qset": 100}})
+    fan._handle_coordinator_update()
+    assert fan.preset_mode is None
 
 
 @pytest.mark.asyncio
@@ -491,7 +459,11 @@ async def test_set_qset_with_async_send_config_awaitable():
 
     await fan.async_set_qset(200)
 
-    coordinator.async_send_config.assert_called_once()
+    coordinator.async_send_config.assert_called_once_with(
+        {"man_override_set": 200.0, "man_override_set_time": 3600},
+        "manual qset",
+        WritePriority.AUTOMATION,
+    )
     cast(MagicMock, fan.async_write_ha_state).assert_called_once()
 
 
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+import sys
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.filter_state import (
+    FILTER_ISSUE_ID,
+    EcostreamFilterState,
+)
+
+_MODULE = "custom_components.ecostream.filter_state"
+
+
+@pytest.fixture
+def mock_ir() -> Generator[MagicMock]:
+    with patch(f"{_MODULE}.ir") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_track() -> Generator[MagicMock]:
+    unsub = MagicMock()
+    with patch(
+        f"{_MODULE}.async_track_point_in_utc_time", return_value=unsub
+    ) as mock:
+        mock.unsub = unsub
+        yield mock
+
+
+def _make_state() -> tuple[EcostreamFilterState, MagicMock]:
+    on_change = MagicMock()
+    return EcostreamFilterState(MagicMock(), on_change), on_change
+
+
+def test_overdue_creates_issue_without_timer(
+    mock_ir: MagicMock, mock_track: MagicMock
+):
+    state, _ = _make_state()
+
+    with patch("time.time", return_value=2000.0):
+        state.async_update(1000)
+
+    assert state.overdue is True
+    mock_ir.async_create_issue.assert_called_once()
+    assert mock_ir.async_create_issue.call_args[0][2] == FILTER_ISSUE_ID
+    mock_track.assert_not_called()
+
+
+def test_future_due_date_deletes_issue_and_schedules_timer(
+    mock_ir: MagicMock, mock_track: MagicMock
+):
+    state, _ = _make_state()
+
+    with patch("time.time", return_value=1000.0):
+        state.async_update(2000)
+
+    assert state.overdue is False
+    mock_ir.async_delete_issue.assert_called_once()
+    mock_track.assert_called_once()
+    assert mock_track.call_args[0][2].timestamp() == 2000.0
+
+
+def test_unchanged_timestamp_is_a_noop(
+    mock_ir: MagicMock, mock_track: MagicMock
+):
+    state, _ = _make_state()
+
+    with patch("time.time", return_value=1000.0):
+        state.async_update(2000)
+        state.async_update(2000)
+        state.async_update(2000.0)
+
+    mock_ir.async_delete_issue.assert_called_once()
+    mock_track.assert_called_once()
+
+
+def test_new_timestamp_rearms_timer_without_registry_call(
+    mock_ir: MagicMock, mock_track: MagicMock
+):
+    state, _ = _make_state()
+
+    with patch("time.time", return_value=1000.0):
+        state.async_update(2000)
+        state.async_update(3000)
+
+    mock_track.unsub.assert_called_once()
+    assert mock_track.call_count == 2
+    # Still not overdue, so no second registry write
+    mock_ir.async_delete_issue.assert_called_once()
+    mock_ir.async_create_issue.assert_not_called()
+
+
+def test_due_timer_flips_state_and_notifies(
+    mock_ir: MagicMock, mock_track: MagicMock
+):
+    state, on_change = _make_state()
+
+    with patch("time.time", return_value=1000.0):
+        state.async_update(2000)
+
+    fire = mock_track.call_args[0][1]
+    fire(MagicMock())
+
+    assert state.overdue is True
+    mock_ir.async_create_issue.assert_called_once()
+    on_change.assert_called_once()
+
+
+def test_reset_after_overdue_deletes_issue(
+    mock_ir: MagicMock, mock_track: MagicMock
+):
+    state, _ = _make_state()
+
+    with patch("time.time", return_value=2000.0):
+        state.async_update(1000)
+        state.async_update(5000)
+
+    assert state.overdue is False
+    mock_ir.async_create_issue.assert_called_once()
+    mock_ir.async_delete_issue.assert_called_once()
+
+
+@pytest.mark.parametrize("value", [None, 0, -5, "soon", True])
+def test_invalid_timestamp_is_not_overdue(
+    mock_ir: MagicMock, mock_track: MagicMock, value: Any
+):
+    state, _ = _make_state()
+
+    state.async_update(value)
+
+    assert state.overdue is False
+    assert state.due_ts is None
+    mock_track.assert_not_called()
+
+
+def test_stop_cancels_pending_timer(
+    mock_ir: MagicMock, mock_track: MagicMock
+):
+    state, _ = _make_state()
+
+    with patch("time.time", return_value=1000.0):
+        state.async_update(2000)
+    state.async_stop()
+    state.async_stop()
+
+    mock_track.unsub.assert_called_once()
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+import gzip
+from pathlib import Path
+import sys
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.const import FRAME_LOG_MAX_BUFFER
+from custom_components.ecostream.frame_log import (
+    EcostreamFrameRecorder,
+    async_replay_frames,
+    read_frames,
+    rotated_frame_log_path,
+)
+
+_MODULE = "custom_components.ecostream.frame_log"
+
+
+def _make_hass() -> MagicMock:
+    hass = MagicMock()
+
+    async def _run_job(func: Callable[..., Any], *args: Any) -> Any:
+        return func(*args)
+
+    def _create_task(
+        coro: Coroutine[Any, Any, None], _name: str
+    ) -> asyncio.Task[None]:
+        return asyncio.ensure_future(coro)
+
+    hass.async_add_executor_job = AsyncMock(side_effect=_run_job)
+    hass.async_create_background_task = MagicMock(
+        side_effect=_create_task
+    )
+    return hass
+
+
+def _write_recording(path: Path, lines: list[str]) -> None:
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        fh.write("\n".join(lines) + "\n")
+
+
+@pytest.mark.asyncio
+async def test_recorder_batches_frames_until_stop(tmp_path: Path):
+    hass = _make_hass()
+    path = tmp_path / "frames.ndjson.gz"
+    clock = MagicMock(side_effect=[10.0, 10.25])
+    recorder = EcostreamFrameRecorder(hass, str(path), clock)
+
+    with patch(f"{_MODULE}.async_call_later") as call_later:
+        recorder.record('{"status": {"qset": 100}}')
+        recorder.record("garbage")
+
+    # One flush timer for the batch, nothing written yet
+    call_later.assert_called_once()
+    hass.async_add_executor_job.assert_not_called()
+
+    await recorder.async_stop()
+
+    assert recorder.frames_written == 2
+    assert read_frames(path) == [
+        (10.0, '{"status": {"qset": 100}}'),
+        (10.25, "garbage"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recorder_flushes_full_buffer_and_appends(tmp_path: Path):
+    hass = _make_hass()
+    path = tmp_path / "frames.ndjson.gz"
+    recorder = EcostreamFrameRecorder(hass, str(path), lambda: 0.0)
+
+    with patch(f"{_MODULE}.async_call_later"):
+        for i in range(FRAME_LOG_MAX_BUFFER + 1):
+            recorder.record(str(i))
+        await asyncio.sleep(0)
+        await recorder.async_stop()
+
+    assert hass.async_add_executor_job.call_count == 2
+    frames = read_frames(path)
+    assert [raw for _, raw in frames] == [
+        str(i) for i in range(FRAME_LOG_MAX_BUFFER + 1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recorder_rotates_at_max_size(tmp_path: Path):
+    hass = _make_hass()
+    path = tmp_path / "frames.ndjson.gz"
+    recorder = EcostreamFrameRecorder(
+        hass, str(path), lambda: 0.0, max_bytes=1
+    )
+
+    with patch(f"{_MODULE}.async_call_later"):
+        for batch in ("a", "b", "c"):
+            recorder.record(batch)
+            await recorder.async_stop()
+
+    # Only the latest full file is kept next to the current one
+    assert recorder.rotations == 2
+    assert recorder.frames_written == 3
+    assert [raw for _, raw in read_frames(path)] == ["c"]
+    rotated = rotated_frame_log_path(str(path))
+    assert [raw for _, raw in read_frames(rotated)] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_recorder_write_error_is_logged(tmp_path: Path):
+    hass = _make_hass()
+    recorder = EcostreamFrameRecorder(
+        hass,
+        str(tmp_path / "missing" / "frames.ndjson.gz"),
+        lambda: 0.0,
+    )
+    with patch(f"{_MODULE}.async_call_later"):
+        recorder.record("{}")
+    await recorder.async_stop()
+    assert recorder.frames_written == 0
+
+
+def test_read_frames_skips_corrupt_lines(tmp_path: Path):
+    path = tmp_path / "frames.ndjson.gz"
+    _write_recording(path, ['[1.0,"{}"]', "oops", "", '[2.5,"x"]'])
+    assert read_frames(path) == [(1.0, "{}"), (2.5, "x")]
+
+
+@pytest.mark.asyncio
+async def test_replay_feeds_handler_with_scaled_gaps(tmp_path: Path):
+    path = tmp_path / "frames.ndjson.gz"
+    _write_recording(
+        path,
+        [
+            '[100.0,"{\\"status\\": {\\"qset\\": 90}}"]',
+            '[102.0,"not json"]',
+            '[104.0,"[1, 2]"]',
+            '[110.0,"{\\"config\\": {}}"]',
+            '[5000.0,"{\\"system\\": {}}"]',
+        ],
+    )
+    handler = AsyncMock()
+
+    with patch(f"{_MODULE}.asyncio.sleep", new=AsyncMock()) as sleep:
+        delivered = await async_replay_frames(
+            _make_hass(), path, handler, speed=2.0, max_gap=60.0
+        )
+
+    assert delivered == 3
+    assert [c.args[0] for c in handler.call_args_list] == [
+        {"status": {"qset": 90}},
+        {"config": {}},
+        {"system": {}},
+    ]
+    assert [c.args[0] for c in sleep.call_args_list] == [
+        1.0,
+        1.0,
+        3.0,
+        30.0,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_replay_speed_zero_does_not_sleep(tmp_path: Path):
+    path = tmp_path / "frames.ndjson.gz"
+    _write_recording(path, ['[1.0,"{}"]', '[9.0,"{}"]'])
+    handler = AsyncMock()
+
+    with patch(f"{_MODULE}.asyncio.sleep", new=AsyncMock()) as sleep:
+        delivered = await async_replay_frames(
+            _make_hass(), path, handler, speed=0
+        )
+
+    assert delivered == 2
+    sleep.assert_not_called()
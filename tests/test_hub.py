@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from collections.abc import Coroutine
+from pathlib import Path
+import sys
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.const import HUB_LINK_CHECK_SECONDS
+from custom_components.ecostream.hub import (
+    DATA_HUB,
+    RECONNECT_INTERVAL,
+    RECONNECT_JITTER,
+    RECONNECT_MIN_SLEEP,
+    EcostreamHub,
+    async_get_hub,
+)
+
+_MODULE = "custom_components.ecostream.hub"
+
+
+def _close(coro: Coroutine[Any, Any, None], _name: str) -> None:
+    coro.close()
+
+
+def _make_hub() -> tuple[EcostreamHub, MagicMock]:
+    hass = MagicMock()
+    hass.data = {}
+    hass.loop.time.return_value = 0.0
+    hass.async_create_background_task = MagicMock(side_effect=_close)
+    return async_get_hub(hass), hass
+
+
+def _make_device(host: str, heartbeat_due: bool = False) -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.host = host
+    coordinator.ws.heartbeat_due = MagicMock(return_value=heartbeat_due)
+    coordinator.ws.async_send_heartbeat = AsyncMock()
+    coordinator.async_reconnect = AsyncMock()
+    return coordinator
+
+
+def _fire(hass: MagicMock, now: float) -> None:
+    """Advance loop time and run the wheel's armed wake-up."""
+    hass.loop.time.return_value = now
+    hass.loop.call_at.call_args[0][1]()
+
+
+def test_reconnect_constants():
+    assert RECONNECT_INTERVAL == 3600
+    assert RECONNECT_JITTER == 300
+    assert RECONNECT_MIN_SLEEP == 60
+    assert RECONNECT_INTERVAL - RECONNECT_JITTER > RECONNECT_MIN_SLEEP
+
+
+def test_get_hub_is_shared_per_hass():
+    hub, hass = _make_hub()
+    assert async_get_hub(hass) is hub
+    assert hass.data[DATA_HUB] is hub
+
+
+def test_single_loop_timer_for_many_devices():
+    hub, hass = _make_hub()
+    devices = [_make_device(f"10.0.0.{i}") for i in range(100)]
+    for device in devices:
+        hub.async_register(device)
+    assert hub.device_count == 100
+    assert len(hub.wheel) == 200
+    hass.loop.call_at.assert_called_once()
+
+    for device in devices:
+        hub.async_unregister(device)
+
+    assert hub.device_count == 0
+    assert len(hub.wheel) == 0
+    hass.loop.call_at.return_value.cancel.assert_called_once()
+
+
+def test_link_check_sends_due_heartbeats_and_checks_stale():
+    hub, hass = _make_hub()
+    quiet = _make_device("10.0.0.1", heartbeat_due=True)
+    busy = _make_device("10.0.0.2", heartbeat_due=False)
+    hub.async_register(quiet)
+    hub.async_register(busy)
+
+    _fire(hass, HUB_LINK_CHECK_SECONDS)
+
+    quiet.ws.check_stale.assert_called_once()
+    busy.ws.check_stale.assert_called_once()
+    # Silence is measured on the loop's monotonic clock
+    quiet.ws.heartbeat_due.assert_called_once_with(
+        HUB_LINK_CHECK_SECONDS
+    )
+    # Due heartbeats are flushed together after the wheel tick
+    hass.loop.call_soon.assert_called_once()
+    hass.loop.call_soon.call_args[0][0]()
+    quiet.ws.async_send_heartbeat.assert_called_once()
+    busy.ws.async_send_heartbeat.assert_not_called()
+    hass.async_create_background_task.assert_called_once()
+
+    # Both link checks were rescheduled
+    assert len(hub.wheel) == 4
+
+
+def test_scheduled_reconnect_fires_once_per_interval():
+    hub, hass = _make_hub()
+    device = _make_device("10.0.0.1")
+    with patch(f"{_MODULE}.random.uniform", return_value=0):
+        hub.async_register(device)
+    # Isolate the reconnect deadline
+    link_timer = hub._devices[device.host].link_timer
+    assert link_timer is not None
+    link_timer.cancel()
+
+    with patch(f"{_MODULE}.random.uniform", return_value=0):
+        _fire(hass, RECONNECT_INTERVAL)
+
+    device.async_reconnect.assert_called_once()
+    hass.async_create_background_task.assert_called_once()
+    # Next reconnect is armed for a full interval later
+    assert len(hub.wheel) == 1
+
+
+def test_reregister_replaces_previous_coordinator():
+    hub, _ = _make_hub()
+    old = _make_device("10.0.0.1")
+    new = _make_device("10.0.0.1")
+    hub.async_register(old)
+    hub.async_register(new)
+    assert len(hub.wheel) == 2
+
+    # A late unload of the old entry leaves the new one alone
+    hub.async_unregister(old)
+
+    assert hub.device_count == 1
+    assert len(hub.wheel) == 2
+
+
+@pytest.mark.asyncio
+async def test_send_heartbeats_gathers_all():
+    first, second = AsyncMock(), AsyncMock()
+    await EcostreamHub._async_send_heartbeats([first(), second()])
+    first.assert_awaited_once()
+    second.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_is_shared_and_closed_after_last_unit():
+    hub, _ = _make_hub()
+    first, second = _make_device("10.0.0.1"), _make_device("10.0.0.2")
+    session = MagicMock(closed=False, close=AsyncMock())
+
+    resolver = MagicMock(close=AsyncMock())
+
+    with (
+        patch(
+            f"{_MODULE}.create_session", return_value=session
+        ) as create,
+        patch(
+            f"{_MODULE}.AsyncDualMDNSResolver", return_value=resolver
+        ),
+        patch(f"{_MODULE}.zeroconf.async_get_async_zeroconf"),
+    ):
+        hub.async_register(first)
+        hub.async_register(second)
+        assert hub.session is session
+        assert hub.session is session
+        # Hostnames are resolved the way the unit lookups are
+        create.assert_called_once_with(resolver)
+
+        hub.async_unregister(first)
+        await hub.async_close_session()
+        session.close.assert_not_awaited()
+
+        hub.async_unregister(second)
+        await hub.async_close_session()
+        session.close.assert_awaited_once()
+
+        # The next unit to start gets a fresh session
+        create.return_value = MagicMock(closed=False)
+        assert hub.session is create.return_value
+
+
+@pytest.mark.asyncio
+async def test_dns_resolver_uses_ha_zeroconf_and_closes_with_session():
+    hub, hass = _make_hub()
+    resolver = MagicMock(close=AsyncMock())
+
+    with (
+        patch(f"{_MODULE}.zeroconf.async_get_async_zeroconf") as get_zc,
+        patch(
+            f"{_MODULE}.AsyncDualMDNSResolver", return_value=resolver
+        ) as make,
+    ):
+        assert hub.dns_resolver is resolver
+        assert hub.dns_resolver is resolver
+
+    get_zc.assert_called_once_with(hass)
+    make.assert_called_once_with(async_zeroconf=get_zc.return_value)
+
+    hub.async_register(_make_device("10.0.0.1"))
+    await hub.async_close_session()
+    resolver.close.assert_not_awaited()
+
+    hub.async_unregister(hub._devices["10.0.0.1"].coordinator)
+    await hub.async_close_session()
+    resolver.close.assert_awaited_once()
@@ -13,10 +13,12 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 import custom_components.ecostream as ecostream
 from custom_components.ecostream import (
+    async_setup,
     async_setup_entry,
     async_unload_entry,
     const as ecostream_const,
 )
+from custom_components.ecostream.websocket_api import WritePriority
 
 DOMAIN: Final[str] = cast(str, ecostream_const.DOMAIN)
 # Access private functions for testing purposes
@@ -219,6 +221,21 @@ async def test_async_setup_entry_uses_default_options():
                 assert "boost_duration" in kwargs["options"]
 
 
+# ---------------------------------------------------------------------------
+# async_setup
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_async_setup_registers_profile_action():
+    hass = MagicMock()
+
+    assert await async_setup(hass, {}) is True
+
+    args = hass.services.async_register.call_args.args
+    assert args[:2] == (DOMAIN, "profile")
+
+
 # ---------------------------------------------------------------------------
 # async_unload_entry
 # ---------------------------------------------------------------------------
@@ -373,12 +390,23 @@ async def test_options_updated_with_filter_override_enabled():
         await async_options_updated(hass, entry)
 
     assert coordinator.boost_duration_minutes == 30
+    coordinator.push_policy.configure.assert_called_once_with(
+        entry.options
+    )
+    coordinator.rate_limiter.configure.assert_called_once_with(
+        entry.options
+    )
+    coordinator.set_full_capture.assert_called_once_with(False)
     coordinator.ws.send_json.assert_called_once()
     call_args = coordinator.ws.send_json.call_args[0][0]
     assert "config" in call_args
     assert "filter_datetime" in call_args["config"]
     expected_timestamp = 1000 + (90 * 86400)
     assert call_args["config"]["filter_datetime"] == expected_timestamp
+    assert (
+        coordinator.ws.send_json.call_args.kwargs["priority"]
+        == WritePriority.HOUSEKEEPING
+    )
 
 
 @pytest.mark.asyncio
@@ -444,6 +472,62 @@ async def test_options_updated_uses_defaults():
     assert coordinator.boost_duration_minutes == 15
 
 
+@pytest.mark.asyncio
+async def test_options_updated_recorder_light_toggle_reloads_entry():
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.options = {"recorder_light": True}
+
+    coordinator = MagicMock()
+    coordinator.ws = None
+    coordinator.recorder_light = False
+    entry.runtime_data = coordinator
+
+    await async_options_updated(hass, entry)
+
+    hass.config_entries.async_schedule_reload.assert_called_once_with(
+        "test_entry"
+    )
+
+
+@pytest.mark.asyncio
+async def test_options_updated_recorder_light_unchanged_no_reload():
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.options = {"recorder_light": False}
+
+    coordinator = MagicMock()
+    coordinator.ws = None
+    coordinator.recorder_light = False
+    coordinator.frame_recorder = None
+    entry.runtime_data = coordinator
+
+    await async_options_updated(hass, entry)
+
+    hass.config_entries.async_schedule_reload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_options_updated_record_frames_toggle_reloads_entry():
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.options = {"record_frames": True}
+
+    coordinator = MagicMock()
+    coordinator.ws = None
+    coordinator.recorder_light = False
+    coordinator.frame_recorder = None
+    entry.runtime_data = coordinator
+
+    await async_options_updated(hass, entry)
+
+    hass.config_entries.async_schedule_reload.assert_called_once_with(
+        "test_entry"
+    )
+
+
 # ---------------------------------------------------------------------------
 # async_unload_entry (legacy HA versions)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.const import (
+    METRICS_LAG_SAMPLE_SECONDS,
+    METRICS_WINDOW_SECONDS,
+)
+from custom_components.ecostream.metrics import (
+    EcostreamMetrics,
+    LatencyHistogram,
+)
+
+_MS = 1_000_000
+_WINDOW_NS = METRICS_WINDOW_SECONDS * 1_000_000_000
+
+
+def test_empty_histogram_has_no_percentiles():
+    hist = LatencyHistogram()
+    assert hist.percentile_ms(0.5) is None
+    assert hist.as_dict()["count"] == 0
+
+
+def test_percentiles_are_bucket_upper_bounds():
+    hist = LatencyHistogram()
+    now = hist._window_start
+    for _ in range(98):
+        hist.record(900_000, now)  # 0.9 ms
+    hist.record(5 * _MS, now)
+    hist.record(40 * _MS, now)
+
+    assert hist.percentile_ms(0.5) == 1.024
+    assert hist.percentile_ms(0.99) == 8.192
+    assert hist.percentile_ms(1.0) == 65.536
+    assert hist.as_dict()["max_ms"] == 40.0
+    assert hist.count == 100
+
+
+def test_overflow_bucket_reports_max():
+    hist = LatencyHistogram()
+    hist.record(60 * 1_000_000_000, hist._window_start)
+    assert hist.percentile_ms(0.5) == 60_000.0
+
+
+def test_old_windows_age_out():
+    hist = LatencyHistogram()
+    start = hist._window_start
+    hist.record(50 * _MS, start)
+
+    # Still visible one window later (previous window)
+    hist.record(_MS // 2, start + _WINDOW_NS)
+    assert hist.percentile_ms(1.0) == 65.536
+
+    # Gone after the next rotation
+    hist.record(_MS // 2, start + 2 * _WINDOW_NS)
+    assert hist.percentile_ms(1.0) == 0.512
+
+    # A long idle gap drops both windows
+    hist.record(_MS // 2, start + 10 * _WINDOW_NS)
+    assert hist.percentile_ms(0.0) == 0.512
+    assert sum(hist._previous) == 0
+
+
+def test_loop_lag_probe_is_rate_limited():
+    metrics = EcostreamMetrics()
+    loop = MagicMock()
+
+    metrics.sample_loop_lag(loop, 1_000)
+    metrics.sample_loop_lag(loop, 2_000)  # Probe still pending
+    loop.call_soon.assert_called_once()
+
+    probe, sent_ns = loop.call_soon.call_args[0]
+    with patch(
+        "custom_components.ecostream.metrics.time.perf_counter_ns",
+        return_value=sent_ns + 2 * _MS,
+    ):
+        probe(sent_ns)
+    assert metrics.loop_lag.count == 1
+    assert metrics.loop_lag.percentile_ms(0.5) == 2.048
+
+    metrics.sample_loop_lag(loop, 3_000)  # Within the sample interval
+    assert loop.call_soon.call_count == 1
+    metrics.sample_loop_lag(
+        loop, 1_000 + METRICS_LAG_SAMPLE_SECONDS * 1_000_000_000
+    )
+    assert loop.call_soon.call_count == 2
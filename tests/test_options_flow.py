@@ -9,8 +9,14 @@ import pytest
 from custom_components.ecostream.const import (
     CONF_ALLOW_OVERRIDE_FILTER_DATE,
     CONF_BOOST_DURATION,
+    CONF_COMMAND_LIMIT_SECTION,
+    CONF_DATA_AGE_SECTION,
     CONF_FILTER_REPLACEMENT_DAYS,
+    CONF_FULL_CAPTURE,
     CONF_PRESET_OVERRIDE_MINUTES,
+    CONF_PUSH_POLICY_SECTION,
+    CONF_RECORD_FRAMES,
+    CONF_RECORDER_LIGHT,
     DEFAULT_BOOST_DURATION_MINUTES,
     DEFAULT_FILTER_REPLACEMENT_DAYS,
     DEFAULT_PRESET_OVERRIDE_MINUTES,
@@ -102,6 +108,8 @@ async def test_async_step_init_shows_form_with_hardcoded_defaults_when_missing()
         defaults[CONF_BOOST_DURATION] == DEFAULT_BOOST_DURATION_MINUTES
     )
     assert defaults[CONF_ALLOW_OVERRIDE_FILTER_DATE] is False
+    assert defaults[CONF_RECORDER_LIGHT] is False
+    assert defaults[CONF_RECORD_FRAMES] is False
 
 
 @pytest.mark.asyncio
@@ -120,6 +128,8 @@ async def test_async_step_init_valid_input_creates_entry_and_updates_options():
             CONF_PRESET_OVERRIDE_MINUTES: 45,
             CONF_BOOST_DURATION: 10,
             CONF_ALLOW_OVERRIDE_FILTER_DATE: False,
+            CONF_RECORDER_LIGHT: True,
+            CONF_RECORD_FRAMES: True,
         }
     )
 
@@ -132,6 +142,153 @@ async def test_async_step_init_valid_input_creates_entry_and_updates_options():
     assert (
         result.get("data", {})[CONF_ALLOW_OVERRIDE_FILTER_DATE] is False
     )
+    assert result.get("data", {})[CONF_RECORDER_LIGHT] is True
+    assert result.get("data", {})[CONF_RECORD_FRAMES] is True
+
+
+@pytest.mark.asyncio
+async def test_async_step_init_push_policy_skips_dropped_sections():
+    entry = _make_entry(data={CONF_HOST: "host.local"}, options={})
+    flow = EcostreamOptionsFlow(entry)
+
+    flow.async_show_form = MagicMock(side_effect=_mock_show_form)
+
+    await flow.async_step_init()
+
+    schema = flow.async_show_form.call_args.kwargs["data_schema"].schema
+    section = next(
+        value
+        for key, value in schema.items()
+        if key == CONF_PUSH_POLICY_SECTION
+    )
+    keys = {str(key) for key in section.schema.schema}
+    # Only sections kept at ingest; no ignore switches
+    assert keys == {
+        "push_interval_status",
+        "push_interval_config",
+        "push_interval_system",
+        "push_interval_comm_wifi",
+        "fast_window_seconds",
+        "fast_push_interval_status",
+        "fast_push_interval_config",
+        "fast_push_interval_system",
+        "fast_push_interval_comm_wifi",
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_step_init_stores_push_policy_section():
+    entry = _make_entry(
+        data={CONF_HOST: "host.local"},
+        options={CONF_FULL_CAPTURE: True},
+    )
+    flow = EcostreamOptionsFlow(entry)
+
+    flow.async_create_entry = MagicMock(side_effect=_mock_create_entry)
+
+    result = await flow.async_step_init(
+        {
+            CONF_FILTER_REPLACEMENT_DAYS: 120,
+            CONF_PRESET_OVERRIDE_MINUTES: 45,
+            CONF_BOOST_DURATION: 10,
+            CONF_PUSH_POLICY_SECTION: {
+                "push_interval_status": 30,
+                "ignore_debug": True,
+            },
+        }
+    )
+
+    data = result.get("data", {})
+    assert data["push_interval_status"] == 30
+    assert data["ignore_debug"] is True
+    # Fields left out of the section keep their defaults
+    assert data["push_interval_config"] == 10
+    assert data["ignore_comm_bt"] is False
+
+
+@pytest.mark.asyncio
+async def test_async_step_init_invalid_push_interval_returns_error():
+    entry = _make_entry(data={CONF_HOST: "host.local"}, options={})
+    flow = EcostreamOptionsFlow(entry)
+
+    flow.async_show_form = MagicMock(side_effect=_mock_show_form)
+
+    result = await flow.async_step_init(
+        {
+            CONF_FILTER_REPLACEMENT_DAYS: 120,
+            CONF_PRESET_OVERRIDE_MINUTES: 45,
+            CONF_BOOST_DURATION: 10,
+            CONF_PUSH_POLICY_SECTION: {"push_interval_status": -1},
+        }
+    )
+
+    assert result.get("errors") == {"base": "invalid_number"}
+
+
+@pytest.mark.asyncio
+async def test_async_step_init_stores_command_limit_section():
+    entry = _make_entry(data={CONF_HOST: "host.local"}, options={})
+    flow = EcostreamOptionsFlow(entry)
+
+    flow.async_create_entry = MagicMock(side_effect=_mock_create_entry)
+
+    result = await flow.async_step_init(
+        {
+            CONF_FILTER_REPLACEMENT_DAYS: 120,
+            CONF_PRESET_OVERRIDE_MINUTES: 45,
+            CONF_BOOST_DURATION: 10,
+            CONF_COMMAND_LIMIT_SECTION: {"command_burst": 3},
+        }
+    )
+
+    data = result.get("data", {})
+    assert data["command_burst"] == 3
+    assert data["command_rate_per_minute"] == 12
+
+
+@pytest.mark.asyncio
+async def test_async_step_init_stores_data_age_section():
+    entry = _make_entry(data={CONF_HOST: "host.local"}, options={})
+    flow = EcostreamOptionsFlow(entry)
+
+    flow.async_create_entry = MagicMock(side_effect=_mock_create_entry)
+
+    result = await flow.async_step_init(
+        {
+            CONF_FILTER_REPLACEMENT_DAYS: 120,
+            CONF_PRESET_OVERRIDE_MINUTES: 45,
+            CONF_BOOST_DURATION: 10,
+            CONF_DATA_AGE_SECTION: {
+                "max_age_config": 3600,
+                "stale_as_attribute": True,
+            },
+        }
+    )
+
+    data = result.get("data", {})
+    assert data["max_age_status"] == 0
+    assert data["max_age_config"] == 3600
+    assert data["max_age_comm_wifi"] == 0
+    assert data["stale_as_attribute"] is True
+
+
+@pytest.mark.asyncio
+async def test_async_step_init_invalid_command_rate_returns_error():
+    entry = _make_entry(data={CONF_HOST: "host.local"}, options={})
+    flow = EcostreamOptionsFlow(entry)
+
+    flow.async_show_form = MagicMock(side_effect=_mock_show_form)
+
+    result = await flow.async_step_init(
+        {
+            CONF_FILTER_REPLACEMENT_DAYS: 120,
+            CONF_PRESET_OVERRIDE_MINUTES: 45,
+            CONF_BOOST_DURATION: 10,
+            CONF_COMMAND_LIMIT_SECTION: {"command_rate_per_minute": 0},
+        }
+    )
+
+    assert result.get("errors") == {"base": "invalid_number"}
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.outbound import (
+    EcostreamOutboundQueue,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _drain(queue: EcostreamOutboundQueue) -> list[dict[str, object]]:
+    configs: list[dict[str, object]] = []
+    while (command := queue.pop()) is not None:
+        configs.append(command.config)
+    return configs
+
+
+def test_replays_in_order():
+    queue = EcostreamOutboundQueue(_Clock())
+    queue.push({"schedule_enabled": False})
+    queue.push({"man_override_set": 180, "man_override_set_time": 600})
+
+    assert _drain(queue) == [
+        {"schedule_enabled": False},
+        {"man_override_set": 180, "man_override_set_time": 600},
+    ]
+    assert queue.replayed == 2
+    assert len(queue) == 0
+
+
+def test_newer_command_takes_over_shared_keys():
+    queue = EcostreamOutboundQueue(_Clock())
+    queue.push({"man_override_set": 180, "man_override_set_time": 600})
+    queue.push({"schedule_enabled": False})
+    queue.push({"man_override_set_time": 0})
+
+    assert _drain(queue) == [
+        {"man_override_set": 180},
+        {"schedule_enabled": False},
+        {"man_override_set_time": 0},
+    ]
+    assert queue.coalesced == 1
+
+
+def test_command_without_keys_left_is_dropped():
+    queue = EcostreamOutboundQueue(_Clock())
+    queue.push({"schedule_enabled": False})
+    queue.push({"schedule_enabled": True})
+
+    assert len(queue) == 1
+    assert _drain(queue) == [{"schedule_enabled": True}]
+
+
+def test_expired_commands_are_not_replayed():
+    clock = _Clock()
+    queue = EcostreamOutboundQueue(clock, ttl=60)
+    queue.push({"schedule_enabled": False})
+    queue.push({"filter_datetime": 1}, ttl=600)
+
+    clock.now += 60
+    assert _drain(queue) == [{"filter_datetime": 1}]
+    assert queue.expired == 1
+
+
+def test_overflow_drops_oldest():
+    queue = EcostreamOutboundQueue(_Clock(), max_commands=2)
+    for value in range(3):
+        queue.push({f"key_{value}": value})
+
+    assert queue.overflowed == 1
+    assert _drain(queue) == [{"key_1": 1}, {"key_2": 2}]
+
+
+def test_restore_keeps_newer_values():
+    queue = EcostreamOutboundQueue(_Clock())
+    queue.push({"man_override_set": 180, "man_override_set_time": 600})
+    command = queue.pop()
+    assert command is not None
+
+    queue.push({"man_override_set_time": 0})
+    queue.restore(command)
+
+    assert queue.replayed == 0
+    assert _drain(queue) == [
+        {"man_override_set": 180},
+        {"man_override_set_time": 0},
+    ]
+
+
+def test_as_dict_reports_depth_and_counters():
+    clock = _Clock()
+    queue = EcostreamOutboundQueue(clock, ttl=60)
+    queue.push({"schedule_enabled": False})
+    queue.push({"schedule_enabled": True})
+    queue.push({"filter_datetime": 1})
+    clock.now += 60
+
+    assert queue.as_dict() == {
+        "depth": 0,
+        "ttl_seconds": 60.0,
+        "max_commands": 20,
+        "queued": 3,
+        "coalesced": 1,
+        "expired": 2,
+        "overflowed": 0,
+        "replayed": 0,
+    }
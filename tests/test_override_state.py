@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.const import (
+    OVERRIDE_CONFIRM_SECONDS,
+    OVERRIDE_DRIFT_TOLERANCE_SECONDS,
+)
+from custom_components.ecostream.override_state import (
+    EcostreamOverrideState,
+)
+
+_MODULE = "custom_components.ecostream.override_state"
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def mock_utcnow():
+    with patch(
+        f"{_MODULE}.dt_util.utcnow",
+        return_value=datetime(2026, 1, 1, 12, tzinfo=UTC),
+    ) as mock:
+        yield mock
+
+
+def test_sync_starts_countdown_and_ignores_small_drift():
+    clock = _Clock()
+    state = EcostreamOverrideState(clock)
+
+    assert state.sync(600) is True
+    assert state.active is True
+    assert state.ends_at_utc == datetime(2026, 1, 1, 12, 10, tzinfo=UTC)
+
+    # Device ticks down in step with the local clock
+    clock.now += 30
+    assert state.sync(570) is False
+    assert state.sync(570 + OVERRIDE_DRIFT_TOLERANCE_SECONDS) is False
+    assert state.remaining == 570
+
+
+def test_sync_resyncs_when_drift_exceeds_tolerance():
+    clock = _Clock()
+    state = EcostreamOverrideState(clock)
+    state.sync(600)
+
+    # Extended from the app: end time moves
+    clock.now += 60
+    assert state.sync(900) is True
+    assert state.ends_at == clock.now + 900
+
+
+def test_sync_zero_clears_and_small_tail_is_ignored():
+    clock = _Clock()
+    state = EcostreamOverrideState(clock)
+    state.sync(600)
+
+    assert state.sync(0) is True
+    assert state.ends_at is None
+    assert state.ends_at_utc is None
+    assert state.active is False
+
+    assert state.sync(0) is False
+    assert state.sync(OVERRIDE_DRIFT_TOLERANCE_SECONDS) is False
+    assert state.sync(None) is False
+
+
+def test_start_ignores_stale_reports_until_confirmed():
+    clock = _Clock()
+    state = EcostreamOverrideState(clock)
+
+    assert state.start(900) is True
+    # A frame sent before the device applied the command
+    assert state.sync(0) is False
+    assert state.active is True
+
+    clock.now += OVERRIDE_CONFIRM_SECONDS
+    assert state.sync(0) is True
+
+
+def test_expire_only_after_deadline():
+    clock = _Clock()
+    state = EcostreamOverrideState(clock)
+    state.start(60)
+
+    clock.now += 59
+    assert state.expire() is False
+    assert state.active is True
+
+    clock.now += 1
+    assert state.active is False
+    assert state.expire() is True
+    assert state.ends_at_utc is None
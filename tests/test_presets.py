@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.const import (
+    PRESET_HIGH,
+    PRESET_LOW,
+    PRESET_MID,
+)
+from custom_components.ecostream.presets import EcostreamPresetResolver
+
+_CONFIG = {
+    "setpoint_low": 90,
+    "setpoint_mid": 180,
+    "setpoint_high": 270,
+}
+
+
+def _make_resolver(
+    qset: object = 0, config: dict[str, object] | None = None
+) -> EcostreamPresetResolver:
+    resolver = EcostreamPresetResolver()
+    resolver.update(
+        config if config is not None else _CONFIG, {"qset": qset}
+    )
+    return resolver
+
+
+def test_classify_closest_setpoint():
+    resolver = _make_resolver()
+    assert resolver.classify(95) == PRESET_LOW
+    assert resolver.classify(175) == PRESET_MID
+    assert resolver.classify(265) == PRESET_HIGH
+    assert resolver.classify(1000) == PRESET_HIGH
+
+
+def test_classify_tie_prefers_lower_preset():
+    resolver = _make_resolver()
+    assert resolver.classify(135) == PRESET_LOW
+    assert resolver.classify(225) == PRESET_MID
+
+
+def test_preset_mode_follows_qset():
+    assert _make_resolver(175).preset_mode == PRESET_MID
+    assert _make_resolver(0).preset_mode is None
+    assert _make_resolver("bad").preset_mode is None
+
+
+def test_missing_setpoint_disables_classification():
+    resolver = _make_resolver(
+        100, {"setpoint_low": 90, "setpoint_mid": "invalid"}
+    )
+    assert resolver.preset_mode is None
+    assert resolver.setpoint(PRESET_LOW) == 90.0
+    assert resolver.setpoint(PRESET_MID) is None
+    assert resolver.setpoint("invalid_preset") is None
+
+
+def test_is_active_within_tolerance():
+    resolver = _make_resolver(180.05)
+    assert resolver.is_active(PRESET_MID) is True
+    assert resolver.is_active(PRESET_LOW) is False
+    assert _make_resolver(None).is_active(PRESET_MID) is False
+
+
+def test_unchanged_sections_are_not_reparsed():
+    resolver = EcostreamPresetResolver()
+    config = dict(_CONFIG)
+    status = {"qset": 90}
+    resolver.update(config, status)
+    table = resolver.setpoints
+
+    # Same setpoints in a new config dict keep the existing table
+    resolver.update({**config, "schedule_enabled": True}, status)
+    assert resolver.setpoints is table
+
+    resolver.update({**config, "setpoint_low": 100}, status)
+    assert resolver.setpoints is not table
+    assert resolver.setpoint(PRESET_LOW) == 100.0
+
+
+def test_new_qset_is_reclassified():
+    resolver = _make_resolver(90)
+    assert resolver.preset_mode == PRESET_LOW
+
+    resolver.update(_CONFIG, {"qset": 270})
+    assert resolver.preset_mode == PRESET_HIGH
+    assert resolver.qset == 270.0
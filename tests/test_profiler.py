@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.exceptions import ServiceValidationError
+from pathlib import Path
+import pstats
+import sys
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.profiler import (
+    ATTR_DURATION,
+    SERVICE_PROFILE,
+    EcostreamProfiler,
+    _async_handle_profile,
+    async_setup_services,
+)
+
+_MODULE = "custom_components.ecostream.profiler"
+
+
+def _profiled_functions(profiler: EcostreamProfiler) -> set[str]:
+    stats = pstats.Stats(profiler.profile)
+    return {func for _, _, func in stats.stats}  # type: ignore[attr-defined]
+
+
+def _make_hass(tmp_path: Path, *coordinators: Any) -> MagicMock:
+    hass = MagicMock()
+    entries: list[MagicMock] = []
+    for coordinator in coordinators:
+        entry = MagicMock()
+        entry.state = ConfigEntryState.LOADED
+        entry.runtime_data = coordinator
+        entries.append(entry)
+    hass.config_entries.async_entries.return_value = entries
+
+    def _path(name: str) -> str:
+        return str(tmp_path / name)
+
+    hass.config.path.side_effect = _path
+
+    async def _run_job(func: Callable[..., Any], *args: Any) -> Any:
+        return func(*args)
+
+    hass.async_add_executor_job = AsyncMock(side_effect=_run_job)
+    return hass
+
+
+def _make_call(duration: float = 60.0) -> MagicMock:
+    call = MagicMock()
+    call.data = {ATTR_DURATION: duration}
+    return call
+
+
+def _ecostream_work() -> int:
+    return sum(range(10))
+
+
+def _other_work() -> int:
+    return sum(range(10))
+
+
+def test_capture_nests_without_disabling_early():
+    profiler = EcostreamProfiler()
+    with profiler.capture():
+        with profiler.capture():
+            _ecostream_work()
+        _other_work()
+    _ecostream_work()
+
+    functions = _profiled_functions(profiler)
+    assert "_ecostream_work" in functions
+    assert "_other_work" in functions
+
+
+@pytest.mark.asyncio
+async def test_wrap_only_profiles_while_coroutine_runs():
+    profiler = EcostreamProfiler()
+
+    async def handle() -> str:
+        _ecostream_work()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return "done"
+
+    async def other_task() -> None:
+        await asyncio.sleep(0)
+        _other_work()
+
+    other = asyncio.create_task(other_task())
+    result = await profiler.wrap(handle())
+    await other
+
+    assert result == "done"
+    assert profiler.messages == 1
+    functions = _profiled_functions(profiler)
+    assert "_ecostream_work" in functions
+    assert "_other_work" not in functions
+
+
+@pytest.mark.asyncio
+async def test_wrap_forwards_exceptions():
+    profiler = EcostreamProfiler()
+
+    async def failing() -> None:
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await profiler.wrap(failing())
+
+    # Profiler is disabled again after the failure
+    _other_work()
+    assert "_other_work" not in _profiled_functions(profiler)
+
+
+@pytest.mark.asyncio
+async def test_profile_service_writes_stats(tmp_path: Path):
+    coordinator = MagicMock()
+    coordinator.profiler = None
+    hass = _make_hass(tmp_path, coordinator)
+
+    async def _fake_sleep(_seconds: float) -> None:
+        with coordinator.profiler.capture():
+            _ecostream_work()
+
+    with (
+        patch(
+            f"{_MODULE}.asyncio.sleep", side_effect=_fake_sleep
+        ) as sleep,
+        patch(f"{_MODULE}.time.time", return_value=1700000000),
+    ):
+        result = await _async_handle_profile(hass, _make_call(5.0))
+
+    sleep.assert_awaited_once_with(5.0)
+    assert coordinator.profiler is None
+    assert result is not None
+    stats_file, summary_file = (
+        result["stats_file"],
+        result["summary_file"],
+    )
+    assert stats_file == str(
+        tmp_path / "ecostream_profile_1700000000.prof"
+    )
+    assert isinstance(stats_file, str)
+    assert isinstance(summary_file, str)
+    assert Path(stats_file).exists()
+    summary = Path(summary_file).read_text(encoding="utf-8")
+    assert "_ecostream_work" in summary
+
+
+@pytest.mark.asyncio
+async def test_profile_service_requires_loaded_entry(tmp_path: Path):
+    hass = _make_hass(tmp_path)
+    with pytest.raises(ServiceValidationError):
+        await _async_handle_profile(hass, _make_call())
+
+
+@pytest.mark.asyncio
+async def test_profile_service_rejects_concurrent_runs(tmp_path: Path):
+    coordinator = MagicMock()
+    coordinator.profiler = EcostreamProfiler()
+    hass = _make_hass(tmp_path, coordinator)
+    with pytest.raises(ServiceValidationError):
+        await _async_handle_profile(hass, _make_call())
+
+
+def test_async_setup_services_registers_profile():
+    hass = MagicMock()
+    async_setup_services(hass)
+    args = hass.services.async_register.call_args.args
+    assert args[1] == SERVICE_PROFILE
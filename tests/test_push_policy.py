@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.const import (
+    DEFAULT_FAST_WINDOW_SECONDS,
+    DEFAULT_PUSH_INTERVALS,
+    PUSH_GROUPS,
+)
+from custom_components.ecostream.push_policy import EcostreamPushPolicy
+
+
+def _push(
+    policy: EcostreamPushPolicy, now: float, *groups: str
+) -> bool:
+    due = policy.due(groups, now)
+    if due:
+        policy.mark_pushed(now)
+    return due
+
+
+def test_defaults_cover_every_group():
+    policy = EcostreamPushPolicy()
+    assert set(policy.intervals) == set(PUSH_GROUPS)
+    assert set(policy.fast_intervals) == set(PUSH_GROUPS)
+    assert policy.fast_window == DEFAULT_FAST_WINDOW_SECONDS
+
+
+def test_groups_are_throttled_independently():
+    policy = EcostreamPushPolicy(
+        {"push_interval_status": 2, "push_interval_config": 60}
+    )
+
+    assert _push(policy, 100.0, "status", "config")
+    assert not _push(policy, 101.0, "status")
+    assert _push(policy, 102.0, "status")
+    # config is still inside its own 60s interval
+    assert not _push(policy, 103.0, "config")
+    assert _push(policy, 160.0, "config")
+
+
+def test_push_stamps_groups_held_back_earlier():
+    policy = EcostreamPushPolicy()
+    _push(policy, 100.0, "status", "config")
+
+    # config arrives while throttled, then goes out with the status push
+    assert not _push(policy, 105.0, "config")
+    assert _push(policy, 111.0, "status")
+    assert not _push(policy, 115.0, "config")
+
+
+def test_fast_window_uses_fast_intervals():
+    policy = EcostreamPushPolicy(
+        {"fast_push_interval_status": 1, "fast_window_seconds": 30}
+    )
+    _push(policy, 100.0, "status")
+
+    assert not _push(policy, 102.0, "status")
+    policy.start_fast_window(102.0)
+    assert _push(policy, 102.0, "status")
+    assert _push(policy, 131.0, "status")
+    # Window over: back to the normal interval
+    assert not _push(policy, 135.0, "status")
+    assert _push(
+        policy, 131.0 + DEFAULT_PUSH_INTERVALS["status"], "status"
+    )
+
+
+def test_ignored_and_unknown_groups_never_push():
+    policy = EcostreamPushPolicy(
+        {"ignore_debug": True, "ignore_status": True}
+    )
+
+    # Only comm_bt/debug can be ignored
+    assert policy.ignored == {"debug"}
+    assert not policy.due(["debug", "unknown"], 100.0)
+    assert policy.due(["status"], 100.0)
+
+
+def test_configure_and_reset():
+    policy = EcostreamPushPolicy()
+    _push(policy, 100.0, "status")
+    assert not policy.due(["status"], 101.0)
+
+    policy.configure({"push_interval_status": 1})
+    assert policy.due(["status"], 101.0)
+    policy.mark_pushed(101.0)
+
+    policy.reset()
+    assert policy.due(["status"], 101.5)
+    assert policy.as_dict()["intervals"]["status"] == 1.0
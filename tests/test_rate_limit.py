@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.const import (
+    CONF_COMMAND_BURST,
+    CONF_COMMAND_RATE,
+)
+from custom_components.ecostream.rate_limit import EcostreamTokenBucket
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_burst_then_sustained_rate():
+    clock = _Clock()
+    bucket = EcostreamTokenBucket(
+        clock, {CONF_COMMAND_BURST: 3, CONF_COMMAND_RATE: 6}
+    )
+
+    assert [bucket.take() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # One token every 10 seconds after the burst
+    assert bucket.take() == 10.0
+    clock.now += 4
+    assert bucket.take() == 6.0
+    clock.now += 6
+    assert bucket.take() == 0.0
+
+    assert bucket.sent == 4
+    assert bucket.throttled == 2
+
+
+def test_refill_is_capped_at_burst():
+    clock = _Clock()
+    bucket = EcostreamTokenBucket(clock, {CONF_COMMAND_BURST: 2})
+    bucket.take()
+    bucket.take()
+
+    clock.now += 3600
+    assert bucket.as_dict()["tokens"] == 2
+
+
+def test_configure_caps_tokens_to_new_burst():
+    clock = _Clock()
+    bucket = EcostreamTokenBucket(clock)
+
+    bucket.configure({CONF_COMMAND_BURST: 1, CONF_COMMAND_RATE: 60})
+    assert bucket.take() == 0.0
+    assert bucket.take() == 1.0
+    assert bucket.as_dict()["rate_per_minute"] == 60.0
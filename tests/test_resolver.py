@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from pathlib import Path
+import socket
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp.abc import ResolveResult
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.hub import DATA_HUB
+from custom_components.ecostream.resolver import (
+    SOURCE_DISCOVERY,
+    SOURCE_DNS,
+    EcostreamHostResolver,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _results(address: str) -> list[ResolveResult]:
+    return [
+        ResolveResult(
+            hostname="ecostream.local",
+            host=address,
+            port=0,
+            family=socket.AF_INET,
+            proto=0,
+            flags=socket.AI_NUMERICHOST,
+        )
+    ]
+
+
+def _make_resolver(
+    host: str = "ecostream.local",
+    clock: _Clock | None = None,
+    result: list[ResolveResult] | None = None,
+) -> tuple[EcostreamHostResolver, AsyncMock]:
+    dns = AsyncMock(
+        return_value=_results("192.168.1.7")
+        if result is None
+        else result
+    )
+    hub = MagicMock()
+    hub.dns_resolver.resolve = dns
+    hass = MagicMock()
+    hass.data = {DATA_HUB: hub}
+    resolver = EcostreamHostResolver(
+        hass, host, clock or _Clock(), ttl=600
+    )
+    return resolver, dns
+
+
+@pytest.mark.asyncio
+async def test_ip_host_is_never_looked_up():
+    resolver, dns = _make_resolver("192.168.1.7")
+
+    assert resolver.static is True
+    assert await resolver.async_resolve() == "192.168.1.7"
+    resolver.invalidate()
+    resolver.update("192.168.1.8")
+
+    assert await resolver.async_resolve() == "192.168.1.7"
+    dns.assert_not_awaited()
+    assert resolver.lookups == 0
+
+
+@pytest.mark.asyncio
+async def test_pinned_address_is_reused_until_ttl():
+    clock = _Clock()
+    resolver, dns = _make_resolver(clock=clock)
+
+    assert await resolver.async_resolve() == "192.168.1.7"
+    dns.assert_awaited_once_with("ecostream.local", 0, socket.AF_INET)
+    clock.now = 1599.0
+    assert await resolver.async_resolve() == "192.168.1.7"
+    assert dns.await_count == 1
+    assert resolver.hits == 1
+
+    clock.now = 1600.0
+    await resolver.async_resolve()
+    assert dns.await_count == 2
+    assert resolver.source == SOURCE_DNS
+
+
+@pytest.mark.asyncio
+async def test_failed_lookup_keeps_last_address():
+    clock = _Clock()
+    resolver, dns = _make_resolver(clock=clock)
+    await resolver.async_resolve()
+
+    resolver.invalidate()
+    dns.side_effect = OSError("no answer")
+    assert await resolver.async_resolve() == "192.168.1.7"
+    assert resolver.lookup_failures == 1
+
+    # Not re-pinned, so the next connect tries the lookup again
+    await resolver.async_resolve()
+    assert dns.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_first_lookup_falls_back_to_host():
+    resolver, _ = _make_resolver(result=[])
+
+    assert await resolver.async_resolve() == "ecostream.local"
+    assert resolver.address is None
+    assert resolver.lookup_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_lookup():
+    resolver, dns = _make_resolver()
+    # Nothing pinned yet, nothing to invalidate
+    resolver.invalidate()
+    assert resolver.invalidations == 0
+
+    await resolver.async_resolve()
+    resolver.invalidate()
+    resolver.invalidate()
+    dns.return_value = _results("192.168.1.8")
+
+    assert await resolver.async_resolve() == "192.168.1.8"
+    assert resolver.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_discovery_pins_address_without_lookup():
+    clock = _Clock()
+    resolver, dns = _make_resolver(clock=clock)
+
+    resolver.update("192.168.1.9")
+    assert await resolver.async_resolve() == "192.168.1.9"
+    dns.assert_not_awaited()
+    assert resolver.source == SOURCE_DISCOVERY
+    assert resolver.discovery_updates == 1
+
+
+def test_as_dict():
+    clock = _Clock()
+    resolver, _ = _make_resolver(clock=clock)
+    assert resolver.as_dict()["expires_in_seconds"] is None
+
+    resolver.update("192.168.1.9")
+    clock.now = 1100.4
+
+    assert resolver.as_dict() == {
+        "host": "ecostream.local",
+        "static": False,
+        "address": "192.168.1.9",
+        "source": SOURCE_DISCOVERY,
+        "expires_in_seconds": 500,
+        "hits": 0,
+        "lookups": 0,
+        "lookup_failures": 0,
+        "invalidations": 0,
+        "discovery_updates": 1,
+    }
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.schedule import EcostreamSchedule
+
+_CONFIG = {
+    "schedule_enabled": True,
+    "schedule_0_time": "08:00",
+    "schedule_0_value": 120,
+    "schedule_1_time": "18:30",
+    "schedule_1_value": 180,
+    "schedule_2_time": "23:00",
+    "schedule_2_value": 90,
+}
+
+
+def test_valid_schedule_with_complete_entries():
+    schedule = EcostreamSchedule.from_config(_CONFIG)
+    assert schedule.is_valid is True
+    assert [t.label for t in schedule.transitions] == [
+        "08:00",
+        "18:30",
+        "23:00",
+    ]
+
+
+def test_no_schedule_entries_is_invalid():
+    schedule = EcostreamSchedule.from_config(
+        {"schedule_enabled": False, "setpoint_low": 90}
+    )
+    assert schedule.is_valid is False
+    assert schedule.active_at(600) is None
+    assert schedule.next_change(datetime(2026, 1, 1, 12)) is None
+
+
+def test_incomplete_entries_are_invalid():
+    schedule = EcostreamSchedule.from_config(
+        {"schedule_0_time": "08:00"}
+    )
+    assert schedule.is_valid is False
+
+
+def test_partial_entries_keep_complete_pairs():
+    schedule = EcostreamSchedule.from_config(
+        {
+            "schedule_0_time": "08:00",
+            "schedule_1_time": "18:00",
+            "schedule_1_value": 180,
+        }
+    )
+    assert schedule.is_valid is True
+    assert len(schedule.transitions) == 1
+    assert schedule.transitions[0].index == 1
+
+
+def test_unsorted_and_numeric_times_are_ordered():
+    schedule = EcostreamSchedule.from_config(
+        {
+            "schedule_0_time": 1200,
+            "schedule_0_value": 50,
+            "schedule_1_time": "06:15:00",
+            "schedule_1_value": 70,
+            "schedule_2_time": "bogus",
+            "schedule_2_value": 80,
+        }
+    )
+    assert [t.minute for t in schedule.transitions] == [375, 1200]
+
+
+def test_active_at_wraps_before_first_entry():
+    schedule = EcostreamSchedule.from_config(_CONFIG)
+    values = [
+        entry.value if (entry := schedule.active_at(minute)) else None
+        for minute in (7 * 60, 8 * 60, 20 * 60)
+    ]
+    assert values == [90, 120, 180]
+
+
+def test_next_change_same_day_and_next_day():
+    schedule = EcostreamSchedule.from_config(_CONFIG)
+    assert schedule.next_change(
+        datetime(2026, 1, 1, 12, 0)
+    ) == datetime(2026, 1, 1, 18, 30)
+    assert schedule.next_change(
+        datetime(2026, 1, 1, 23, 30)
+    ) == datetime(2026, 1, 2, 8, 0)
+
+
+def test_iter_periods_covers_window():
+    schedule = EcostreamSchedule.from_config(_CONFIG)
+    periods = list(
+        schedule.iter_periods(
+            datetime(2026, 1, 1, 0, 0), datetime(2026, 1, 2, 0, 0)
+        )
+    )
+    assert [(p[0], p[1], p[2].value) for p in periods] == [
+        (datetime(2025, 12, 31, 23), datetime(2026, 1, 1, 8), 90),
+        (datetime(2026, 1, 1, 8), datetime(2026, 1, 1, 18, 30), 120),
+        (datetime(2026, 1, 1, 18, 30), datetime(2026, 1, 1, 23), 180),
+        (datetime(2026, 1, 1, 23), datetime(2026, 1, 2, 8), 90),
+    ]
@@ -1,38 +1,57 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 import sys
-from typing import Any
+from typing import Any, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from homeassistant.components.sensor import SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from custom_components.ecostream.const import CONF_STALE_AS_ATTRIBUTE
+from custom_components.ecostream.data_age import (
+    EcostreamDataAge,
+    max_age_key,
+)
+from custom_components.ecostream.metrics import (
+    STAGE_LOOP_LAG,
+    EcostreamMetrics,
+)
 from custom_components.ecostream.sensor import (
     SENSOR_DESCRIPTIONS,
     EcostreamBaseSensor,
+    EcostreamLastBootSensor,
+    EcostreamLatencySensor,
+    EcostreamNextScheduleChangeSensor,
+    EcostreamOverrideEndSensor,
+    EcostreamReconnectsSensor,
     EcostreamSensorDescription,
     _calc_efficiency,  # pyright: ignore[reportPrivateUsage]
     _deep_get,  # pyright: ignore[reportPrivateUsage]
-    _format_uptime,  # pyright: ignore[reportPrivateUsage]
     _int_value,  # pyright: ignore[reportPrivateUsage]
     _number_value,  # pyright: ignore[reportPrivateUsage]
     async_setup_entry,
 )
+from custom_components.ecostream.telemetry import (
+    EcostreamConnectionTelemetry,
+)
 
 
 def _make_sensor(
     description: EcostreamSensorDescription,
     data: dict[str, Any] | None = None,
+    available: bool = True,
 ) -> EcostreamBaseSensor:
     coordinator = MagicMock()
     coordinator.data = data or {}
     coordinator.host = "192.168.1.1"
+    coordinator.available = available
     entry = MagicMock(spec=ConfigEntry)
     entry.entry_id = "test_entry"
 
@@ -77,35 +96,6 @@ def test_deep_get_empty_path_returns_data():
     assert _deep_get(data, []) == data
 
 
-# ---------------------------------------------------------------------------
-# _format_uptime
-# ---------------------------------------------------------------------------
-
-
-def test_format_uptime_negative():
-    assert _format_uptime(-1) == "0m"
-
-
-def test_format_uptime_minutes_only():
-    assert _format_uptime(300) == "5m"
-
-
-def test_format_uptime_hours_and_minutes():
-    assert _format_uptime(3661) == "1h 1m"
-
-
-def test_format_uptime_days_hours_minutes():
-    assert _format_uptime(86400 + 3600 + 60) == "1d 1h 1m"
-
-
-def test_format_uptime_zero():
-    assert _format_uptime(0) == "0m"
-
-
-def test_format_uptime_exact_day():
-    assert _format_uptime(86400) == "1d 0h 0m"
-
-
 def test_number_value_none_returns_none():
     fn = _number_value(["a", "b"])
     assert fn({}) is None
@@ -270,62 +260,52 @@ def test_sensor_native_value_date_non_datetime_passthrough():
     assert _make_sensor(desc).native_value == raw
 
 
-def test_sensor_native_value_uptime_formatted():
-    desc = EcostreamSensorDescription(
-        key="uptime", value_fn=lambda d: d.get("uptime")
-    )
-    sensor = _make_sensor(desc, {"uptime": 3661})
-    assert sensor.native_value == "1h 1m"
-
-
-def test_sensor_native_value_uptime_invalid_returns_none():
-    desc = EcostreamSensorDescription(
-        key="uptime", value_fn=lambda d: "not-an-int"
-    )
-    assert _make_sensor(desc).native_value is None
-
-
 def test_sensor_available_connected():
     desc = EcostreamSensorDescription(key="k", value_fn=lambda d: None)
-    sensor = _make_sensor(desc, {"status": {"connect_status": 1}})
+    sensor = _make_sensor(desc, available=True)
     assert sensor.available is True
 
 
 def test_sensor_available_disconnected():
     desc = EcostreamSensorDescription(key="k", value_fn=lambda d: None)
-    sensor = _make_sensor(desc, {"status": {"connect_status": 0}})
+    sensor = _make_sensor(desc, available=False)
     assert sensor.available is False
 
 
-def test_sensor_available_no_data():
-    desc = EcostreamSensorDescription(key="k", value_fn=lambda d: None)
-    sensor = _make_sensor(desc, {})
-    # Sensor defaults connect_status to 1, so it returns True when status is missing
-    assert sensor.available is True
+def _stale_data_age(
+    section: str, options: dict[str, Any] | None = None
+) -> EcostreamDataAge:
+    data_age = EcostreamDataAge(
+        lambda: 1000.0, {max_age_key(section): 60, **(options or {})}
+    )
+    data_age.touch({section: {}}, 900.0)
+    data_age.refresh(1000.0)
+    return data_age
 
 
-def test_sensor_available_none_coordinator_data():
-    """Test when coordinator.data is None."""
-    desc = EcostreamSensorDescription(key="k", value_fn=lambda d: None)
-    coordinator = MagicMock()
-    coordinator.data = None
-    coordinator.host = "192.168.1.1"
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
+def test_sensor_unavailable_when_its_section_is_stale():
+    descriptions = {desc.key: desc for desc in SENSOR_DESCRIPTIONS}
+    wifi = _make_sensor(descriptions["wifi_rssi"])
+    qset = _make_sensor(descriptions["qset"])
+    data_age = _stale_data_age("comm_wifi")
+    wifi.coordinator.data_age = data_age
+    qset.coordinator.data_age = data_age
 
-    def _mock_coordinator_entity_init(
-        self: CoordinatorEntity[Any], c: Any
-    ) -> None:
-        self.coordinator = c
-        self._attr_should_poll = False  # pyright: ignore[reportPrivateUsage]
+    assert wifi.available is False
+    assert qset.available is True
 
-    with patch.object(
-        CoordinatorEntity, "__init__", _mock_coordinator_entity_init
-    ):
-        sensor = EcostreamBaseSensor(coordinator, entry, desc)
 
-    # Sensor defaults connect_status to 1, so it returns True when data is None
+def test_sensor_flags_stale_section_as_attribute():
+    descriptions = {desc.key: desc for desc in SENSOR_DESCRIPTIONS}
+    sensor = _make_sensor(descriptions["setpoint_low"])
+    sensor.coordinator.data_age = _stale_data_age(
+        "config", {CONF_STALE_AS_ATTRIBUTE: True}
+    )
+
     assert sensor.available is True
+    attributes = sensor.extra_state_attributes
+    assert attributes is not None
+    assert attributes["stale"] is True
 
 
 def test_sensor_unique_id():
@@ -371,4 +351,268 @@ async def test_async_setup_entry_adds_all_sensor_entities():
 
     add_entities.assert_called_once()
     entities = add_entities.call_args[0][0]
-    assert len(entities) == len(SENSOR_DESCRIPTIONS)
+    assert len(entities) == len(SENSOR_DESCRIPTIONS) + 6
+
+
+def test_recorder_light_sensor_samples_and_throttles_writes():
+    desc = EcostreamSensorDescription(
+        key="fan_supply_speed",
+        name="Fan Supply Speed",
+        native_unit_of_measurement="rpm",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda d: d.get("rpm"),
+        recorder_light=True,
+    )
+    sensor = _make_sensor(desc, {"rpm": 1200})
+    statistics = cast(MagicMock, sensor.coordinator.statistics)
+    write = cast(MagicMock, sensor.async_write_ha_state)
+    statistics.async_register.assert_called_once_with(
+        "fan_supply_speed", "Fan Supply Speed", "rpm"
+    )
+    assert sensor.state_class is SensorStateClass.MEASUREMENT
+
+    clock = cast(MagicMock, sensor.coordinator.hub.clock)
+    clock.side_effect = [1000.0, 1010.0, 1400.0]
+    for _ in range(3):
+        sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+
+    assert statistics.async_add_sample.call_count == 3
+    statistics.async_add_sample.assert_called_with(
+        "fan_supply_speed", 1200.0
+    )
+    assert write.call_count == 2
+
+
+def test_recorder_light_sensor_writes_availability_change():
+    desc = EcostreamSensorDescription(
+        key="fan_supply_speed",
+        value_fn=lambda d: d.get("rpm"),
+        recorder_light=True,
+    )
+    sensor = _make_sensor(desc, {"rpm": 1200})
+    write = cast(MagicMock, sensor.async_write_ha_state)
+
+    clock = cast(MagicMock, sensor.coordinator.hub.clock)
+    clock.side_effect = [1000.0, 1010.0, 1020.0]
+    sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+    sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+    sensor.coordinator.available = False
+    sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+
+    assert write.call_count == 2
+
+
+def _make_next_change_sensor(
+    data: dict[str, Any],
+) -> EcostreamNextScheduleChangeSensor:
+    coordinator = MagicMock()
+    coordinator.data = data
+    coordinator.host = "192.168.1.1"
+    coordinator.schedule.next_change.return_value = datetime(
+        2026, 1, 1, 18
+    )
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "test_entry"
+
+    def _mock_coordinator_entity_init(
+        self: CoordinatorEntity[Any], c: Any
+    ) -> None:
+        self.coordinator = c
+
+    with patch.object(
+        CoordinatorEntity, "__init__", _mock_coordinator_entity_init
+    ):
+        return EcostreamNextScheduleChangeSensor(coordinator, entry)
+
+
+def test_next_schedule_change_when_enabled():
+    sensor = _make_next_change_sensor(
+        {"config": {"schedule_enabled": True}}
+    )
+    assert sensor.native_value == datetime(2026, 1, 1, 18)
+    assert sensor.unique_id == "test_entry_next_schedule_change"
+
+
+def test_next_schedule_change_none_when_disabled():
+    sensor = _make_next_change_sensor(
+        {"config": {"schedule_enabled": False}}
+    )
+    assert sensor.native_value is None
+
+
+# ---------------------------------------------------------------------------
+# EcostreamLastBootSensor
+# ---------------------------------------------------------------------------
+
+
+def _make_last_boot_sensor(uptime: int) -> EcostreamLastBootSensor:
+    coordinator = MagicMock()
+    coordinator.data = {"system": {"uptime": uptime}}
+    coordinator.host = "192.168.1.1"
+    coordinator.available = True
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "test_entry"
+
+    def _mock_coordinator_entity_init(
+        self: CoordinatorEntity[Any], c: Any
+    ) -> None:
+        self.coordinator = c
+
+    with (
+        patch.object(
+            CoordinatorEntity, "__init__", _mock_coordinator_entity_init
+        ),
+        patch(
+            "custom_components.ecostream.sensor.dt_util.utcnow",
+            return_value=datetime(
+                2026, 1, 1, 12, 0, 0, 500, tzinfo=UTC
+            ),
+        ),
+    ):
+        sensor = EcostreamLastBootSensor(coordinator, entry)
+    sensor.async_write_ha_state = MagicMock()
+    return sensor
+
+
+def test_last_boot_computed_once_from_uptime():
+    sensor = _make_last_boot_sensor(3600)
+    boot = datetime(2026, 1, 1, 11, 0, 0, tzinfo=UTC)
+    assert sensor.native_value == boot
+    assert sensor.unique_id == "test_entry_last_boot"
+
+    # Uptime keeps counting: no new state, even though wall time moved
+    sensor.coordinator.data = {"system": {"uptime": 3700}}
+    sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+    sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+
+    assert sensor.native_value == boot
+    assert cast(MagicMock, sensor.async_write_ha_state).call_count == 1
+
+
+def test_last_boot_moves_on_reboot():
+    sensor = _make_last_boot_sensor(3600)
+    sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+
+    sensor.coordinator.data = {"system": {"uptime": 60}}
+    with patch(
+        "custom_components.ecostream.sensor.dt_util.utcnow",
+        return_value=datetime(2026, 1, 2, 8, 0, 0, tzinfo=UTC),
+    ):
+        sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+
+    assert sensor.native_value == datetime(
+        2026, 1, 2, 7, 59, tzinfo=UTC
+    )
+    assert cast(MagicMock, sensor.async_write_ha_state).call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# EcostreamOverrideEndSensor
+# ---------------------------------------------------------------------------
+
+
+def test_override_end_sensor_writes_only_on_change():
+    coordinator = MagicMock()
+    coordinator.host = "192.168.1.1"
+    coordinator.available = True
+    coordinator.override.ends_at_utc = None
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "test_entry"
+
+    def _mock_coordinator_entity_init(
+        self: CoordinatorEntity[Any], c: Any
+    ) -> None:
+        self.coordinator = c
+
+    with patch.object(
+        CoordinatorEntity, "__init__", _mock_coordinator_entity_init
+    ):
+        sensor = EcostreamOverrideEndSensor(coordinator, entry)
+    sensor.async_write_ha_state = MagicMock()
+    assert sensor.unique_id == "test_entry_override_end"
+
+    ends = datetime(2026, 1, 1, 12, 15, tzinfo=UTC)
+    coordinator.override.ends_at_utc = ends
+    for _ in range(3):
+        sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+
+    assert sensor.native_value == ends
+    assert sensor.async_write_ha_state.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# EcostreamReconnectsSensor
+# ---------------------------------------------------------------------------
+
+
+def test_reconnects_sensor_reports_telemetry_and_writes_on_change():
+    coordinator = MagicMock()
+    coordinator.host = "192.168.1.1"
+    coordinator.telemetry = EcostreamConnectionTelemetry(lambda: 1000.0)
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "test_entry"
+
+    def _mock_coordinator_entity_init(
+        self: CoordinatorEntity[Any], c: Any
+    ) -> None:
+        self.coordinator = c
+
+    with patch.object(
+        CoordinatorEntity, "__init__", _mock_coordinator_entity_init
+    ):
+        sensor = EcostreamReconnectsSensor(coordinator, entry)
+    sensor.async_write_ha_state = MagicMock()
+
+    telemetry = coordinator.telemetry
+    for _ in range(2):
+        telemetry.connecting()
+        telemetry.connected(1000.0)
+        telemetry.disconnected("stale", False)
+    telemetry.connecting()
+    telemetry.connected(1000.0)
+    for _ in range(3):
+        sensor._handle_coordinator_update()  # pyright: ignore[reportPrivateUsage]
+
+    assert sensor.native_value == 2
+    attributes = sensor.extra_state_attributes
+    assert attributes["last_disconnect_reason"] == "stale"
+    assert attributes["disconnect_reasons"]["stale"] == 2
+    assert sensor.async_write_ha_state.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# EcostreamLatencySensor
+# ---------------------------------------------------------------------------
+
+
+def test_latency_sensor_reports_p95_and_attributes():
+    coordinator = MagicMock()
+    coordinator.host = "192.168.1.1"
+    coordinator.available = True
+    coordinator.metrics = EcostreamMetrics()
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "test_entry"
+
+    def _mock_coordinator_entity_init(
+        self: CoordinatorEntity[Any], c: Any
+    ) -> None:
+        self.coordinator = c
+
+    with patch.object(
+        CoordinatorEntity, "__init__", _mock_coordinator_entity_init
+    ):
+        sensor = EcostreamLatencySensor(
+            coordinator, entry, STAGE_LOOP_LAG, "event_loop_lag"
+        )
+
+    assert sensor.unique_id == "test_entry_event_loop_lag"
+    assert sensor.entity_registry_enabled_default is False
+    assert sensor.native_value is None
+
+    coordinator.metrics.loop_lag.record(3_000_000)
+    assert sensor.native_value == 4.096
+    assert sensor.extra_state_attributes == {
+        "p50": 4.096,
+        "p99": 4.096,
+        "samples": 1,
+    }
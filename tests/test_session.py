@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+import socket
+import sys
+from unittest.mock import MagicMock
+
+from aiohttp import TCPConnector
+from aiohttp.abc import AbstractResolver
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream import session as session_module
+from custom_components.ecostream.const import (
+    WS_CONNECT_TIMEOUT,
+    WS_CONNECTOR_LIMIT_PER_HOST,
+    WS_KEEPALIVE_IDLE,
+)
+from custom_components.ecostream.session import create_session
+
+_socket_factory = session_module.__dict__["_socket_factory"]
+
+
+def _getsockopt(sock: socket.socket, level: int, option: str) -> int:
+    return sock.getsockopt(level, getattr(socket, option))
+
+
+def test_socket_factory_sets_nodelay_and_keepalive(
+    socket_enabled: None,
+):
+    sock = _socket_factory(
+        (
+            socket.AF_INET,
+            socket.SOCK_STREAM,
+            socket.IPPROTO_TCP,
+            "",
+            ("127.0.0.1", 80),
+        )
+    )
+    try:
+        assert _getsockopt(sock, socket.IPPROTO_TCP, "TCP_NODELAY")
+        assert _getsockopt(sock, socket.SOL_SOCKET, "SO_KEEPALIVE")
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            idle = _getsockopt(sock, socket.IPPROTO_TCP, "TCP_KEEPIDLE")
+            assert idle == WS_KEEPALIVE_IDLE
+    finally:
+        sock.close()
+
+
+@pytest.mark.asyncio
+async def test_create_session_uses_tuned_connector():
+    session = create_session()
+    try:
+        connector = session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector.limit == 0
+        assert connector.limit_per_host == WS_CONNECTOR_LIMIT_PER_HOST
+        assert session.timeout.total is None
+        assert session.timeout.connect == WS_CONNECT_TIMEOUT
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_create_session_uses_given_resolver():
+    resolver = MagicMock(spec=AbstractResolver)
+    session = create_session(resolver)
+    try:
+        connector = session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector._resolver is resolver
+    finally:
+        await session.close()
+    # The resolver belongs to the hub
+    resolver.close.assert_not_called()
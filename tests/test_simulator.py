@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from homeassistant.core import HomeAssistant
+import json
+from pathlib import Path
+import sys
+from typing import Any
+
+import aiohttp
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.websocket_api import EcostreamWebsocket
+
+from .simulator import MALFORMED_FRAME, EcostreamSimulator
+
+
+async def _receive_json(ws: aiohttp.ClientWebSocketResponse) -> Any:
+    msg = await asyncio.wait_for(ws.receive(), timeout=2)
+    return json.loads(msg.data)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_then_status_frames(
+    ecostream_simulator: EcostreamSimulator,
+):
+    async with (
+        aiohttp.ClientSession() as session,
+        session.ws_connect(ecostream_simulator.url) as ws,
+    ):
+        snapshot = await _receive_json(ws)
+        assert set(snapshot) == {
+            "status",
+            "config",
+            "system",
+            "comm_wifi",
+        }
+        assert snapshot["status"]["connect_status"] == 1
+
+        frame = await _receive_json(ws)
+        assert "status" in frame
+
+
+@pytest.mark.asyncio
+async def test_config_write_is_applied_and_echoed(
+    ecostream_simulator: EcostreamSimulator,
+):
+    changes = {"man_override_set": 250, "man_override_set_time": 600}
+    async with (
+        aiohttp.ClientSession() as session,
+        session.ws_connect(ecostream_simulator.url) as ws,
+    ):
+        await _receive_json(ws)
+        await ws.send_str("{}")
+        await ws.send_json({"config": changes})
+
+        while "config" not in (frame := await _receive_json(ws)):
+            pass
+
+    assert frame == {"config": changes}
+    assert ecostream_simulator.writes == [changes]
+    assert ecostream_simulator.heartbeats == 1
+    status = ecostream_simulator.state["status"]
+    assert status["qset"] == 250.0
+    assert status["override_set_time_left"] == 600
+
+
+@pytest.mark.asyncio
+async def test_malformed_and_stall_faults(
+    ecostream_simulator: EcostreamSimulator,
+):
+    ecostream_simulator.faults.malformed_rate = 1.0
+    async with (
+        aiohttp.ClientSession() as session,
+        session.ws_connect(ecostream_simulator.url) as ws,
+    ):
+        msg = await asyncio.wait_for(ws.receive(), timeout=2)
+        assert msg.data == MALFORMED_FRAME
+
+        ecostream_simulator.faults.stall = True
+        sent = ecostream_simulator.frames_sent
+        await asyncio.sleep(0.2)
+        assert ecostream_simulator.frames_sent == sent
+        assert not ws.closed
+
+
+@pytest.mark.asyncio
+async def test_websocket_client_receives_simulator_frames(
+    hass: HomeAssistant, ecostream_simulator: EcostreamSimulator
+):
+    received: list[dict[str, Any]] = []
+    got_status = asyncio.Event()
+
+    async def _on_message(payload: dict[str, Any]) -> None:
+        received.append(payload)
+        if "status" in payload:
+            got_status.set()
+
+    client = EcostreamWebsocket(
+        hass, ecostream_simulator.address, _on_message
+    )
+    await client.async_start()
+    try:
+        await asyncio.wait_for(got_status.wait(), timeout=2)
+        await client.send_json({"config": {"man_override_bypass": 100}})
+        await asyncio.sleep(0.1)
+    finally:
+        await client.async_disconnect()
+
+    assert ecostream_simulator.connections == 1
+    assert ecostream_simulator.writes == [{"man_override_bypass": 100}]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+import sys
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.statistics import EcostreamStatistics
+
+_ADD = "custom_components.ecostream.statistics.async_add_external_statistics"
+_STORE = "custom_components.ecostream.statistics.Store"
+_TRACK = (
+    "custom_components.ecostream.statistics.async_track_utc_time_change"
+)
+
+
+def _at(hour: int, minute: int = 0, second: int = 0) -> datetime:
+    return datetime(2026, 1, 1, hour, minute, second, tzinfo=UTC)
+
+
+def _make_statistics() -> EcostreamStatistics:
+    stats = EcostreamStatistics(MagicMock(), "192.168.1.1")
+    stats.async_register("fan_supply_speed", "Fan Supply Speed", "rpm")
+    return stats
+
+
+def test_statistic_id_uses_slugified_host():
+    stats = _make_statistics()
+    assert (
+        stats.statistic_id("fan_supply_speed")
+        == "ecostream:192_168_1_1_fan_supply_speed"
+    )
+
+
+def test_unregistered_key_is_ignored():
+    stats = _make_statistics()
+    with patch(_ADD) as add:
+        stats.async_add_sample("unknown", 1.0, _at(10))
+        stats.async_flush(now=_at(12))
+    add.assert_not_called()
+
+
+def test_hour_rollover_imports_time_weighted_mean_min_max():
+    stats = _make_statistics()
+    with patch(_ADD) as add:
+        # 1000 for 30 min, 1400 for 6 min, 1200 for the last 24 min
+        for minute, value in ((0, 1000.0), (30, 1400.0), (36, 1200.0)):
+            stats.async_add_sample(
+                "fan_supply_speed", value, _at(10, minute)
+            )
+        add.assert_not_called()
+
+        stats.async_add_sample("fan_supply_speed", 900.0, _at(11, 0, 5))
+
+    add.assert_called_once()
+    metadata, rows = add.call_args[0][1], add.call_args[0][2]
+    assert metadata["statistic_id"] == (
+        "ecostream:192_168_1_1_fan_supply_speed"
+    )
+    assert metadata["source"] == "ecostream"
+    assert metadata["unit_of_measurement"] == "rpm"
+    assert rows[0]["start"] == _at(10)
+    assert rows[0]["mean"] == 1120.0
+    assert rows[0]["min"] == 1000.0
+    assert rows[0]["max"] == 1400.0
+
+
+def test_mean_does_not_depend_on_sample_rate():
+    stats = _make_statistics()
+    with patch(_ADD) as add:
+        # A burst of pushes must not outweigh a long-held value
+        stats.async_add_sample("fan_supply_speed", 1000.0, _at(10))
+        for second in range(60):
+            stats.async_add_sample(
+                "fan_supply_speed", 2000.0, _at(10, 59, second)
+            )
+        stats.async_flush(now=_at(11, 0, 10))
+
+    rows = add.call_args[0][2]
+    assert rows[0]["mean"] == (1000.0 * 3540 + 2000.0 * 60) / 3600
+
+
+def test_flush_never_imports_the_running_hour():
+    stats = _make_statistics()
+    with patch(_ADD) as add:
+        stats.async_add_sample("fan_supply_speed", 1.0, _at(10, 30))
+        stats.async_flush(now=_at(10, 45))
+        add.assert_not_called()
+
+        stats.async_flush(now=_at(11, 0, 10))
+    add.assert_called_once()
+    assert add.call_args[0][2][0]["mean"] == 1.0
+
+
+def test_import_error_is_logged_not_raised():
+    stats = _make_statistics()
+    with patch(_ADD, side_effect=RuntimeError("no recorder")):
+        stats.async_add_sample("fan_supply_speed", 1.0, _at(10))
+        stats.async_flush(now=_at(11, 0, 10))
+
+
+async def test_stop_stores_running_hour_without_importing():
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+    store.async_save = AsyncMock()
+    unsub = MagicMock()
+    with (
+        patch(_STORE, return_value=store),
+        patch(_TRACK, return_value=unsub) as track,
+    ):
+        stats = _make_statistics()
+        await stats.async_start()
+        await stats.async_start()
+    track.assert_called_once()
+
+    with patch(_ADD) as add:
+        stats.async_add_sample("fan_supply_speed", 1.0)
+        await stats.async_stop()
+
+    unsub.assert_called_once()
+    add.assert_not_called()
+    saved: dict[str, Any] = store.async_save.call_args[0][0]
+    assert saved["fan_supply_speed"]["minimum"] == 1.0
+
+
+async def test_restored_hour_is_continued_and_imported_once():
+    first = MagicMock()
+    first.async_load = AsyncMock(return_value=None)
+    first.async_save = AsyncMock()
+    with patch(_STORE, return_value=first), patch(_TRACK):
+        stats = _make_statistics()
+        await stats.async_start()
+        with patch(_ADD) as add:
+            stats.async_add_sample("fan_supply_speed", 1000.0, _at(10))
+            stats.async_add_sample(
+                "fan_supply_speed", 1000.0, _at(10, 30)
+            )
+            with patch(
+                "custom_components.ecostream.statistics.dt_util.utcnow",
+                return_value=_at(10, 30),
+            ):
+                await stats.async_stop()
+        add.assert_not_called()
+    stored = first.async_save.call_args[0][0]
+
+    second = MagicMock()
+    second.async_load = AsyncMock(return_value=stored)
+    with patch(_STORE, return_value=second), patch(_TRACK):
+        stats = _make_statistics()
+        await stats.async_start()
+    with patch(_ADD) as add:
+        stats.async_add_sample("fan_supply_speed", 2000.0, _at(10, 45))
+        stats.async_flush(now=_at(11, 0, 10))
+
+    add.assert_called_once()
+    row = add.call_args[0][2][0]
+    assert row["start"] == _at(10)
+    # 30 min at 1000 before the restart, 15 min at 2000 after; the
+    # downtime in between does not count
+    assert row["mean"] == (1000.0 * 1800 + 2000.0 * 900) / 2700
+    assert row["min"] == 1000.0
+    assert row["max"] == 2000.0
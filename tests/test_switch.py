@@ -29,6 +29,10 @@ from custom_components.ecostream.const import (
     PRESET_LOW,
     PRESET_MID,
 )
+from custom_components.ecostream.override_state import (
+    EcostreamOverrideState,
+)
+from custom_components.ecostream.presets import EcostreamPresetResolver
 from custom_components.ecostream.switch import (
     EcostreamBoostSwitch,
     EcostreamBypassSwitch,
@@ -53,6 +57,17 @@ def _make_entity(
         coordinator.ws.send_json = AsyncMock()
     coordinator.mark_control_action = MagicMock()
     coordinator.boost_duration_minutes = DEFAULT_BOOST_DURATION_MINUTES
+    coordinator.presets = EcostreamPresetResolver()
+    coordinator.presets.update(
+        coordinator.data.get("config", {}),
+        coordinator.data.get("status", {}),
+    )
+    coordinator.override = EcostreamOverrideState(lambda: 1000.0)
+    time_left = coordinator.data.get("status", {}).get(
+        "override_set_time_left"
+    )
+    if isinstance(time_left, int):
+        coordinator.override.sync(time_left)
     entry = MagicMock(spec=ConfigEntry)
     entry.entry_id = "test_entry"
 
@@ -378,6 +393,17 @@ async def test_boost_turn_on_invalid_duration_uses_default():
     )
 
 
+def test_boost_follows_local_countdown_without_frames():
+    entity, coordinator = _make_entity(
+        EcostreamBoostSwitch, {"status": {"override_set_time_left": 60}}
+    )
+
+    coordinator.override.start(0)
+    entity._handle_coordinator_update()
+
+    assert entity.is_on is False
+
+
 def test_boost_handle_update_invalid_timer_sets_off():
     entity, _ = _make_entity(
         EcostreamBoostSwitch,
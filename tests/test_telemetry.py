@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.telemetry import (
+    LAST_FRAME_PREVIEW_CHARS,
+    EcostreamConnectionTelemetry,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_connection_lifecycle_counts_time_and_reasons():
+    clock = _Clock()
+    telemetry = EcostreamConnectionTelemetry(clock)
+
+    telemetry.connecting()
+    telemetry.connected(clock.now)
+    clock.now += 60
+    telemetry.disconnected("stale", stopping=False)
+
+    telemetry.connecting()
+    telemetry.disconnected("connection_error", stopping=False)
+
+    telemetry.connecting()
+    telemetry.connected(clock.now)
+    clock.now += 30
+
+    stats = telemetry.as_dict()
+    assert stats["state"] == "connected"
+    assert stats["connects"] == 2
+    assert stats["connect_failures"] == 1
+    assert stats["disconnects"] == 1
+    assert stats["disconnect_reasons"]["stale"] == 1
+    assert stats["disconnect_reasons"]["connection_error"] == 0
+    assert stats["current_connection_seconds"] == 30
+    assert stats["connected_seconds"] == 90
+    assert telemetry.reconnects == 1
+
+
+def test_stop_while_connecting_is_not_a_failure():
+    telemetry = EcostreamConnectionTelemetry(_Clock())
+    telemetry.connecting()
+    telemetry.disconnected("stopped", stopping=True)
+
+    assert telemetry.state == "stopped"
+    assert telemetry.connect_failures == 0
+
+
+def test_frames_and_last_frame_age():
+    clock = _Clock()
+    telemetry = EcostreamConnectionTelemetry(clock)
+    assert telemetry.as_dict()["last_frame_age_seconds"] is None
+    assert telemetry.last_frame_preview() is None
+
+    frame = '{"status": {"qset": 100}}' * 20
+    telemetry.frame_in(frame, clock.now)
+    telemetry.frame_out(2)
+    clock.now += 4
+
+    stats = telemetry.as_dict()
+    assert stats["frames_in"] == 1
+    assert stats["bytes_in"] == len(frame)
+    assert stats["frames_out"] == 1
+    assert stats["bytes_out"] == 2
+    assert stats["last_frame_age_seconds"] == 4
+    preview = telemetry.last_frame_preview()
+    assert preview == frame[:LAST_FRAME_PREVIEW_CHARS]
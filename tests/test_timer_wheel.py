@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from unittest.mock import MagicMock
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from custom_components.ecostream.timer_wheel import EcostreamTimerWheel
+
+
+def _make_wheel(
+    resolution: float = 1.0, slots: int = 8
+) -> tuple[EcostreamTimerWheel, MagicMock]:
+    loop = MagicMock()
+    loop.time.return_value = 0.0
+    return EcostreamTimerWheel(loop, resolution, slots), loop
+
+
+def _fire(loop: MagicMock, now: float) -> None:
+    """Advance loop time and run the armed wake-up."""
+    loop.time.return_value = now
+    loop.call_at.call_args[0][1]()
+
+
+def test_deadlines_in_one_tick_share_a_wakeup():
+    wheel, loop = _make_wheel()
+    fired: list[int] = []
+    for i in range(100):
+        wheel.call_later(2.0 + (i + 1) / 1000, fired.append, i)
+
+    assert len(wheel) == 100
+    loop.call_at.assert_called_once()
+    assert loop.call_at.call_args[0][0] == 3.0
+
+    _fire(loop, 3.0)
+
+    assert fired == list(range(100))
+    assert len(wheel) == 0
+    assert wheel.wakeups == 1
+
+
+def test_deadline_never_fires_early():
+    wheel, loop = _make_wheel()
+    callback = MagicMock()
+    wheel.call_later(2.5, callback)
+
+    # Deadlines round up to the next tick
+    assert loop.call_at.call_args[0][0] == 3.0
+    _fire(loop, 3.0)
+    callback.assert_called_once_with()
+
+
+def test_earlier_deadline_rearms():
+    wheel, loop = _make_wheel()
+    wheel.call_later(5.0, MagicMock())
+    wheel.call_later(2.0, MagicMock())
+
+    assert loop.call_at.call_count == 2
+    assert loop.call_at.call_args[0][0] == 2.0
+    loop.call_at.return_value.cancel.assert_called_once()
+
+
+def test_cancelled_timer_does_not_fire():
+    wheel, loop = _make_wheel()
+    kept, dropped = MagicMock(), MagicMock()
+    wheel.call_later(1.0, kept)
+    timer = wheel.call_later(1.0, dropped)
+
+    timer.cancel()
+    timer.cancel()
+    assert len(wheel) == 1
+
+    _fire(loop, 1.0)
+    kept.assert_called_once()
+    dropped.assert_not_called()
+    assert len(wheel) == 0
+
+
+def test_later_round_of_same_slot_waits():
+    wheel, loop = _make_wheel(slots=8)
+    soon, later = MagicMock(), MagicMock()
+    wheel.call_later(2.0, soon)
+    wheel.call_later(18.0, later)  # Same slot, two rounds on
+
+    _fire(loop, 2.0)
+    soon.assert_called_once()
+    later.assert_not_called()
+    assert len(wheel) == 1
+
+    # Wakes once per round at the slot until the deadline is reached
+    assert loop.call_at.call_args[0][0] == 10.0
+    _fire(loop, 10.0)
+    later.assert_not_called()
+    assert loop.call_at.call_args[0][0] == 18.0
+    _fire(loop, 18.0)
+    later.assert_called_once()
+
+
+def test_late_wakeup_catches_up_on_missed_ticks():
+    wheel, loop = _make_wheel()
+    fired: list[str] = []
+    wheel.call_later(1.0, fired.append, "a")
+    wheel.call_later(3.0, fired.append, "b")
+
+    # Loop stalled past both deadlines
+    _fire(loop, 4.2)
+    assert fired == ["a", "b"]
+
+
+def test_callback_can_reschedule_itself():
+    wheel, loop = _make_wheel()
+    fired: list[float] = []
+
+    def periodic() -> None:
+        fired.append(loop.time())
+        wheel.call_later(2.0, periodic)
+
+    wheel.call_later(2.0, periodic)
+    _fire(loop, 2.0)
+    _fire(loop, 4.0)
+
+    assert fired == [2.0, 4.0]
+    assert len(wheel) == 1
+    assert loop.call_at.call_args[0][0] == 6.0
+
+
+def test_callback_error_does_not_stop_other_timers():
+    wheel, loop = _make_wheel()
+    after = MagicMock()
+    wheel.call_later(1.0, MagicMock(side_effect=RuntimeError))
+    wheel.call_later(1.0, after)
+
+    _fire(loop, 1.0)
+    after.assert_called_once()
+
+
+def test_stop_drops_everything():
+    wheel, loop = _make_wheel()
+    timer = wheel.call_later(1.0, MagicMock())
+
+    wheel.stop()
+
+    assert len(wheel) == 0
+    assert timer.active is False
+    loop.call_at.return_value.cancel.assert_called_once()
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Coroutine, Iterable
+import json
 from pathlib import Path
 import sys
-import time
 from types import TracebackType
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -15,15 +15,26 @@ import pytest
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from custom_components.ecostream.const import (
+    WS_HEARTBEAT_INTERVAL,
     WS_STALE_TIMEOUT,
 )
-from custom_components.ecostream.websocket_api import EcostreamWebsocket
+from custom_components.ecostream.hub import DATA_HUB
+from custom_components.ecostream.metrics import EcostreamMetrics
+from custom_components.ecostream.rate_limit import EcostreamTokenBucket
+from custom_components.ecostream.websocket_api import (
+    EcostreamWebsocket,
+    WritePriority,
+)
 
 pytestmark = pytest.mark.timeout(30)
 
 
+_NOW = 1000.0
+
+
 def _make_ws(host: str = "192.168.1.1"):
     hass = MagicMock()
+    hass.loop.time.return_value = _NOW
     hass.loop.create_task = MagicMock(return_value=MagicMock())
     callback = AsyncMock()
     with patch(
@@ -36,6 +47,19 @@ def _make_ws(host: str = "192.168.1.1"):
     return ws, hass, callback
 
 
+def _connect(ws: EcostreamWebsocket, mock_ws: AsyncMock) -> None:
+    """Attach ``mock_ws`` and start the writer as ``_run`` does."""
+    ws._ws = mock_ws
+    ws._writer = asyncio.create_task(ws._async_writer(mock_ws))
+
+
+def _sent(mock_ws: AsyncMock) -> list[Any]:
+    """Frames written to ``mock_ws``, decoded."""
+    return [
+        json.loads(c.args[0]) for c in mock_ws.send_str.call_args_list
+    ]
+
+
 def _get_create_task_mock(hass: MagicMock) -> MagicMock:
     return cast(MagicMock, hass.loop.create_task)
 
@@ -58,20 +82,29 @@ def _make_aiohttp_ws(
             stop_ws._stopping = True
         return False
 
-    mock_ws.__aexit__ = fake_aexit
+    mock_ws.__aexit__ = AsyncMock(side_effect=fake_aexit)
     mock_ws.closed = False
     mock_ws.exception = MagicMock(return_value=None)
 
     msg_queue: list[MagicMock] = list(messages or [])
+    closed = asyncio.Event()
+
+    async def fake_close() -> None:
+        closed.set()
 
     async def fake_receive() -> MagicMock | None:
+        # Like a real socket, let other tasks (the writer) run
+        await asyncio.sleep(0)
         if msg_queue:
             msg: MagicMock = msg_queue.pop(0)
             if not msg_queue and stop_ws is not None:
                 stop_ws._stopping = True
             return msg
-        await asyncio.sleep(9999)
+        # Closing from another task ends a pending receive
+        await closed.wait()
+        return _msg(WSMsgType.CLOSED)
 
+    mock_ws.close = AsyncMock(side_effect=fake_close)
     mock_ws.receive = fake_receive
     return mock_ws
 
@@ -104,6 +137,7 @@ def test_init_default_state():
     ws, _, _ = _make_ws()
     assert ws._task is None
     assert ws._ws is None
+    assert ws._writer is None
     assert ws._stopping is False
     assert ws._has_received_payload is False
     assert ws._stale_logged is False
@@ -226,9 +260,12 @@ async def test_async_disconnect_handles_ws_close_error():
 async def test_send_json_sends_payload():
     ws, _, _ = _make_ws()
     mock_ws = AsyncMock()
-    ws._ws = mock_ws
-    await ws.send_json({"key": "value"})
-    mock_ws.send_json.assert_called_once_with({"key": "value"})
+    _connect(ws, mock_ws)
+    on_sent = MagicMock()
+    assert await ws.send_json({"key": "value"}, on_sent=on_sent) is True
+    mock_ws.send_str.assert_called_once_with('{"key": "value"}')
+    on_sent.assert_called_once_with()
+    await ws._async_stop_writer()
 
 
 @pytest.mark.asyncio
@@ -236,15 +273,288 @@ async def test_send_json_no_ws_does_nothing():
     ws, _, _ = _make_ws()
     ws._ws = None
     await ws.send_json({"key": "value"})
+    assert len(ws._outbound) == 0
+
+
+@pytest.mark.asyncio
+async def test_send_json_queues_config_while_disconnected():
+    ws, _, _ = _make_ws()
+    ws._ws = None
+    on_sent = MagicMock()
+    sent = await ws.send_json(
+        {"config": {"schedule_enabled": False}}, ttl=30, on_sent=on_sent
+    )
+
+    # Only queued: the caller learns it was not written yet
+    assert sent is False
+    on_sent.assert_not_called()
+    command = ws._outbound.pop()
+    assert command is not None
+    assert command.config == {"schedule_enabled": False}
+    assert command.expires_at == _NOW + 30
 
 
 @pytest.mark.asyncio
 async def test_send_json_handles_exception():
     ws, _, _ = _make_ws()
     mock_ws = AsyncMock()
-    mock_ws.send_json = AsyncMock(side_effect=Exception("send failed"))
-    ws._ws = mock_ws
+    mock_ws.send_str = AsyncMock(side_effect=Exception("send failed"))
+    _connect(ws, mock_ws)
     await ws.send_json({"key": "value"})
+    await ws._async_stop_writer()
+
+
+@pytest.mark.asyncio
+async def test_send_json_queues_config_when_send_fails():
+    ws, _, _ = _make_ws()
+    mock_ws = AsyncMock()
+    mock_ws.send_str = AsyncMock(side_effect=OSError("reset"))
+    _connect(ws, mock_ws)
+    on_sent = MagicMock()
+    sent = await ws.send_json(
+        {"config": {"schedule_enabled": True}}, on_sent=on_sent
+    )
+    assert sent is False
+    on_sent.assert_not_called()
+    assert len(ws._outbound) == 1
+    await ws._async_stop_writer()
+
+
+@pytest.mark.asyncio
+async def test_writer_serves_lanes_in_priority_order():
+    ws, _, _ = _make_ws()
+    mock_ws = AsyncMock()
+    # Fill the lanes before the writer runs
+    ws._writer = MagicMock()
+    sends = [
+        asyncio.create_task(
+            ws.send_json({"config": {priority.name: 1}}, None, priority)
+        )
+        for priority in reversed(WritePriority)
+    ]
+    await asyncio.sleep(0)
+    _connect(ws, mock_ws)
+    await asyncio.gather(*sends)
+
+    assert _sent(mock_ws) == [
+        {"config": {"USER": 1}},
+        {"config": {"AUTOMATION": 1}},
+        {"config": {"HOUSEKEEPING": 1}},
+    ]
+    await ws._async_stop_writer()
+
+
+@pytest.mark.asyncio
+async def test_newer_user_write_supersedes_queued_automation_write():
+    ws, _, _ = _make_ws()
+    mock_ws = AsyncMock()
+    ws._writer = MagicMock()
+    automation = asyncio.create_task(
+        ws.send_json(
+            {
+                "config": {
+                    "man_override_set": 100,
+                    "man_override_set_time": 600,
+                }
+            },
+            None,
+            WritePriority.AUTOMATION,
+        )
+    )
+    await asyncio.sleep(0)
+    user = asyncio.create_task(
+        ws.send_json({"config": {"man_override_set": 200}})
+    )
+    await asyncio.sleep(0)
+    _connect(ws, mock_ws)
+    await asyncio.gather(automation, user)
+
+    # The automation's older value is not sent after the user's
+    assert _sent(mock_ws) == [
+        {"config": {"man_override_set": 200}},
+        {"config": {"man_override_set_time": 600}},
+    ]
+    await ws._async_stop_writer()
+
+
+@pytest.mark.asyncio
+async def test_superseded_write_completes_unsent():
+    ws, _, _ = _make_ws()
+    mock_ws = AsyncMock()
+    ws._writer = MagicMock()
+    automation = asyncio.create_task(
+        ws.send_json(
+            {"config": {"schedule_enabled": True}},
+            None,
+            WritePriority.AUTOMATION,
+        )
+    )
+    await asyncio.sleep(0)
+    user = asyncio.create_task(
+        ws.send_json({"config": {"schedule_enabled": False}})
+    )
+    await asyncio.sleep(0)
+    # The automation caller returns without waiting for the writer
+    await automation
+    _connect(ws, mock_ws)
+    await user
+
+    assert _sent(mock_ws) == [{"config": {"schedule_enabled": False}}]
+    await ws._async_stop_writer()
+
+
+@pytest.mark.asyncio
+async def test_writer_delays_and_coalesces_excess_commands():
+    ws, hass, _ = _make_ws()
+    ws._limiter = EcostreamTokenBucket(
+        hass.loop.time,
+        {"command_burst": 1, "command_rate_per_minute": 60},
+    )
+    mock_ws = AsyncMock()
+    ws._writer = MagicMock()
+    sends = [
+        asyncio.create_task(
+            ws.send_json(
+                {
+                    "config": {
+                        "man_override_set": qset,
+                        "man_override_set_time": 600,
+                    }
+                }
+            )
+        )
+        for qset in (100, 150, 200)
+    ]
+    await asyncio.sleep(0)
+
+    real_sleep = asyncio.sleep
+    delays: list[float] = []
+
+    async def advance(delay: float) -> None:
+        delays.append(delay)
+        hass.loop.time.return_value += delay
+        await real_sleep(0)
+
+    with patch(
+        "custom_components.ecostream.websocket_api.asyncio.sleep",
+        side_effect=advance,
+    ):
+        _connect(ws, mock_ws)
+        await asyncio.gather(*sends)
+
+    assert [
+        payload["config"]["man_override_set"]
+        for payload in _sent(mock_ws)
+    ] == [100, 200]
+    assert delays == [1.0]
+    assert ws._limiter.throttled == 1
+    assert ws._limiter.coalesced == 2
+    await ws._async_stop_writer()
+
+
+@pytest.mark.asyncio
+async def test_writer_coalesces_by_recency_across_lanes():
+    ws, hass, _ = _make_ws()
+    ws._limiter = EcostreamTokenBucket(
+        hass.loop.time,
+        {"command_burst": 1, "command_rate_per_minute": 60},
+    )
+    mock_ws = AsyncMock()
+    _connect(ws, mock_ws)
+    # Uses the only token; the rest wait for the limiter
+    await ws.send_json({"config": {"man_override_set": 100}})
+    submitted = [
+        (
+            {"man_override_set": 150, "man_override_set_time": 600},
+            WritePriority.AUTOMATION,
+        ),
+        ({"man_override_set_time": 900}, WritePriority.USER),
+        ({"man_override_set": 200}, WritePriority.AUTOMATION),
+    ]
+
+    real_sleep = asyncio.sleep
+
+    async def advance(delay: float) -> None:
+        hass.loop.time.return_value += delay
+        await real_sleep(0)
+
+    with patch(
+        "custom_components.ecostream.websocket_api.asyncio.sleep",
+        side_effect=advance,
+    ):
+        sends = [
+            asyncio.create_task(
+                ws.send_json({"config": config}, None, priority)
+            )
+            for config, priority in submitted
+        ]
+        await asyncio.gather(*sends)
+
+    # Each key goes out once, with the value submitted last, whichever
+    # lane it came through
+    assert _sent(mock_ws) == [
+        {"config": {"man_override_set": 100}},
+        {"config": {"man_override_set_time": 900}},
+        {"config": {"man_override_set": 200}},
+    ]
+    assert ws._limiter.coalesced == 2
+    await ws._async_stop_writer()
+
+
+@pytest.mark.asyncio
+async def test_send_json_stops_waiting_for_throttled_write():
+    ws, hass, _ = _make_ws()
+    ws._limiter = EcostreamTokenBucket(
+        hass.loop.time,
+        {"command_burst": 1, "command_rate_per_minute": 1},
+    )
+    mock_ws = AsyncMock()
+    _connect(ws, mock_ws)
+    on_sent = MagicMock()
+
+    with patch(
+        "custom_components.ecostream.websocket_api.WS_SEND_TIMEOUT",
+        0.01,
+    ):
+        await ws.send_json({"config": {"schedule_enabled": False}})
+        sent = await ws.send_json(
+            {"config": {"man_override_set_time": 600}}, on_sent=on_sent
+        )
+
+    # The caller returned; the throttled command is still queued
+    assert sent is False
+    assert _sent(mock_ws) == [{"config": {"schedule_enabled": False}}]
+    await ws._async_stop_writer()
+    command = ws._outbound.pop()
+    assert command is not None
+    # Handed to the replay with its callback, not run yet
+    assert command.on_sent is on_sent
+    on_sent.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stop_writer_queues_unsent_config():
+    ws, _, _ = _make_ws()
+    mock_ws = AsyncMock()
+
+    async def hang(_text: str) -> None:
+        await asyncio.sleep(9999)
+
+    mock_ws.send_str = AsyncMock(side_effect=hang)
+    _connect(ws, mock_ws)
+    sends: list[asyncio.Task[Any]] = [
+        asyncio.create_task(ws.send_json({"config": {"a": 1}})),
+        asyncio.create_task(ws.send_json({"config": {"b": 2}})),
+        asyncio.create_task(ws.async_send_heartbeat()),
+    ]
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    await ws._async_stop_writer()
+    await asyncio.gather(*sends)
+
+    assert ws._writer is None
+    assert ws._outbound.as_dict()["depth"] == 2
 
 
 # ---------------------------------------------------------------------------
@@ -281,7 +591,7 @@ async def test_handle_text_callback_exception_handled():
 
 
 # ---------------------------------------------------------------------------
-# _send_heartbeat
+# async_send_heartbeat / heartbeat_due
 # ---------------------------------------------------------------------------
 
 
@@ -289,26 +599,76 @@ async def test_handle_text_callback_exception_handled():
 async def test_send_heartbeat_sends_empty_json():
     ws, _, _ = _make_ws()
     mock_ws = AsyncMock()
-    ws._ws = mock_ws
-    await ws._send_heartbeat()
+    _connect(ws, mock_ws)
+    await ws.async_send_heartbeat()
     mock_ws.send_str.assert_called_once_with("{}")
+    await ws._async_stop_writer()
 
 
 @pytest.mark.asyncio
 async def test_send_heartbeat_skipped_when_stopping():
     ws, _, _ = _make_ws()
     mock_ws = AsyncMock()
-    ws._ws = mock_ws
+    _connect(ws, mock_ws)
     ws._stopping = True
-    await ws._send_heartbeat()
+    await ws.async_send_heartbeat()
     mock_ws.send_str.assert_not_called()
+    await ws._async_stop_writer()
 
 
 @pytest.mark.asyncio
 async def test_send_heartbeat_skipped_when_no_ws():
     ws, _, _ = _make_ws()
     ws._ws = None
-    await ws._send_heartbeat()
+    await ws.async_send_heartbeat()
+
+
+@pytest.mark.asyncio
+async def test_send_heartbeat_skipped_after_real_traffic():
+    ws, hass, _ = _make_ws()
+    mock_ws = AsyncMock()
+    _connect(ws, mock_ws)
+    await ws.send_json({"config": {"schedule_enabled": True}})
+
+    hass.loop.time.return_value = _NOW + WS_HEARTBEAT_INTERVAL - 1
+    await ws.async_send_heartbeat()
+
+    assert _sent(mock_ws) == [{"config": {"schedule_enabled": True}}]
+    await ws._async_stop_writer()
+
+
+def test_heartbeat_due_after_silence():
+    ws, _, _ = _make_ws()
+    ws._writer = MagicMock()
+    ws._last_message_ts = 1000.0
+    assert ws.heartbeat_due(1000.0 + WS_HEARTBEAT_INTERVAL - 1) is False
+    assert ws.heartbeat_due(1000.0 + WS_HEARTBEAT_INTERVAL) is True
+
+
+def test_heartbeat_not_due_after_write():
+    ws, _, _ = _make_ws()
+    ws._writer = MagicMock()
+    ws._last_message_ts = 1000.0
+    ws._last_write_ts = 1005.0
+    assert ws.heartbeat_due(1000.0 + WS_HEARTBEAT_INTERVAL) is False
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_resets_silence_window():
+    ws, hass, _ = _make_ws()
+    _connect(ws, AsyncMock())
+    ws._last_message_ts = 1000.0
+    hass.loop.time.return_value = 1010.0
+    await ws.async_send_heartbeat()
+    assert ws.heartbeat_due(1015.0) is False
+    assert ws.heartbeat_due(1020.0) is True
+    await ws._async_stop_writer()
+
+
+def test_heartbeat_not_due_without_connection():
+    ws, _, _ = _make_ws()
+    ws._ws = None
+    assert ws.heartbeat_due(_NOW + 9999) is False
 
 
 @pytest.mark.asyncio
@@ -318,12 +678,13 @@ async def test_send_heartbeat_handles_exception():
     mock_ws.send_str = AsyncMock(
         side_effect=Exception("heartbeat failed")
     )
-    ws._ws = mock_ws
-    await ws._send_heartbeat()
+    _connect(ws, mock_ws)
+    await ws.async_send_heartbeat()
+    await ws._async_stop_writer()
 
 
 # ---------------------------------------------------------------------------
-# _check_stale
+# check_stale
 # ---------------------------------------------------------------------------
 
 
@@ -332,8 +693,8 @@ def test_check_stale_skipped_when_stopping():
     ws._stopping = True
     ws._has_received_payload = True
     ws._ws = MagicMock()
-    ws._last_message_ts = time.time() - 9999
-    ws._check_stale()
+    ws._last_message_ts = _NOW - 9999
+    ws.check_stale()
     _get_create_task_mock(hass).assert_not_called()
 
 
@@ -341,8 +702,8 @@ def test_check_stale_skipped_before_first_payload():
     ws, hass, _ = _make_ws()
     ws._has_received_payload = False
     ws._ws = MagicMock()
-    ws._last_message_ts = time.time() - 9999
-    ws._check_stale()
+    ws._last_message_ts = _NOW - 9999
+    ws.check_stale()
     _get_create_task_mock(hass).assert_not_called()
 
 
@@ -350,8 +711,8 @@ def test_check_stale_skipped_when_no_ws():
     ws, _, _ = _make_ws()
     ws._has_received_payload = True
     ws._ws = None
-    ws._last_message_ts = time.time() - 9999
-    ws._check_stale()
+    ws._last_message_ts = _NOW - 9999
+    ws.check_stale()
 
 
 def test_check_stale_skipped_when_fresh():
@@ -359,8 +720,8 @@ def test_check_stale_skipped_when_fresh():
     ws._has_received_payload = True
     ws._ws = MagicMock()
     ws._ws.closed = False
-    ws._last_message_ts = time.time()
-    ws._check_stale()
+    ws._last_message_ts = _NOW
+    ws.check_stale()
     _get_create_task_mock(hass).assert_not_called()
 
 
@@ -370,8 +731,8 @@ def test_check_stale_triggers_reconnect_when_stale():
     mock_ws = MagicMock()
     mock_ws.closed = False
     ws._ws = mock_ws
-    ws._last_message_ts = time.time() - WS_STALE_TIMEOUT - 1
-    ws._check_stale()
+    ws._last_message_ts = _NOW - WS_STALE_TIMEOUT - 1
+    ws.check_stale()
     _get_create_task_mock(hass).assert_called()
     assert ws._stale_logged is True
 
@@ -382,9 +743,9 @@ def test_check_stale_does_not_log_twice():
     mock_ws = MagicMock()
     mock_ws.closed = False
     ws._ws = mock_ws
-    ws._last_message_ts = time.time() - WS_STALE_TIMEOUT - 1
+    ws._last_message_ts = _NOW - WS_STALE_TIMEOUT - 1
     ws._stale_logged = True
-    ws._check_stale()
+    ws.check_stale()
     _get_create_task_mock(hass).assert_called()
 
 
@@ -394,8 +755,8 @@ def test_check_stale_skipped_when_ws_already_closed():
     mock_ws = MagicMock()
     mock_ws.closed = True
     ws._ws = mock_ws
-    ws._last_message_ts = time.time() - WS_STALE_TIMEOUT - 1
-    ws._check_stale()
+    ws._last_message_ts = _NOW - WS_STALE_TIMEOUT - 1
+    ws.check_stale()
     _get_create_task_mock(hass).assert_not_called()
 
 
@@ -422,6 +783,183 @@ async def test_run_processes_text_message():
     callback.assert_called_once_with({"status": {"qset": 100}})
 
 
+@pytest.mark.asyncio
+async def test_run_records_telemetry():
+    ws, _, _ = _make_ws()
+
+    aio_ws = _make_aiohttp_ws(
+        [
+            _msg(WSMsgType.TEXT, '{"status": {"qset": 100}}'),
+            _msg(WSMsgType.TEXT, "not json"),
+            _msg(WSMsgType.CLOSE),
+            # Stops the test loop without being processed
+            _msg(WSMsgType.CLOSE),
+        ],
+        stop_ws=ws,
+    )
+    ws._session.ws_connect = MagicMock(return_value=aio_ws)
+
+    await ws._run()
+
+    telemetry = ws.telemetry.as_dict()
+    assert telemetry["state"] == "stopped"
+    assert telemetry["connects"] == 1
+    assert telemetry["disconnects"] == 1
+    assert telemetry["disconnect_reasons"]["closed"] == 1
+    assert telemetry["frames_in"] == 2
+    assert telemetry["bytes_in"] == len('{"status": {"qset": 100}}') + 8
+    assert telemetry["decode_errors"] == 1
+    assert ws.telemetry.last_frame == "not json"
+
+
+@pytest.mark.asyncio
+async def test_run_records_stale_close_reason():
+    ws, _, _ = _make_ws()
+    aio_ws = _make_aiohttp_ws(
+        [_msg(WSMsgType.CLOSED), _msg(WSMsgType.CLOSED)], stop_ws=ws
+    )
+    aio_ws.closed = False
+    ws._session.ws_connect = MagicMock(return_value=aio_ws)
+
+    async def close_stale(*_args: Any) -> None:
+        ws._has_received_payload = True
+        ws._last_message_ts = _NOW - WS_STALE_TIMEOUT - 1
+        ws.check_stale()
+
+    with patch.object(ws, "_replay_outbound", side_effect=close_stale):
+        await ws._run()
+
+    assert ws.telemetry.reasons["stale"] == 1
+    assert ws.telemetry.last_disconnect_reason == "stale"
+
+
+@pytest.mark.asyncio
+async def test_run_replays_queue_on_connect():
+    ws, _, callback = _make_ws()
+    on_sent = MagicMock()
+    await ws.send_json({"config": {"schedule_enabled": False}})
+    await ws.send_json(
+        {"config": {"man_override_set_time": 600}}, on_sent=on_sent
+    )
+
+    aio_ws = _make_aiohttp_ws(
+        [
+            _msg(WSMsgType.TEXT, '{"status": {"qset": 100}}'),
+            _msg(WSMsgType.CLOSE),
+        ],
+        stop_ws=ws,
+    )
+    ws._session.ws_connect = MagicMock(return_value=aio_ws)
+
+    await ws._run()
+
+    assert _sent(aio_ws) == [
+        {"config": {"schedule_enabled": False}},
+        {"config": {"man_override_set_time": 600}},
+    ]
+    callback.assert_called_once_with({"status": {"qset": 100}})
+    assert len(ws._outbound) == 0
+    # Runs once the queued command is replayed
+    on_sent.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_run_reads_while_throttled_replay_waits():
+    ws, hass, callback = _make_ws()
+    ws._limiter = EcostreamTokenBucket(
+        hass.loop.time,
+        {"command_burst": 1, "command_rate_per_minute": 1},
+    )
+    await ws.send_json({"config": {"schedule_enabled": False}})
+    await ws.send_json({"config": {"man_override_set_time": 600}})
+
+    aio_ws = _make_aiohttp_ws(
+        [
+            _msg(WSMsgType.TEXT, '{"status": {"qset": 100}}'),
+            _msg(WSMsgType.TEXT, '{"status": {"qset": 110}}'),
+            _msg(WSMsgType.CLOSE),
+        ],
+        stop_ws=ws,
+    )
+    ws._session.ws_connect = MagicMock(return_value=aio_ws)
+
+    await ws._run()
+
+    # Frames were handled while the second command waited a minute
+    assert callback.call_count == 2
+    assert _sent(aio_ws) == [{"config": {"schedule_enabled": False}}]
+    assert len(ws._outbound) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_keeps_queue_when_replay_fails():
+    ws, _, _ = _make_ws()
+    await ws.send_json({"config": {"schedule_enabled": False}})
+
+    aio_ws = _make_aiohttp_ws(stop_ws=ws)
+
+    def drop_link(_text: str) -> None:
+        ws._stopping = True
+        raise OSError("reset")
+
+    aio_ws.send_str.side_effect = drop_link
+    ws._session.ws_connect = MagicMock(return_value=aio_ws)
+
+    await ws._run()
+
+    assert len(ws._outbound) == 1
+    assert ws._writer is None
+
+
+@pytest.mark.asyncio
+async def test_run_passes_raw_text_to_frame_recorder():
+    ws, _, callback = _make_ws()
+    recorder = MagicMock()
+    ws._frame_recorder = recorder
+
+    aio_ws = _make_aiohttp_ws(
+        [
+            _msg(WSMsgType.TEXT, "not json"),
+            _msg(WSMsgType.TEXT, '{"status": {"qset": 100}}'),
+            _msg(WSMsgType.CLOSE),
+        ],
+        stop_ws=ws,
+    )
+    ws._session.ws_connect = MagicMock(return_value=aio_ws)
+
+    await ws._run()
+
+    assert [c.args[0] for c in recorder.call_args_list] == [
+        "not json",
+        '{"status": {"qset": 100}}',
+    ]
+    callback.assert_called_once_with({"status": {"qset": 100}})
+
+
+@pytest.mark.asyncio
+async def test_run_records_pipeline_latency():
+    ws, _, _ = _make_ws()
+    metrics = EcostreamMetrics()
+    ws._metrics = metrics
+
+    aio_ws = _make_aiohttp_ws(
+        [
+            _msg(WSMsgType.TEXT, '{"status": {"qset": 100}}'),
+            _msg(WSMsgType.CLOSE),
+        ],
+        stop_ws=ws,
+    )
+    ws._session.ws_connect = MagicMock(return_value=aio_ws)
+
+    await ws._run()
+
+    assert metrics.receive.count == 1
+    assert metrics.decode.count == 1
+    assert metrics.process.count == 1
+    # Loop lag is probed via call_soon on the HA loop
+    cast(MagicMock, ws._hass.loop.call_soon).assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_run_ignores_binary_message():
     ws, _, callback = _make_ws()
@@ -547,6 +1085,54 @@ async def test_run_handles_client_error_and_stops():
         await ws._run()
 
 
+def _mock_dns(hass: MagicMock, address: str) -> AsyncMock:
+    """Make the hub's resolver answer ``address``."""
+    hub = MagicMock()
+    hub.dns_resolver.resolve = AsyncMock(
+        return_value=[{"hostname": "ecostream.local", "host": address}]
+    )
+    hass.data = {DATA_HUB: hub}
+    return hub.dns_resolver.resolve
+
+
+@pytest.mark.asyncio
+async def test_run_connects_to_resolved_address():
+    ws, hass, _ = _make_ws("ecostream.local")
+    _mock_dns(hass, "192.168.1.7")
+    aio_ws = _make_aiohttp_ws([_msg(WSMsgType.CLOSE)], stop_ws=ws)
+    ws._session.ws_connect = MagicMock(return_value=aio_ws)
+
+    await ws._run()
+
+    assert ws._session.ws_connect.call_args.args[0] == (
+        "ws://192.168.1.7/"
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_connect_error_invalidates_resolved_address():
+    ws, hass, _ = _make_ws("ecostream.local")
+    dns = _mock_dns(hass, "192.168.1.7")
+    urls: list[str] = []
+
+    def fake_connect(url: str, **_kwargs: object):
+        _ = _kwargs
+        urls.append(url)
+        if len(urls) == 2:
+            ws._stopping = True
+        raise ClientError("connection refused")
+
+    ws._session.ws_connect = MagicMock(side_effect=fake_connect)
+
+    with patch("asyncio.sleep", new=AsyncMock()):
+        await ws._run()
+
+    assert urls == ["ws://192.168.1.7/", "ws://192.168.1.7/"]
+    # Looked up again after the failed connect instead of reusing it
+    assert dns.await_count == 2
+    assert ws._resolver.invalidations == 2
+
+
 @pytest.mark.asyncio
 async def test_run_handles_unexpected_exception_and_stops():
     ws, _, _ = _make_ws()
@@ -586,32 +1172,6 @@ async def test_run_resets_has_received_payload_on_reconnect():
     await ws._run()
 
 
-@pytest.mark.asyncio
-async def test_run_timeout_sends_heartbeat_and_checks_stale():
-    ws, _, _ = _make_ws()
-
-    aio_ws = _make_aiohttp_ws([], stop_ws=ws)
-    ws._session.ws_connect = MagicMock(return_value=aio_ws)
-
-    def stop_on_check_stale():
-        ws._stopping = True
-
-    with patch(
-        "custom_components.ecostream.websocket_api.asyncio.wait",
-        new=AsyncMock(return_value=(set(), set())),
-    ):
-        with patch.object(
-            ws, "_send_heartbeat", new=AsyncMock()
-        ) as heartbeat:
-            with patch.object(
-                ws, "_check_stale", side_effect=stop_on_check_stale
-            ) as check_stale:
-                await ws._run()
-
-    heartbeat.assert_called_once()
-    check_stale.assert_called()
-
-
 @pytest.mark.asyncio
 async def test_run_client_error_creates_issue_once():
     ws, _, _ = _make_ws()